@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Literal, Optional
 from functools import lru_cache
 
 
@@ -21,6 +21,52 @@ class Settings(BaseSettings):
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_db_name: str = "hootsuite_clone"
     
+    # MongoDB connection pool (per worker process)
+    mongodb_min_pool_size: int = 0
+    mongodb_max_pool_size: int = 100
+    mongodb_max_idle_time_ms: Optional[int] = None  # Close pooled connections idle this long
+    mongodb_wait_queue_timeout_ms: Optional[int] = None  # Fail when no connection frees up in time
+    mongodb_connect_timeout_ms: int = 20000
+    mongodb_server_selection_timeout_ms: int = 30000
+    mongodb_socket_timeout_ms: Optional[int] = None
+    mongodb_compressors: str = "zstd,zlib"  # Wire compression in preference order: zstd, snappy, zlib
+    
+    # Read routing for analytics (stats, post listing and search, exports)
+    mongodb_analytics_read_preference: Literal[
+        "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+    ] = "secondaryPreferred"
+    mongodb_analytics_max_staleness_seconds: int = 90  # -1 for no bound; MongoDB requires at least 90
+    
+    # Upstream HTTP (platform and OAuth provider APIs), one shared pool per worker
+    upstream_timeout_seconds: float = 30.0
+    upstream_max_connections: int = 100
+    upstream_max_keepalive_connections: int = 20
+    upstream_keepalive_expiry_seconds: float = 30.0
+    
+    # Connected account cache for the publish path (per worker)
+    account_cache_ttl_seconds: float = 30.0  # Bounds staleness of changes made on other workers
+    account_cache_max_users: int = 10_000
+    
+    # Metrics (Prometheus text format at /metrics)
+    metrics_enabled: bool = True
+    metrics_token: str = ""  # If set, scrapers must send "Authorization: Bearer <token>"
+    event_loop_lag_interval_seconds: float = 0.5
+    
+    # Tracing (OpenTelemetry spans, sampled and written locally as JSON lines)
+    tracing_enabled: bool = False
+    tracing_sample_ratio: float = 0.1  # Share of root traces kept
+    tracing_exporter: Literal["stdout", "file"] = "stdout"
+    tracing_file_path: str = "traces.jsonl"
+    
+    # Sampling profiler (admin-only, per worker)
+    profiler_output_dir: str = "profiles"
+    profiler_max_seconds: int = 300
+    
+    # Health checks and startup warm-up
+    health_check_timeout_seconds: float = 2.0  # Per dependency check in /health/ready
+    mongodb_warmup_connections: int = 10  # Connections opened per server before reporting ready
+    shutdown_drain_seconds: float = 5.0  # Readiness fails for this long after SIGTERM before the server stops
+    
     # Google OAuth
     google_client_id: Optional[str] = None
     google_client_secret: Optional[str] = None
@@ -46,6 +92,55 @@ class Settings(BaseSettings):
     youtube_client_id: Optional[str] = None
     youtube_client_secret: Optional[str] = None
     
+    # Auth rate limiting (backend: "memory" per worker, or "mongo" shared across workers)
+    auth_rate_limit_backend: str = "memory"
+    auth_rate_limit_window_seconds: int = 300
+    login_rate_limit_per_ip: int = 30
+    login_rate_limit_per_email: int = 10
+    register_rate_limit_per_ip: int = 10
+    trust_forwarded_for: bool = False  # Use X-Forwarded-For when behind a proxy
+    
+    # Password hashing admission control
+    auth_max_concurrent_hashes: int = 4
+    auth_max_queued_hashes: int = 16
+    
+    # Publish status push (backend: "mongo" fans out across workers, "memory" is single-worker)
+    publish_events_backend: str = "mongo"
+    publish_events_capped_size_bytes: int = 16 * 1024 * 1024
+    websocket_heartbeat_seconds: int = 30
+    
+    # Exports
+    export_batch_size: int = 500  # Documents per cursor batch when streaming exports
+    
+    # Bulk import
+    import_batch_size: int = 1000  # Posts per insert_many
+    import_max_errors: int = 1000  # Row errors returned in the report
+    import_max_row_bytes: int = 1024 * 1024
+    
+    # Post deletion
+    deleted_post_retention_hours: int = 72  # Soft-deleted posts are purged after this
+    post_purge_interval_seconds: int = 3600
+    orphan_cleanup_interval_seconds: int = 24 * 3600
+    
+    # Publish execution
+    publish_lease_seconds: int = 120  # Renewed as a publish progresses; expired claims are taken over
+    publish_max_attempts: int = 3  # Claims per result before an interrupted publish is marked failed
+    publish_resume_interval_seconds: int = 60  # How often stalled publishes are resumed
+    
+    # Publish result retention
+    result_archive_after_days: int = 90  # Terminal results older than this move to the archive
+    result_archive_interval_seconds: int = 24 * 3600
+    
+    # Background jobs
+    scheduler_enabled: bool = True
+    scheduler_lease_backend: Literal["mongo", "local"] = "mongo"  # "mongo" runs each job on one worker at a time
+    scheduler_lease_seconds: int = 300  # Renewed while a job runs; a crashed worker's lease expires after this
+    scheduler_poll_seconds: int = 60  # How often idle workers check for due jobs
+    stats_reconcile_interval_seconds: int = 3600
+    engagement_ingest_interval_seconds: int = 900
+    engagement_lookback_days: int = 30  # Only sample posts published this recently
+    best_times_rebuild_hours: int = 24  # Refresh engagement in best-time profiles this often
+    
     @property
     def oauth_redirect_base(self) -> str:
         return f"{self.frontend_url.rstrip('/')}"
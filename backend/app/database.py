@@ -1,32 +1,106 @@
-from motor.motor_asyncio import AsyncIOMotorClient
-from beanie import init_beanie
-from typing import Optional
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from beanie import Document, init_beanie
+from pymongo.read_preferences import (
+    Nearest,
+    PrimaryPreferred,
+    ReadPreference,
+    Secondary,
+    SecondaryPreferred,
+)
+from typing import Optional, Type
 
 from app.config import get_settings
 from app.models.user import User
 from app.models.account import ConnectedAccount
 from app.models.post import Post, PublishResult
+from app.models.archive import PublishResultArchive
+from app.models.rate_limit import RateLimitHit
+from app.models.stats import UserStats, PublishRollup, BestTimeProfile
+from app.models.engagement import EngagementSample
+from app.models.job_lease import JobLease
+from app.utils.metrics import mongo_command_metrics
+from app.utils.tracing import mongo_command_tracer
 
 settings = get_settings()
 
 # Global database client
 _client: Optional[AsyncIOMotorClient] = None
 
+# Modes that accept a maxStalenessSeconds bound
+STALENESS_READ_PREFERENCES = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+# All Beanie document models registered with the database
+DOCUMENT_MODELS = [
+    User,
+    ConnectedAccount,
+    Post,
+    PublishResult,
+    PublishResultArchive,
+    RateLimitHit,
+    UserStats,
+    PublishRollup,
+    BestTimeProfile,
+    EngagementSample,
+    JobLease,
+]
+
+
+def create_client() -> AsyncIOMotorClient:
+    """Create a Motor client with the configured pool, timeout and compression settings."""
+    options = {
+        "minPoolSize": settings.mongodb_min_pool_size,
+        "maxPoolSize": settings.mongodb_max_pool_size,
+        "maxIdleTimeMS": settings.mongodb_max_idle_time_ms,
+        "waitQueueTimeoutMS": settings.mongodb_wait_queue_timeout_ms,
+        "connectTimeoutMS": settings.mongodb_connect_timeout_ms,
+        "serverSelectionTimeoutMS": settings.mongodb_server_selection_timeout_ms,
+        "socketTimeoutMS": settings.mongodb_socket_timeout_ms,
+    }
+    if settings.mongodb_compressors:
+        options["compressors"] = settings.mongodb_compressors
+    listeners = []
+    if settings.metrics_enabled:
+        listeners.append(mongo_command_metrics)
+    if settings.tracing_enabled:
+        listeners.append(mongo_command_tracer)
+    if listeners:
+        options["event_listeners"] = listeners
+    
+    return AsyncIOMotorClient(settings.mongodb_url, **options)
+
+
+def analytics_read_preference():
+    """Read preference for analytics queries, bounded by the configured staleness."""
+    mode = settings.mongodb_analytics_read_preference
+    if mode == "primary":
+        return ReadPreference.PRIMARY
+    return STALENESS_READ_PREFERENCES[mode](max_staleness=settings.mongodb_analytics_max_staleness_seconds)
+
+
+def analytics_collection(model: Type[Document]) -> AsyncIOMotorCollection:
+    """Get a model's collection with analytics read routing.
+    
+    Reads through it may be served by a secondary up to the staleness
+    bound, keeping list, stats and export traffic off the primary. Use
+    the model's own collection for writes and read-your-writes paths.
+    """
+    return model.get_motor_collection().with_options(read_preference=analytics_read_preference())
+
 
 async def init_db():
     """Initialize MongoDB connection and Beanie ODM."""
     global _client
     
-    _client = AsyncIOMotorClient(settings.mongodb_url)
+    _client = create_client()
     
     await init_beanie(
         database=_client[settings.mongodb_db_name],
-        document_models=[
-            User,
-            ConnectedAccount,
-            Post,
-            PublishResult,
-        ]
+        document_models=DOCUMENT_MODELS,
     )
 
 
@@ -37,6 +111,11 @@ async def close_db():
         _client.close()
 
 
+def get_client() -> Optional[AsyncIOMotorClient]:
+    """Get the global client, or None before init_db has run."""
+    return _client
+
+
 def get_database():
     """Get database instance for dependency injection."""
     return _client[settings.mongodb_db_name]
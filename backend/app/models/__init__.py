@@ -1,5 +1,22 @@
 from app.models.user import User
 from app.models.account import ConnectedAccount
 from app.models.post import Post, PublishResult
+from app.models.archive import PublishResultArchive
+from app.models.rate_limit import RateLimitHit
+from app.models.stats import UserStats, PublishRollup, BestTimeProfile
+from app.models.engagement import EngagementSample
+from app.models.job_lease import JobLease
 
-__all__ = ["User", "ConnectedAccount", "Post", "PublishResult"]
+__all__ = [
+    "User",
+    "ConnectedAccount",
+    "Post",
+    "PublishResult",
+    "PublishResultArchive",
+    "RateLimitHit",
+    "UserStats",
+    "PublishRollup",
+    "BestTimeProfile",
+    "EngagementSample",
+    "JobLease",
+]
@@ -1,10 +1,17 @@
 from datetime import datetime
 from typing import Optional
-from beanie import Document, Link
+from beanie import Document, Link, PydanticObjectId
 from pydantic import Field
+from pymongo import IndexModel
 
 from app.models.user import User
 
+# Fields read by the list endpoint; tokens are never loaded
+ACCOUNT_RESPONSE_PROJECTION = {
+    "platform_id": 1, "platform_name": 1, "username": 1, "display_name": 1,
+    "avatar": 1, "connected_at": 1, "is_active": 1,
+}
+
 
 class ConnectedAccount(Document):
     """Social media account connected by a user."""
@@ -33,13 +40,19 @@ class ConnectedAccount(Document):
     last_used_at: Optional[datetime] = None
     
     class Settings:
-        name = "connected_accounts"
+        name = "connected_accounts"  # Shard key: {user_id: 1}
+        use_state_management = True  # save_changes() sends only modified fields
         indexes = [
-            "user_id",
-            "platform_id",
-            [("user_id", 1), ("platform_id", 1)],
+            IndexModel([("user_id", 1), ("platform_id", 1)], unique=True),  # One account per platform
         ]
     
+    @classmethod
+    async def get_for_user(cls, account_id: str, user_id: str) -> Optional["ConnectedAccount"]:
+        """Get one of a user's accounts by ID; filtering on user_id targets the user's shard."""
+        if not PydanticObjectId.is_valid(account_id):
+            return None
+        return await cls.find_one({"_id": PydanticObjectId(account_id), "user_id": user_id})
+    
     def to_response(self) -> dict:
         """Convert to API response format (without sensitive tokens)."""
         return {
@@ -52,3 +65,17 @@ class ConnectedAccount(Document):
             "connectedAt": self.connected_at.isoformat(),
             "isActive": self.is_active,
         }
+    
+    @staticmethod
+    def response_from_raw(doc: dict) -> dict:
+        """Convert a raw document projected with ACCOUNT_RESPONSE_PROJECTION, skipping model validation."""
+        return {
+            "id": str(doc["_id"]),
+            "platformId": doc["platform_id"],
+            "platformName": doc["platform_name"],
+            "username": doc["username"],
+            "displayName": doc["display_name"],
+            "avatar": doc.get("avatar"),
+            "connectedAt": doc["connected_at"].isoformat(),
+            "isActive": doc.get("is_active", True),
+        }
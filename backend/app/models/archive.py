@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.post import PublishStatus
+
+
+class ArchivedResult(BaseModel):
+    """A terminal publish result inside an archive bucket, stored with short keys.
+
+    Fields that are None are omitted from the stored row.
+    """
+    model_config = ConfigDict(populate_by_name=True)
+
+    result_id: PydanticObjectId = Field(alias="_id")  # Original PublishResult _id
+    post_id: PydanticObjectId = Field(alias="i")
+    status: PublishStatus = Field(alias="s")
+    timestamp: datetime = Field(alias="t")  # published_at if published, else the last update
+    created_at: datetime = Field(alias="c")
+    progress: int = Field(default=0, alias="g")
+    post_url: Optional[str] = Field(default=None, alias="l")
+    platform_post_id: Optional[str] = Field(default=None, alias="x")
+    error: Optional[str] = Field(default=None, alias="e")
+
+
+class PublishResultArchive(Document):
+    """Bucket of archived publish results for one user, platform and day.
+
+    Results past the retention age are moved here from publish_results so
+    the hot collection and its indexes stay small. status_counts mirrors
+    the rows so counters can be rebuilt without unwinding them.
+    """
+    model_config = ConfigDict(populate_by_name=True)
+
+    user_id: str = Field(alias="u")  # Reference to User
+    platform_id: str = Field(alias="p")
+    day: datetime = Field(alias="d")  # Start of the UTC day the results finished in
+    row_count: int = Field(alias="n")
+    status_counts: Dict[str, int] = Field(default_factory=dict, alias="c")
+    results: List[ArchivedResult] = Field(default_factory=list, alias="r")
+
+    class Settings:
+        name = "publish_results_archive"  # Shard key: {u: 1}
+        indexes = [
+            [("u", 1), ("p", 1), ("d", 1)],  # Per-user counts and rollup rebuilds
+            [("r.i", 1)],  # Results of a post, cascade deletes
+            [("r._id", 1)],  # Engagement samples refer to results by _id
+        ]
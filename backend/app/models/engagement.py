@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Optional
+from beanie import Document, Granularity, TimeSeriesConfig
+from pydantic import BaseModel, Field
+
+
+class EngagementMeta(BaseModel):
+    """Series identity for an engagement sample (the time-series metaField)."""
+    user_id: str
+    post_id: str
+    result_id: str  # Reference to PublishResult
+    platform_id: str
+
+
+class EngagementSample(Document):
+    """Engagement metrics read back from a platform for a published post.
+
+    Stored in a MongoDB time-series collection, which buckets samples per
+    series and compresses them column-wise. Metrics a platform does not
+    report are left as None.
+    """
+
+    ts: datetime = Field(default_factory=datetime.utcnow)
+    meta: EngagementMeta
+
+    likes: Optional[int] = None
+    shares: Optional[int] = None
+    comments: Optional[int] = None
+    impressions: Optional[int] = None
+
+    class Settings:
+        name = "engagement_samples"  # Shard key: {meta.user_id: 1}
+        timeseries = TimeSeriesConfig(
+            time_field="ts",
+            meta_field="meta",
+            granularity=Granularity.hours,
+            expire_after_seconds=400 * 24 * 3600,
+        )
+        indexes = [
+            [("meta.user_id", 1), ("meta.result_id", 1), ("ts", -1)],
+        ]
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+from beanie import Document
+from pydantic import Field
+
+
+class JobLease(Document):
+    """Schedule and lease for one background job, shared by every worker.
+
+    A worker runs a job only after claiming its lease with an atomic
+    update, so each run happens on exactly one worker. A worker that
+    crashes mid-run stops renewing its lease, and the job becomes
+    claimable again once locked_until passes.
+    """
+
+    id: str  # Job name
+    owner: Optional[str] = None  # Worker ID holding or last holding the lease
+    next_run_at: datetime = Field(default_factory=datetime.utcnow)
+    locked_until: datetime = Field(default_factory=datetime.utcnow)
+    last_finished_at: Optional[datetime] = None
+
+    class Settings:
+        name = "job_leases"
@@ -1,14 +1,45 @@
 from datetime import datetime
 from typing import Optional, List, Literal
-from beanie import Document
+from beanie import Document, PydanticObjectId, Replace, Save, SaveChanges, before_event
 from pydantic import Field
+from pymongo import IndexModel
 
 
 PostStatus = Literal["draft", "scheduled", "publishing", "completed", "failed"]
 PublishStatus = Literal["pending", "in_progress", "published", "failed"]
 
+# Filter excluding soft-deleted posts and publish results
+NOT_DELETED = {"deleted_at": None}
 
-class Post(Document):
+# Fields read by the list endpoints; raw documents are projected to these
+POST_RESPONSE_PROJECTION = {
+    "caption": 1, "media_files": 1, "media_types": 1, "platforms": 1,
+    "scheduled_for": 1, "created_at": 1, "status": 1,
+}
+RESULT_RESPONSE_PROJECTION = {
+    "post_id": 1, "platform_id": 1, "status": 1, "progress": 1,
+    "published_at": 1, "post_url": 1, "error": 1,
+}
+
+
+class UpdatedAtMixin:
+    """Keeps updated_at current on writes made through the document.
+
+    Delta updates (save_changes) only stamp it when another field changed,
+    so a no-op save stays a no-op instead of writing the timestamp alone.
+    """
+    
+    @before_event(Replace, Save)
+    def touch(self) -> None:
+        self.updated_at = datetime.utcnow()
+    
+    @before_event(SaveChanges)
+    def touch_if_changed(self) -> None:
+        if self.is_changed:
+            self.updated_at = datetime.utcnow()
+
+
+class Post(UpdatedAtMixin, Document):
     """Social media post created by a user."""
     
     user_id: str  # Reference to User
@@ -24,15 +55,32 @@ class Post(Document):
     status: PostStatus = "draft"
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    deleted_at: Optional[datetime] = None  # Set when soft-deleted, purged later
     
     class Settings:
-        name = "posts"
+        name = "posts"  # Shard key: {user_id: 1, _id: 1}
+        use_state_management = True  # save_changes() sends only modified fields
         indexes = [
-            "user_id",
-            "status",
             "scheduled_for",
+            [("user_id", 1), ("created_at", -1), ("_id", -1)],  # Listing, export order, per-user counts
+            [("user_id", 1), ("status", 1), ("created_at", -1), ("_id", -1)],  # Status-filtered listing
+            IndexModel(
+                [("user_id", 1), ("caption", "text")],
+                name="user_caption_text",
+            ),  # Caption search, scoped to one user
+            IndexModel(
+                [("deleted_at", 1)],
+                partialFilterExpression={"deleted_at": {"$type": "date"}},
+            ),  # Purge scan over soft-deleted posts only
         ]
     
+    @classmethod
+    async def get_for_user(cls, post_id: str, user_id: str) -> Optional["Post"]:
+        """Get one of a user's posts by ID; filtering on user_id targets the user's shard."""
+        if not PydanticObjectId.is_valid(post_id):
+            return None
+        return await cls.find_one({"_id": PydanticObjectId(post_id), "user_id": user_id})
+    
     def to_response(self) -> dict:
         """Convert to API response format."""
         return {
@@ -45,9 +93,24 @@ class Post(Document):
             "createdAt": self.created_at.isoformat(),
             "status": self.status,
         }
+    
+    @staticmethod
+    def response_from_raw(doc: dict) -> dict:
+        """Convert a raw document projected with POST_RESPONSE_PROJECTION, skipping model validation."""
+        scheduled_for = doc.get("scheduled_for")
+        return {
+            "id": str(doc["_id"]),
+            "caption": doc.get("caption", ""),
+            "mediaFiles": doc.get("media_files", []),
+            "mediaTypes": doc.get("media_types", []),
+            "platforms": doc.get("platforms", []),
+            "scheduledFor": scheduled_for.isoformat() if scheduled_for else None,
+            "createdAt": doc["created_at"].isoformat(),
+            "status": doc.get("status", "draft"),
+        }
 
 
-class PublishResult(Document):
+class PublishResult(UpdatedAtMixin, Document):
     """Result of publishing a post to a specific platform."""
     
     post_id: str  # Reference to Post
@@ -61,20 +124,57 @@ class PublishResult(Document):
     # Result
     published_at: Optional[datetime] = None
     post_url: Optional[str] = None
+    platform_post_id: Optional[str] = None  # ID of the post on the platform
     error: Optional[str] = None
     
+    # Execution claim, held by the executor publishing this result
+    claim_id: Optional[str] = None
+    claimed_by: Optional[str] = None  # Worker ID
+    lease_expires_at: Optional[datetime] = None
+    attempts: int = 0  # Claims taken since the result was last reset
+    
     # Timestamps
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+    deleted_at: Optional[datetime] = None  # Set when the post is soft-deleted
     
     class Settings:
-        name = "publish_results"
+        name = "publish_results"  # Shard key: {user_id: 1, post_id: 1}
+        use_state_management = True  # save_changes() sends only modified fields
         indexes = [
-            "post_id",
-            "user_id",
-            [("post_id", 1), ("platform_id", 1)],
+            IndexModel(
+                [("user_id", 1), ("post_id", 1), ("platform_id", 1)],
+                unique=True,
+            ),  # One result per platform; prefixed by the shard key so it stays enforceable
+            [("user_id", 1), ("status", 1)],  # Dashboard status counts, in-flight snapshot
+            [("user_id", 1), ("created_at", -1), ("_id", -1)],  # Activity feed keyset, exports
+            [("status", 1), ("published_at", -1)],  # Engagement ingest window
+            [("status", 1), ("updated_at", 1)],  # Archive scan, stalled pending results
+            [("status", 1), ("lease_expires_at", 1)],  # Expired claims on in-progress results
         ]
     
+    @property
+    def is_claimed(self) -> bool:
+        """Whether an executor is publishing this result under a live lease."""
+        return (
+            self.status == "in_progress"
+            and self.lease_expires_at is not None
+            and self.lease_expires_at > datetime.utcnow()
+        )
+    
+    def reset(self, status: PublishStatus, error: Optional[str] = None) -> None:
+        """Clear the outcome and claim so the result can be published again."""
+        self.status = status
+        self.error = error
+        self.progress = 0
+        self.published_at = None
+        self.post_url = None
+        self.platform_post_id = None
+        self.claim_id = None
+        self.claimed_by = None
+        self.lease_expires_at = None
+        self.attempts = 0
+    
     def to_response(self) -> dict:
         """Convert to API response format."""
         return {
@@ -86,3 +186,17 @@ class PublishResult(Document):
             "postUrl": self.post_url,
             "error": self.error,
         }
+    
+    @staticmethod
+    def response_from_raw(doc: dict) -> dict:
+        """Convert a raw document projected with RESULT_RESPONSE_PROJECTION, skipping model validation."""
+        published_at = doc.get("published_at")
+        return {
+            "postId": doc["post_id"],
+            "platformId": doc["platform_id"],
+            "status": doc.get("status", "pending"),
+            "progress": doc.get("progress", 0),
+            "publishedAt": published_at.isoformat() if published_at else None,
+            "postUrl": doc.get("post_url"),
+            "error": doc.get("error"),
+        }
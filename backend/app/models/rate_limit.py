@@ -0,0 +1,19 @@
+from datetime import datetime
+from beanie import Document
+from pydantic import Field
+from pymongo import IndexModel
+
+
+class RateLimitHit(Document):
+    """Single rate-limited request, used by the Mongo-backed sliding window."""
+
+    key: str  # e.g. "login:ip:203.0.113.7"
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    expires_at: datetime  # Removed by the TTL index once outside the window
+
+    class Settings:
+        name = "rate_limit_hits"
+        indexes = [
+            [("key", 1), ("created_at", 1)],
+            IndexModel([("expires_at", 1)], expireAfterSeconds=0),
+        ]
@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import List, Literal, Optional
+from beanie import Document
+from pydantic import Field
+from pymongo import IndexModel
+
+
+class UserStats(Document):
+    """Publishing counters for a user, maintained incrementally with $inc."""
+
+    user_id: str  # Reference to User
+
+    # Counters
+    total_posts: int = 0
+    pending: int = 0
+    in_progress: int = 0
+    published: int = 0
+    failed: int = 0
+
+    # Timestamps
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    reconciled_at: Optional[datetime] = None
+
+    class Settings:
+        name = "user_stats"  # Shard key: {user_id: 1}
+        indexes = [
+            IndexModel([("user_id", 1)], unique=True),
+        ]
+
+    def to_response(self) -> dict:
+        """Convert to dashboard stats response format."""
+        total_results = self.pending + self.in_progress + self.published + self.failed
+        return {
+            "totalPosts": self.total_posts,
+            "publishedCount": self.published,
+            "failedCount": self.failed,
+            "pendingCount": self.pending + self.in_progress,
+            "successRate": round((self.published / total_results) * 100) if total_results > 0 else 0,
+        }
+
+
+class PublishRollup(Document):
+    """Pre-aggregated publish outcomes for one user, time bucket and platform.
+
+    Each terminal publish attempt is counted once per granularity, both
+    under its platform and under the "*" all-platforms row.
+    """
+
+    user_id: str  # Reference to User
+    granularity: Literal["hour", "day"]
+    bucket: datetime  # Start of the bucket (UTC)
+    platform_id: str  # Platform ID, or "*" for all platforms
+
+    # Counters
+    published: int = 0
+    failed: int = 0
+
+    class Settings:
+        name = "publish_rollups"  # Shard key: {user_id: 1}
+        indexes = [
+            IndexModel(
+                [("user_id", 1), ("granularity", 1), ("platform_id", 1), ("bucket", 1)],
+                unique=True,
+            ),
+        ]
+
+
+class BestTimeProfile(Document):
+    """Weekday/hour histograms of a user's publishing, used to rank posting slots.
+
+    Arrays hold 168 UTC slots indexed weekday * 24 + hour (Monday = 0).
+    post_counts is kept current with $inc as results are published; the
+    engagement arrays are refreshed when the profile is rebuilt.
+    """
+
+    user_id: str  # Reference to User
+    platform_id: str  # Platform ID, or "*" for all platforms
+
+    post_counts: List[int] = Field(default_factory=lambda: [0] * 168)
+    engagement_sums: List[float] = Field(default_factory=lambda: [0.0] * 168)
+    engaged_posts: List[int] = Field(default_factory=lambda: [0] * 168)
+
+    built_at: datetime = Field(default_factory=datetime.utcnow)
+
+    class Settings:
+        name = "best_time_profiles"  # Shard key: {user_id: 1}
+        indexes = [
+            IndexModel([("user_id", 1), ("platform_id", 1)], unique=True),
+        ]
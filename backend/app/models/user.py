@@ -23,6 +23,7 @@ class User(Document):
     # Account status
     is_active: bool = True
     is_verified: bool = False
+    is_admin: bool = False  # Grants access to the /admin endpoints
     
     class Settings:
         name = "users"
@@ -3,6 +3,10 @@ from app.routers.accounts import router as accounts_router
 from app.routers.posts import router as posts_router
 from app.routers.publish import router as publish_router
 from app.routers.stats import router as stats_router
+from app.routers.exports import router as exports_router
+from app.routers.health import router as health_router
+from app.routers.metrics import router as metrics_router
+from app.routers.admin import router as admin_router
 
 __all__ = [
     "auth_router",
@@ -10,4 +14,8 @@ __all__ = [
     "posts_router",
     "publish_router",
     "stats_router",
+    "exports_router",
+    "health_router",
+    "metrics_router",
+    "admin_router",
 ]
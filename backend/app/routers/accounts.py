@@ -1,6 +1,7 @@
 import secrets
 from typing import List
 from fastapi import APIRouter, HTTPException, status, Depends, Query
+from pymongo.errors import DuplicateKeyError
 
 from app.config import get_settings
 from app.schemas.account import (
@@ -10,9 +11,11 @@ from app.schemas.account import (
     ConnectPlatformResponse,
 )
 from app.models.user import User
-from app.models.account import ConnectedAccount
+from app.models.account import ConnectedAccount, ACCOUNT_RESPONSE_PROJECTION
+from app.services.account_cache import account_cache
 from app.services.auth_service import get_current_user
 from app.services.platform_service import PlatformService
+from app.utils.queries import accounts_filter
 
 settings = get_settings()
 router = APIRouter(prefix="/accounts", tags=["Accounts"])
@@ -31,11 +34,11 @@ PLATFORMS = {
 @router.get("", response_model=List[ConnectedAccountResponse])
 async def get_connected_accounts(current_user: User = Depends(get_current_user)):
     """Get all connected social media accounts for the current user."""
-    accounts = await ConnectedAccount.find(
-        ConnectedAccount.user_id == str(current_user.id)
-    ).to_list()
+    rows = await ConnectedAccount.get_motor_collection().find(
+        accounts_filter(str(current_user.id)), ACCOUNT_RESPONSE_PROJECTION
+    ).to_list(length=None)
     
-    return [ConnectedAccountResponse(**acc.to_response()) for acc in accounts]
+    return [ConnectedAccount.response_from_raw(row) for row in rows]
 
 
 @router.post("/connect/{platform_id}", response_model=ConnectPlatformResponse)
@@ -228,7 +231,14 @@ async def platform_oauth_callback(
         platform_user_id=platform_user_id,
         page_id=page_id,
     )
-    await account.insert()
+    try:
+        await account.insert()
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Platform {platform_id} is already connected"
+        )
+    account_cache.invalidate(account.user_id)
     
     return ConnectedAccountResponse(**account.to_response())
 
@@ -239,7 +249,7 @@ async def disconnect_account(
     current_user: User = Depends(get_current_user)
 ):
     """Disconnect a social media account."""
-    account = await ConnectedAccount.get(account_id)
+    account = await ConnectedAccount.get_for_user(account_id, str(current_user.id))
     
     if not account:
         raise HTTPException(
@@ -247,13 +257,8 @@ async def disconnect_account(
             detail="Account not found"
         )
     
-    if account.user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to disconnect this account"
-        )
-    
     await account.delete()
+    account_cache.invalidate(account.user_id)
     
     return {"message": "Account disconnected successfully"}
 
@@ -264,7 +269,7 @@ async def toggle_account_status(
     current_user: User = Depends(get_current_user)
 ):
     """Toggle the active status of a connected account."""
-    account = await ConnectedAccount.get(account_id)
+    account = await ConnectedAccount.get_for_user(account_id, str(current_user.id))
     
     if not account:
         raise HTTPException(
@@ -272,14 +277,9 @@ async def toggle_account_status(
             detail="Account not found"
         )
     
-    if account.user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to modify this account"
-        )
-    
     account.is_active = not account.is_active
-    await account.save()
+    await account.save_changes()
+    account_cache.invalidate(account.user_id)
     
     return ConnectedAccountResponse(**account.to_response())
 
@@ -0,0 +1,103 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+
+from app.config import get_settings
+from app.models.user import User
+from app.schemas.admin import ProfileStart, ProfileSessionResponse
+from app.services.auth_service import get_current_admin_user
+from app.utils.profiler import ProfileSession, profiler
+from app.utils.worker import WORKER_ID
+
+settings = get_settings()
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+def session_response(session: ProfileSession) -> ProfileSessionResponse:
+    return ProfileSessionResponse(**session.to_response(), worker=WORKER_ID)
+
+
+@router.post("/profiler", response_model=ProfileSessionResponse, status_code=status.HTTP_201_CREATED)
+async def start_profiler(
+    request: ProfileStart,
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Start sampling this worker for the given number of seconds.
+    
+    Sessions are per worker; the response names the worker that is
+    profiling.
+    """
+    if request.seconds > settings.profiler_max_seconds:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Sessions are limited to {settings.profiler_max_seconds} seconds"
+        )
+    
+    try:
+        session = profiler.start(
+            seconds=request.seconds,
+            interval_seconds=request.intervalMs / 1000,
+            format=request.format,
+            route=request.route,
+            header=request.header,
+            include_publish=request.includePublish,
+        )
+    except RuntimeError as error:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(error)
+        )
+    
+    return session_response(session)
+
+
+@router.get("/profiler", response_model=ProfileSessionResponse)
+async def get_profiler(current_user: User = Depends(get_current_admin_user)):
+    """Get this worker's running or most recent profiling session."""
+    if profiler.session is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No profiling session on this worker"
+        )
+    return session_response(profiler.session)
+
+
+@router.post("/profiler/stop", response_model=ProfileSessionResponse)
+async def stop_profiler(current_user: User = Depends(get_current_admin_user)):
+    """Stop the running session early and write its output."""
+    if not profiler.running:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No profiling session running on this worker"
+        )
+    session = await run_in_threadpool(profiler.stop)
+    return session_response(session)
+
+
+@router.get("/profiler/{session_id}/output")
+async def download_profile(
+    session_id: str,
+    format: str = "speedscope",
+    current_user: User = Depends(get_current_admin_user)
+):
+    """Download a finished session's output.
+    
+    Files are read from PROFILER_OUTPUT_DIR, so any worker sharing that
+    directory can serve them.
+    """
+    if format not in ("speedscope", "collapsed") or not session_id.isalnum():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
+    path = profiler.output_path(session_id, format)
+    if not os.path.isfile(path):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
+    media_type = "application/json" if format == "speedscope" else "text/plain"
+    return FileResponse(path, media_type=media_type, filename=os.path.basename(path))
@@ -9,20 +9,23 @@ from app.config import get_settings
 from app.schemas.auth import UserCreate, UserLogin, UserResponse, Token, SSOAuthUrl, ProfileUpdate, PasswordChange
 from app.models.user import User
 from app.services.auth_service import (
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
     create_access_token,
     get_current_user,
 )
 from app.services.oauth_service import OAuthService
+from app.services.rate_limit_service import check_auth_rate_limit
 
 settings = get_settings()
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/register", response_model=Token)
-async def register(user_data: UserCreate):
+async def register(request: Request, user_data: UserCreate):
     """Register a new user with email and password."""
+    await check_auth_rate_limit(request, "register")
+    
     # Check if user exists
     existing_user = await User.find_one(User.email == user_data.email)
     if existing_user:
@@ -34,7 +37,7 @@ async def register(user_data: UserCreate):
     # Create user
     user = User(
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await get_password_hash_async(user_data.password),
         name=user_data.name,
     )
     await user.insert()
@@ -51,8 +54,11 @@ async def register(user_data: UserCreate):
 
 
 @router.post("/login", response_model=Token)
-async def login(credentials: UserLogin):
+async def login(request: Request, credentials: UserLogin):
     """Login with email and password."""
+    # Throttle before any bcrypt work is done
+    await check_auth_rate_limit(request, "login", credentials.email)
+    
     user = await User.find_one(User.email == credentials.email)
     
     if not user or not user.hashed_password:
@@ -61,7 +67,7 @@ async def login(credentials: UserLogin):
             detail="Invalid email or password"
         )
     
-    if not verify_password(credentials.password, user.hashed_password):
+    if not await verify_password_async(credentials.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -341,7 +347,7 @@ async def change_password(
         )
     
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await verify_password_async(password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
@@ -355,7 +361,7 @@ async def change_password(
         )
     
     # Hash and save new password
-    current_user.hashed_password = get_password_hash(password_data.new_password)
+    current_user.hashed_password = await get_password_hash_async(password_data.new_password)
     await current_user.save()
     
     return {"message": "Password changed successfully"}
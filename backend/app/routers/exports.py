@@ -0,0 +1,154 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Callable, List, Literal, Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.config import get_settings
+from app.database import analytics_collection
+from app.models.archive import PublishResultArchive
+from app.models.user import User
+from app.models.post import Post, PublishResult, POST_RESPONSE_PROJECTION
+from app.services.auth_service import get_current_user
+from app.utils.queries import OLDEST_FIRST, archived_results_export_pipeline, posts_filter, results_filter
+
+settings = get_settings()
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+ExportFormat = Literal["ndjson", "csv"]
+
+POST_COLUMNS = ["id", "caption", "mediaFiles", "mediaTypes", "platforms", "scheduledFor", "createdAt", "status"]
+RESULT_COLUMNS = ["id", "postId", "platformId", "status", "publishedAt", "postUrl", "error", "createdAt"]
+
+# Encoded bytes buffered before a chunk is sent to the client
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+def isoformat(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional datetime for export."""
+    return value.isoformat() if value else None
+
+
+def result_row(doc: dict) -> dict:
+    """Convert a raw publish result document to an export row."""
+    return {
+        "id": str(doc["_id"]),
+        "postId": doc.get("post_id"),
+        "platformId": doc.get("platform_id"),
+        "status": doc.get("status"),
+        "publishedAt": isoformat(doc.get("published_at")),
+        "postUrl": doc.get("post_url"),
+        "error": doc.get("error"),
+        "createdAt": isoformat(doc.get("created_at")),
+    }
+
+
+def export_cursor(collection, query: dict, projection: dict):
+    """Open a bounded-batch cursor over matching documents in creation order."""
+    return collection.find(query, projection).sort(OLDEST_FIRST).batch_size(settings.export_batch_size)
+
+
+async def chain(*sources) -> AsyncIterator[dict]:
+    """Read each cursor to the end in turn."""
+    for source in sources:
+        async for doc in source:
+            yield doc
+
+
+async def stream_rows(
+    cursor,
+    to_row: Callable[[dict], dict],
+    columns: List[str],
+    export_format: ExportFormat,
+) -> AsyncIterator[bytes]:
+    """Encode documents from bounded-batch cursors as they arrive.
+
+    Only one cursor batch and one encoded chunk are held in memory at a
+    time, so memory use does not depend on the export size.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    if export_format == "csv":
+        writer.writeheader()
+
+    async for doc in cursor:
+        row = to_row(doc)
+        if export_format == "csv":
+            writer.writerow({
+                key: ";".join(value) if isinstance(value, list) else value
+                for key, value in row.items()
+            })
+        else:
+            buffer.write(json.dumps(row, ensure_ascii=False))
+            buffer.write("\n")
+
+        # Flush roughly one chunk at a time to the client
+        if buffer.tell() >= EXPORT_CHUNK_BYTES:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def export_response(rows: AsyncIterator[bytes], name: str, export_format: ExportFormat) -> StreamingResponse:
+    """Wrap an encoded row stream in a downloadable response."""
+    media_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+    filename = f"{name}-{datetime.utcnow():%Y%m%d%H%M%S}.{export_format}"
+
+    return StreamingResponse(
+        rows,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/posts")
+async def export_posts(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = Query(None),
+    status: Optional[str] = Query(None),
+    platform: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream the current user's posts as NDJSON or CSV."""
+    query = posts_filter(str(current_user.id), status, platform, from_, to)
+
+    rows = stream_rows(
+        export_cursor(analytics_collection(Post), query, POST_RESPONSE_PROJECTION),
+        Post.response_from_raw, POST_COLUMNS, export_format
+    )
+    return export_response(rows, "posts", export_format)
+
+
+@router.get("/publish-results")
+async def export_publish_results(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = Query(None),
+    status: Optional[str] = Query(None),
+    platform: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user)
+):
+    """Stream the current user's publish results as NDJSON or CSV.
+
+    Results still in publish_results come first, in creation order,
+    followed by archived results by the day they finished.
+    """
+    user_id = str(current_user.id)
+    query = results_filter(user_id, status, platform, from_, to)
+
+    projection = {"user_id": 0, "progress": 0, "updated_at": 0, "deleted_at": 0}
+    archived = analytics_collection(PublishResultArchive).aggregate(
+        archived_results_export_pipeline(user_id, status, platform, from_, to),
+        batchSize=settings.export_batch_size,
+    )
+    rows = stream_rows(
+        chain(export_cursor(analytics_collection(PublishResult), query, projection), archived),
+        result_row, RESULT_COLUMNS, export_format
+    )
+    return export_response(rows, "publish-results", export_format)
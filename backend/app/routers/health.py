@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Response, status
+
+from app.services.health_service import HealthService
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+async def readiness_response(response: Response) -> dict:
+    """Run the readiness checks, answering 503 when the worker should not take traffic."""
+    report = await HealthService.readiness()
+    if report["status"] != "ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return report
+
+
+@router.get("")
+async def health_check(response: Response):
+    """Detailed health check endpoint (same checks as readiness)."""
+    return await readiness_response(response)
+
+
+@router.get("/live")
+async def liveness():
+    """Liveness probe: the worker's event loop is serving requests.
+    
+    Dependencies are not checked, so a database outage does not get
+    healthy workers restarted.
+    """
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+async def readiness(response: Response):
+    """Readiness probe: MongoDB answers a ping, background workers are running
+    and startup warm-up has finished.
+    """
+    return await readiness_response(response)
@@ -0,0 +1,32 @@
+import os
+import secrets
+from fastapi import APIRouter, Header, HTTPException, Response, status
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, generate_latest, multiprocess
+
+from app.config import get_settings
+
+settings = get_settings()
+router = APIRouter(tags=["Metrics"])
+
+
+def metrics_registry():
+    """The registry to expose, aggregated across workers in multiprocess mode."""
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(authorization: str = Header("")):
+    """Prometheus scrape endpoint."""
+    if settings.metrics_token and not secrets.compare_digest(
+        authorization, f"Bearer {settings.metrics_token}"
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token"
+        )
+    
+    return Response(generate_latest(metrics_registry()), media_type=CONTENT_TYPE_LATEST)
@@ -1,22 +1,54 @@
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException, status, Depends
+from datetime import datetime
+from typing import List, Literal, Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
 
-from app.schemas.post import PostCreate, PostResponse
+from app.schemas.post import (
+    PostCreate,
+    PostResponse,
+    PostBulkDelete,
+    PostDeleteResult,
+    PostImportReport,
+    PostSearchResult,
+)
+from app.database import analytics_collection
 from app.models.user import User
-from app.models.post import Post
+from app.models.post import Post, PostStatus, POST_RESPONSE_PROJECTION
 from app.services.auth_service import get_current_user
+from app.services.import_service import ImportService
+from app.services.post_service import PostService
+from app.services.stats_service import StatsService
+from app.utils.pagination import NEXT_CURSOR_HEADER, encode_score_cursor, set_next_cursor
+from app.utils.queries import NEWEST_FIRST, post_search_pipeline, posts_filter
 
 router = APIRouter(prefix="/posts", tags=["Posts"])
 
 
 @router.get("", response_model=List[PostResponse])
-async def get_posts(current_user: User = Depends(get_current_user)):
-    """Get all posts for the current user."""
-    posts = await Post.find(
-        Post.user_id == str(current_user.id)
-    ).sort(-Post.created_at).to_list()
+async def get_posts(
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    post_status: Optional[PostStatus] = Query(None, alias="status"),
+    platform: Optional[str] = Query(None),
+    from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = Query(None),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the current user's posts, newest first.
+    
+    Keyset-paginated on (created_at, _id); pass the X-Next-Cursor response
+    header back as `cursor` to fetch the next page.
+    """
+    query = posts_filter(str(current_user.id), post_status, platform, from_, to, cursor)
+    
+    # Fetch one extra post to know whether another page exists. Raw projected
+    # rows skip Document validation; response_model validates each item once.
+    rows = await analytics_collection(Post).find(
+        query, POST_RESPONSE_PROJECTION
+    ).sort(NEWEST_FIRST).limit(limit + 1).to_list(length=limit + 1)
+    rows = set_next_cursor(response, rows, limit)
     
-    return [PostResponse(**post.to_response()) for post in posts]
+    return [Post.response_from_raw(row) for row in rows]
 
 
 @router.post("", response_model=PostResponse)
@@ -35,53 +67,116 @@ async def create_post(
         status="draft" if not post_data.platforms else "scheduled" if post_data.scheduledFor else "publishing",
     )
     await post.insert()
+    await StatsService.record_post_created(post.user_id)
     
     return PostResponse(**post.to_response())
 
 
+@router.get("/search", response_model=List[PostSearchResult])
+async def search_posts(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    post_status: Optional[PostStatus] = Query(None, alias="status"),
+    platform: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user)
+):
+    """Search the current user's captions, best match first.
+    
+    Uses the (user_id, caption) text index: words are stemmed, "quoted
+    phrases" must match exactly and -word excludes. Keyset-paginated on
+    (score, _id) via the X-Next-Cursor header.
+    """
+    pipeline = post_search_pipeline(str(current_user.id), q, limit, post_status, platform, cursor)
+    
+    rows = await analytics_collection(Post).aggregate(pipeline).to_list(length=limit + 1)
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_score_cursor(rows[-1]["score"], rows[-1]["_id"])
+    
+    return [{**Post.response_from_raw(row), "score": round(row["score"], 4)} for row in rows]
+
+
+@router.post("/import", response_model=PostImportReport)
+async def import_posts(
+    request: Request,
+    import_format: Literal["csv", "ndjson"] = Query(..., alias="format"),
+    current_user: User = Depends(get_current_user)
+):
+    """Import posts from a CSV or NDJSON request body.
+    
+    Uses the export layout (caption, mediaFiles, mediaTypes, platforms,
+    scheduledFor; CSV lists joined by ";"). The body is parsed as it
+    streams in and inserted in chunks; invalid rows are skipped and
+    reported by row number.
+    """
+    report = await ImportService.import_posts(
+        str(current_user.id), request.stream(), import_format
+    )
+    
+    return PostImportReport(**report)
+
+
 @router.get("/{post_id}", response_model=PostResponse)
 async def get_post(
     post_id: str,
     current_user: User = Depends(get_current_user)
 ):
     """Get a specific post."""
-    post = await Post.get(post_id)
+    post = await Post.get_for_user(post_id, str(current_user.id))
     
-    if not post:
+    if not post or post.deleted_at:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
     
-    if post.user_id != str(current_user.id):
+    return PostResponse(**post.to_response())
+
+
+@router.delete("", response_model=PostDeleteResult)
+async def delete_posts(
+    request: PostBulkDelete,
+    current_user: User = Depends(get_current_user)
+):
+    """Delete the current user's posts by id list and/or filter, with their publish results."""
+    if request.ids is None and not any(
+        [request.status, request.platform, request.createdFrom, request.createdTo]
+    ):
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this post"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Provide post ids or at least one filter"
         )
     
-    return PostResponse(**post.to_response())
+    deleted = await PostService.delete_posts(
+        str(current_user.id),
+        post_ids=request.ids,
+        post_status=request.status,
+        platform=request.platform,
+        start=request.createdFrom,
+        end=request.createdTo,
+        soft=request.soft,
+    )
+    
+    return PostDeleteResult(**deleted)
 
 
 @router.delete("/{post_id}")
 async def delete_post(
     post_id: str,
+    soft: bool = Query(False, description="Hide now and purge after the retention period"),
     current_user: User = Depends(get_current_user)
 ):
-    """Delete a post."""
-    post = await Post.get(post_id)
+    """Delete a post and its publish results."""
+    post = await Post.get_for_user(post_id, str(current_user.id))
     
-    if not post:
+    if not post or post.deleted_at:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
     
-    if post.user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this post"
-        )
-    
-    await post.delete()
+    await PostService.delete_posts(post.user_id, post_ids=[post_id], soft=soft)
     
     return {"message": "Post deleted successfully"}
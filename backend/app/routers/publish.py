@@ -1,17 +1,164 @@
-from typing import List
-from datetime import datetime
+from typing import List, Optional, Tuple
+from collections import defaultdict
+from datetime import datetime, timedelta
 import asyncio
-from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks
+import logging
+import uuid
+from beanie import UpdateResponse
+from opentelemetry import trace
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    status,
+    Depends,
+    BackgroundTasks,
+    Query,
+    WebSocket,
+    WebSocketDisconnect,
+)
+
+from app.config import get_settings
 
 from app.schemas.post import PublishRequest, PublishResultResponse
 from app.models.user import User
-from app.models.post import Post, PublishResult
-from app.models.account import ConnectedAccount
-from app.services.auth_service import get_current_user
+from app.models.post import Post, PublishResult, NOT_DELETED, RESULT_RESPONSE_PROJECTION
+from app.services.account_cache import account_cache
+from app.services.archive_service import ArchiveService
+from app.services.auth_service import get_current_user, get_user_from_token
 from app.services.platform_service import PlatformService
+from app.services.publish_events import publish_events
+from app.services.stats_service import StatsService
+from app.utils.profiler import profiler
+from app.utils.queries import (
+    claimable_result_filter,
+    in_flight_results_filter,
+    post_results_filter,
+    stalled_results_filter,
+)
+from app.utils.tracing import traced
+from app.utils.worker import WORKER_ID
 
+settings = get_settings()
+logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/publish", tags=["Publishing"])
 
+# Posts resumed per pass of the stalled publish job
+PUBLISH_RESUME_BATCH_SIZE = 100
+
+# Result fields written by an executor holding a claim
+CLAIMED_FIELDS = ("status", "progress", "published_at", "post_url", "platform_post_id", "error")
+
+
+def result_event(result: PublishResult) -> dict:
+    """Build the WebSocket message for a publish result update."""
+    return {"type": "publish_result", "result": result.to_response()}
+
+
+async def save_result(
+    result: PublishResult,
+    previous_status: Optional[str],
+    previous_published_at: Optional[datetime] = None,
+) -> None:
+    """Write a publish result's changed fields, update stats and push the change to subscribers."""
+    await result.save_changes()
+    await StatsService.record_result_transition(result, previous_status, previous_published_at)
+    await publish_events.publish(result.user_id, result_event(result))
+
+
+async def claim_result(
+    user_id: str, post_id: str, platform_id: str
+) -> Optional[Tuple[PublishResult, str]]:
+    """Atomically take a publish result for this executor.
+    
+    A pending result, or an in-progress one whose executor stopped renewing
+    its lease, moves to in_progress under a new claim ID. Returns the
+    result and claim ID, or None if the result is finished, reset or held
+    by a live executor. The filter includes the shard key, so the update
+    goes to one shard.
+    """
+    now = datetime.utcnow()
+    claim_id = uuid.uuid4().hex
+    result = await PublishResult.find_one(
+        claimable_result_filter(user_id, post_id, platform_id, now)
+    ).update(
+        {
+            "$set": {
+                "status": "in_progress",
+                "progress": 10,
+                "claim_id": claim_id,
+                "claimed_by": WORKER_ID,
+                "lease_expires_at": now + timedelta(seconds=settings.publish_lease_seconds),
+                "updated_at": now,
+            },
+            "$inc": {"attempts": 1},
+        },
+        response_type=UpdateResponse.OLD_DOCUMENT,
+    )
+    if result is None:
+        return None
+    
+    previous_status = result.status
+    if previous_status == "in_progress":
+        logger.warning("Reclaiming %s result %s from %s", platform_id, result.id, result.claimed_by)
+    result.status = "in_progress"
+    result.progress = 10
+    result.claim_id = claim_id
+    result.claimed_by = WORKER_ID
+    result.attempts += 1
+    result.updated_at = now
+    await StatsService.record_result_transition(result, previous_status)
+    await publish_events.publish(result.user_id, result_event(result))
+    return result, claim_id
+
+
+async def save_claimed_result(result: PublishResult, claim_id: str, previous_status: str) -> bool:
+    """Write a claimed result's fields if the claim still holds, renewing its lease.
+    
+    A terminal status releases the claim. Returns False, writing nothing,
+    when the result was reset, taken over by another executor or
+    soft-deleted with its post; deletion already took it out of the stats.
+    """
+    now = datetime.utcnow()
+    fields = {name: getattr(result, name) for name in CLAIMED_FIELDS}
+    if result.status == "in_progress":
+        fields["lease_expires_at"] = now + timedelta(seconds=settings.publish_lease_seconds)
+    else:
+        fields["lease_expires_at"] = None
+        fields["claim_id"] = None
+    
+    written = await PublishResult.get_motor_collection().update_one(
+        {
+            "user_id": result.user_id,
+            "post_id": result.post_id,
+            "_id": result.id,
+            "claim_id": claim_id,
+            **NOT_DELETED,
+        },
+        {"$set": {**fields, "updated_at": now}},
+    )
+    if not written.matched_count:
+        logger.warning("Lost claim on %s result %s", result.platform_id, result.id)
+        return False
+    
+    result.lease_expires_at = fields["lease_expires_at"]
+    result.updated_at = now
+    await StatsService.record_result_transition(result, previous_status)
+    await publish_events.publish(result.user_id, result_event(result))
+    return True
+
+
+async def set_post_status(post: Post, post_status: str) -> None:
+    """Set a post's status with an update filtered on the shard key.
+    
+    Posts soft-deleted in the meantime are left as they are.
+    """
+    post.status = post_status
+    post.updated_at = datetime.utcnow()
+    await Post.get_motor_collection().update_one(
+        {"user_id": post.user_id, "_id": post.id, **NOT_DELETED},
+        {"$set": {"status": post.status, "updated_at": post.updated_at}},
+    )
+
 
 @router.post("", response_model=List[PublishResultResponse])
 async def publish_post(
@@ -21,52 +168,54 @@ async def publish_post(
 ):
     """Publish a post to selected platforms."""
     # Get the post
-    post = await Post.get(request.post_id)
+    post = await Post.get_for_user(request.post_id, str(current_user.id))
     
-    if not post:
+    if not post or post.deleted_at:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
     
-    if post.user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to publish this post"
-        )
-    
     # Create publish results for each platform
+    accounts = await account_cache.get_active(str(current_user.id))
     results = []
     for platform_id in request.platform_ids:
         # Check if user has this platform connected
-        account = await ConnectedAccount.find_one(
-            ConnectedAccount.user_id == str(current_user.id),
-            ConnectedAccount.platform_id == platform_id,
-            ConnectedAccount.is_active == True
+        account = accounts.get(platform_id)
+        
+        # Republishing resets the platform's existing result in place
+        result = await PublishResult.find_one(
+            post_results_filter(str(current_user.id), str(post.id), platform_id)
         )
+        if result and result.is_claimed:
+            # Already being published; its executor reports the outcome
+            results.append(result)
+            continue
         
-        if not account:
+        previous_status = result.status if result else None
+        previous_published_at = result.published_at if result else None
+        if not result:
             result = PublishResult(
                 post_id=str(post.id),
                 user_id=str(current_user.id),
                 platform_id=platform_id,
-                status="failed",
-                error=f"No active {platform_id} account connected"
             )
+        
+        if account:
+            result.reset("pending")
         else:
-            result = PublishResult(
-                post_id=str(post.id),
-                user_id=str(current_user.id),
-                platform_id=platform_id,
-                status="pending"
-            )
+            result.reset("failed", f"No active {platform_id} account connected")
         
-        await result.insert()
+        if previous_status is None:
+            await result.insert()
+            await StatsService.record_result_transition(result, None)
+            await publish_events.publish(result.user_id, result_event(result))
+        else:
+            await save_result(result, previous_status, previous_published_at)
         results.append(result)
     
     # Update post status
-    post.status = "publishing"
-    await post.save()
+    await set_post_status(post, "publishing")
     
     # Start background publishing
     background_tasks.add_task(
@@ -79,49 +228,62 @@ async def publish_post(
     return [PublishResultResponse(**r.to_response()) for r in results]
 
 
+@traced("publish_to_platforms")
+@profiler.publish_task
 async def publish_to_platforms(post_id: str, user_id: str, platform_ids: List[str]):
-    """Background task to publish to all platforms."""
-    post = await Post.get(post_id)
-    if not post:
+    """Background task to publish to all platforms.
+    
+    Each result is claimed atomically before publishing, so a result is
+    published by one executor even when several run for the same post.
+    Results held by another executor are skipped and left to it. Started
+    from a request, its span is a child of the request's trace.
+    """
+    trace.get_current_span().set_attributes({
+        "post_id": post_id, "user_id": user_id, "platforms": platform_ids,
+    })
+    post = await Post.get_for_user(post_id, user_id)
+    if not post or post.deleted_at:
         return
     
+    claimed_any = False
     all_success = True
     any_success = False
     
     for platform_id in platform_ids:
-        # Get the publish result
-        result = await PublishResult.find_one(
-            PublishResult.post_id == post_id,
-            PublishResult.platform_id == platform_id
-        )
-        
-        if not result or result.status == "failed":
+        claim = await claim_result(user_id, post_id, platform_id)
+        if claim is None:
             continue
+        result, claim_id = claim
+        claimed_any = True
         
-        # Update to in_progress
-        result.status = "in_progress"
-        result.progress = 10
-        await result.save()
+        # The executor may have died after the platform accepted the post; stop retrying eventually
+        if result.attempts > settings.publish_max_attempts:
+            result.status = "failed"
+            result.error = f"Publishing was interrupted {result.attempts - 1} times"
+            await save_claimed_result(result, claim_id, "in_progress")
+            all_success = False
+            continue
         
         # Get the account
-        account = await ConnectedAccount.find_one(
-            ConnectedAccount.user_id == user_id,
-            ConnectedAccount.platform_id == platform_id,
-            ConnectedAccount.is_active == True
-        )
+        account = await account_cache.resolve(user_id, platform_id)
         
         if not account:
             result.status = "failed"
             result.error = f"No active {platform_id} account"
-            await result.save()
+            await save_claimed_result(result, claim_id, "in_progress")
             all_success = False
             continue
         
-        # Simulate progress
+        # Simulate progress; each write also renews the lease
+        lost = False
         for progress in [30, 50, 70, 90]:
             result.progress = progress
-            await result.save()
+            if not await save_claimed_result(result, claim_id, result.status):
+                lost = True
+                break
             await asyncio.sleep(0.5)
+        if lost:
+            continue
         
         # Publish to platform
         try:
@@ -133,27 +295,61 @@ async def publish_to_platforms(post_id: str, user_id: str, platform_ids: List[st
                 result.status = "published"
                 result.published_at = datetime.utcnow()
                 result.post_url = publish_result.get("post_url")
+                result.platform_post_id = publish_result.get("post_id")
                 result.progress = 100
-                any_success = True
             else:
                 result.status = "failed"
                 result.error = publish_result.get("error", "Unknown error")
-                all_success = False
         except Exception as e:
             result.status = "failed"
             result.error = str(e)
-            all_success = False
         
-        await result.save()
+        # An outcome that could not be recorded does not count toward the post's status
+        if not await save_claimed_result(result, claim_id, "in_progress"):
+            continue
+        if result.status == "published":
+            any_success = True
+        else:
+            all_success = False
+    
+    if not claimed_any:
+        return
     
     # Update post status
     if all_success:
-        post.status = "completed"
+        await set_post_status(post, "completed")
     elif any_success:
-        post.status = "completed"  # Partial success
+        await set_post_status(post, "completed")  # Partial success
     else:
-        post.status = "failed"
-    await post.save()
+        await set_post_status(post, "failed")
+
+
+async def resume_stalled_publishes() -> int:
+    """Resume publishes whose executor died before finishing.
+    
+    Picks up pending results that no executor claimed within a lease
+    period, e.g. because the worker stopped before its background task
+    ran, and in-progress results whose lease expired. Each is claimed
+    again by publish_to_platforms, so results resumed concurrently
+    elsewhere are skipped. Returns the number of posts resumed.
+    """
+    now = datetime.utcnow()
+    stalled_before = now - timedelta(seconds=settings.publish_lease_seconds)
+    cursor = PublishResult.get_motor_collection().find(
+        stalled_results_filter(now, stalled_before),
+        {"user_id": 1, "post_id": 1, "platform_id": 1},
+    ).limit(PUBLISH_RESUME_BATCH_SIZE)
+    
+    stalled = defaultdict(list)
+    async for doc in cursor:
+        stalled[(doc["user_id"], doc["post_id"])].append(doc["platform_id"])
+    
+    for (user_id, post_id), platform_ids in stalled.items():
+        await publish_to_platforms(post_id, user_id, platform_ids)
+    
+    if stalled:
+        logger.info("Resumed %d stalled publishes", len(stalled))
+    return len(stalled)
 
 
 @router.get("/{post_id}", response_model=List[PublishResultResponse])
@@ -162,25 +358,27 @@ async def get_publish_results(
     current_user: User = Depends(get_current_user)
 ):
     """Get publish results for a post."""
-    post = await Post.get(post_id)
+    post = await Post.get_for_user(post_id, str(current_user.id))
     
-    if not post:
+    if not post or post.deleted_at:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
     
-    if post.user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to view this post"
-        )
+    rows = await PublishResult.get_motor_collection().find(
+        post_results_filter(str(current_user.id), post_id), RESULT_RESPONSE_PROJECTION
+    ).to_list(length=None)
+    responses = [PublishResult.response_from_raw(row) for row in rows]
     
-    results = await PublishResult.find(
-        PublishResult.post_id == post_id
-    ).to_list()
+    # Platforms without a live result fall back to their latest archived outcome
+    live_platforms = {response["platformId"] for response in responses}
+    for archived in await ArchiveService.post_results(str(current_user.id), post_id):
+        if archived["platformId"] not in live_platforms:
+            live_platforms.add(archived["platformId"])
+            responses.append(archived)
     
-    return [PublishResultResponse(**r.to_response()) for r in results]
+    return responses
 
 
 @router.post("/{post_id}/retry/{platform_id}", response_model=PublishResultResponse)
@@ -191,23 +389,16 @@ async def retry_publish(
     current_user: User = Depends(get_current_user)
 ):
     """Retry publishing a failed post to a platform."""
-    post = await Post.get(post_id)
+    post = await Post.get_for_user(post_id, str(current_user.id))
     
-    if not post:
+    if not post or post.deleted_at:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
     
-    if post.user_id != str(current_user.id):
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to retry this post"
-        )
-    
     result = await PublishResult.find_one(
-        PublishResult.post_id == post_id,
-        PublishResult.platform_id == platform_id
+        post_results_filter(str(current_user.id), post_id, platform_id)
     )
     
     if not result:
@@ -216,11 +407,17 @@ async def retry_publish(
             detail="Publish result not found"
         )
     
+    if result.is_claimed:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Publish already in progress"
+        )
+    
     # Reset result for retry
-    result.status = "pending"
-    result.error = None
-    result.progress = 0
-    await result.save()
+    previous_status = result.status
+    previous_published_at = result.published_at
+    result.reset("pending")
+    await save_result(result, previous_status, previous_published_at)
     
     # Start background retry
     background_tasks.add_task(
@@ -231,3 +428,56 @@ async def retry_publish(
     )
     
     return PublishResultResponse(**result.to_response())
+
+
+@router.websocket("/ws")
+async def publish_updates_socket(
+    websocket: WebSocket,
+    token: str = Query(...),
+    post_id: Optional[str] = Query(None),
+):
+    """Push publish result updates to the client as they happen.
+    
+    Authenticate with `?token=<JWT>`. On connect the server sends a
+    `snapshot` of the user's in-flight results (or of every result for
+    `post_id` if given), then a `publish_result` message per update.
+    """
+    user = await get_user_from_token(token)
+    if user is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    
+    user_id = str(user.id)
+    await websocket.accept()
+    
+    # Subscribe before reading the snapshot so no update falls in between
+    queue = publish_events.subscribe(user_id)
+    try:
+        if post_id:
+            snapshot = await PublishResult.find(post_results_filter(user_id, post_id)).to_list()
+        else:
+            snapshot = await PublishResult.find(in_flight_results_filter(user_id)).to_list()
+        
+        await websocket.send_json({
+            "type": "snapshot",
+            "results": [r.to_response() for r in snapshot],
+        })
+        
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=settings.websocket_heartbeat_seconds
+                )
+            except asyncio.TimeoutError:
+                # Keeps proxies from idling out the connection and detects dead clients
+                await websocket.send_json({"type": "ping"})
+                continue
+            
+            if post_id and event["result"]["postId"] != post_id:
+                continue
+            
+            await websocket.send_json(event)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        publish_events.unsubscribe(user_id, queue)
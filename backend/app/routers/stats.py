@@ -1,67 +1,164 @@
-from typing import List
-from fastapi import APIRouter, Depends
-from datetime import datetime
+from typing import List, Literal, Optional
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
+from datetime import datetime, timedelta
 
-from app.schemas.post import DashboardStats, Activity
+from app.schemas.post import DashboardStats, Activity, TimeSeries, TimeSeriesPoint
+from app.schemas.engagement import PlatformEngagementPercentiles, PostEngagement, BestTimes
+from app.database import analytics_collection
 from app.models.user import User
 from app.models.post import Post, PublishResult
 from app.services.auth_service import get_current_user
+from app.services.best_time_service import BestTimeService
+from app.services.engagement_service import EngagementService
+from app.services.stats_service import StatsService
+from app.utils.dates import to_utc_naive
+from app.utils.pagination import set_next_cursor
+from app.utils.queries import NEWEST_FIRST, results_filter
 
 router = APIRouter(prefix="/stats", tags=["Statistics"])
 
+# Only the fields needed to build an Activity item
+ACTIVITY_PROJECTION = {"platform_id": 1, "status": 1, "created_at": 1, "updated_at": 1}
+
+# Upper bound on buckets returned by a single time-series request
+MAX_TIMESERIES_POINTS = 24 * 400
+
 
 @router.get("/dashboard", response_model=DashboardStats)
 async def get_dashboard_stats(current_user: User = Depends(get_current_user)):
     """Get dashboard statistics for the current user."""
-    # Count posts
-    total_posts = await Post.find(
-        Post.user_id == str(current_user.id)
-    ).count()
-    
-    # Count publish results by status
-    all_results = await PublishResult.find(
-        PublishResult.user_id == str(current_user.id)
-    ).to_list()
-    
-    published_count = sum(1 for r in all_results if r.status == "published")
-    failed_count = sum(1 for r in all_results if r.status == "failed")
-    pending_count = sum(1 for r in all_results if r.status in ["pending", "in_progress"])
-    
-    total_results = len(all_results)
-    success_rate = round((published_count / total_results) * 100) if total_results > 0 else 0
-    
-    return DashboardStats(
-        totalPosts=total_posts,
-        publishedCount=published_count,
-        failedCount=failed_count,
-        pendingCount=pending_count,
-        successRate=success_rate,
-    )
+    counts = await StatsService.get_dashboard_counts(str(current_user.id))
+    
+    return DashboardStats(**counts)
 
 
 @router.get("/activity", response_model=List[Activity])
-async def get_recent_activity(current_user: User = Depends(get_current_user)):
-    """Get recent activity for the current user."""
-    # Get recent publish results
-    results = await PublishResult.find(
-        PublishResult.user_id == str(current_user.id)
-    ).sort(-PublishResult.created_at).limit(10).to_list()
+async def get_recent_activity(
+    response: Response,
+    limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header"),
+    current_user: User = Depends(get_current_user)
+):
+    """Get recent activity for the current user, newest first.
+    
+    Keyset-paginated on (created_at, _id); pass the X-Next-Cursor response
+    header back as `cursor` to fetch the next page. Covers results not yet
+    archived; the publish-results export includes archived ones too.
+    """
+    query = results_filter(str(current_user.id), cursor=cursor)
+    
+    # Fetch one extra row to know whether another page exists
+    rows = await analytics_collection(PublishResult).find(
+        query, ACTIVITY_PROJECTION
+    ).sort(NEWEST_FIRST).limit(limit + 1).to_list(length=limit + 1)
+    rows = set_next_cursor(response, rows, limit)
     
     activities = []
-    for result in results:
-        activity_type = "publish_success" if result.status == "published" else "publish_failed"
-        message = (
-            f"Post published to {result.platform_id}"
-            if result.status == "published"
-            else f"Failed to publish to {result.platform_id}"
-        )
+    for row in rows:
+        published = row["status"] == "published"
+        timestamp = row.get("updated_at") or row["created_at"]
         
         activities.append(Activity(
-            id=str(result.id),
-            type=activity_type,
-            platformId=result.platform_id,
-            message=message,
-            timestamp=result.updated_at.isoformat() if result.updated_at else result.created_at.isoformat(),
+            id=str(row["_id"]),
+            type="publish_success" if published else "publish_failed",
+            platformId=row["platform_id"],
+            message=(
+                f"Post published to {row['platform_id']}"
+                if published
+                else f"Failed to publish to {row['platform_id']}"
+            ),
+            timestamp=timestamp.isoformat(),
         ))
     
     return activities
+
+
+@router.get("/timeseries", response_model=TimeSeries)
+async def get_timeseries(
+    from_: Optional[datetime] = Query(None, alias="from"),
+    to: Optional[datetime] = Query(None),
+    granularity: Literal["hour", "day"] = Query("day"),
+    platform: Optional[str] = Query(None),
+    current_user: User = Depends(get_current_user)
+):
+    """Get publish volume and failure rate over time from pre-aggregated rollups."""
+    end = to_utc_naive(to) if to else datetime.utcnow()
+    start = to_utc_naive(from_) if from_ else end - timedelta(days=30)
+    
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must be before 'to'"
+        )
+    
+    step = timedelta(days=1) if granularity == "day" else timedelta(hours=1)
+    if (end - start) / step > MAX_TIMESERIES_POINTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range too large for {granularity} granularity"
+        )
+    
+    points = await StatsService.get_timeseries(
+        str(current_user.id), start, end, granularity, platform
+    )
+    
+    series = []
+    for point in points:
+        total = point["published"] + point["failed"]
+        series.append(TimeSeriesPoint(
+            timestamp=point["timestamp"].isoformat(),
+            published=point["published"],
+            failed=point["failed"],
+            total=total,
+            failureRate=round(point["failed"] / total, 4) if total > 0 else 0.0,
+        ))
+    
+    return TimeSeries(granularity=granularity, platformId=platform, points=series)
+
+
+@router.get("/engagement/platforms", response_model=List[PlatformEngagementPercentiles])
+async def get_platform_engagement(
+    from_: Optional[datetime] = Query(None, alias="from"),
+    current_user: User = Depends(get_current_user)
+):
+    """Get engagement percentiles (p50/p90/p99) across the user's posts per platform."""
+    since = to_utc_naive(from_) if from_ else None
+    summaries = await EngagementService.platform_percentiles(str(current_user.id), since)
+    
+    return [PlatformEngagementPercentiles(**summary) for summary in summaries]
+
+
+@router.get("/engagement/posts/{post_id}", response_model=PostEngagement)
+async def get_post_engagement(
+    post_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Get a post's latest engagement and its percentile rank among the user's posts."""
+    post = await Post.get_for_user(post_id, str(current_user.id))
+    
+    if not post or post.deleted_at:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Post not found"
+        )
+    
+    platforms = await EngagementService.post_engagement(str(current_user.id), post_id)
+    
+    return PostEngagement(postId=post_id, platforms=platforms)
+
+
+@router.get("/best-times", response_model=BestTimes)
+async def get_best_times(
+    platform: Optional[str] = Query(None),
+    utc_offset_minutes: int = Query(0, alias="utcOffsetMinutes", ge=-14 * 60, le=14 * 60),
+    limit: int = Query(10, ge=1, le=168),
+    current_user: User = Depends(get_current_user)
+):
+    """Get weekday/hour slots ranked for posting, from the user's publish history.
+    
+    Slots are ranked by engagement where samples exist, otherwise by past
+    publishing. Times are in UTC unless utcOffsetMinutes is given.
+    """
+    profile = await BestTimeService.get_profile(str(current_user.id), platform)
+    
+    return BestTimes(**BestTimeService.rank_slots(profile, utc_offset_minutes, limit))
@@ -0,0 +1,34 @@
+from typing import Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class ProfileStart(BaseModel):
+    """Schema for starting a profiling session.
+    
+    Without route, header or includePublish every thread is sampled for
+    the whole session; with any of them, only matching requests and
+    publishes are.
+    """
+    seconds: int = Field(30, ge=1)
+    intervalMs: float = Field(10, ge=1, le=1000)  # Time between samples
+    format: Literal["speedscope", "collapsed"] = "speedscope"
+    route: Optional[str] = None  # Route template (e.g. "/posts/{post_id}") or path prefix
+    header: Optional[str] = None  # Header name, or "Name: value"
+    includePublish: bool = False  # Also sample background publish_to_platforms calls
+
+
+class ProfileSessionResponse(BaseModel):
+    """Schema for a profiling session."""
+    id: str
+    status: str
+    startedAt: str
+    finishedAt: Optional[str] = None
+    seconds: float
+    intervalMs: float
+    format: str
+    route: Optional[str] = None
+    header: Optional[str] = None
+    includePublish: bool
+    samples: int
+    error: Optional[str] = None
+    worker: str
@@ -0,0 +1,49 @@
+from typing import Optional, List
+from pydantic import BaseModel
+
+
+class EngagementMetrics(BaseModel):
+    """Schema for a set of engagement metric values (None if not reported)."""
+    likes: Optional[float] = None
+    shares: Optional[float] = None
+    comments: Optional[float] = None
+    impressions: Optional[float] = None
+
+
+class PlatformEngagementPercentiles(BaseModel):
+    """Schema for engagement percentiles across a user's posts on a platform."""
+    platformId: str
+    sampleCount: int
+    p50: EngagementMetrics
+    p90: EngagementMetrics
+    p99: EngagementMetrics
+
+
+class PostPlatformEngagement(BaseModel):
+    """Schema for a post's latest engagement on one platform."""
+    platformId: str
+    sampledAt: str
+    metrics: EngagementMetrics
+    percentileRank: EngagementMetrics  # 0-100 relative to the user's other posts
+
+
+class PostEngagement(BaseModel):
+    """Schema for a post's engagement across platforms."""
+    postId: str
+    platforms: List[PostPlatformEngagement]
+
+
+class BestTimeSlot(BaseModel):
+    """Schema for a recommended weekday/hour posting slot."""
+    weekday: int  # 0 = Monday
+    hour: int
+    score: float  # 0-1, relative to the best slot
+    posts: int  # Posts published in this slot
+
+
+class BestTimes(BaseModel):
+    """Schema for ranked posting-time recommendations."""
+    platformId: Optional[str] = None
+    basis: str  # "engagement" or "history"
+    sampleSize: int
+    slots: List[BestTimeSlot]
@@ -1,6 +1,6 @@
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class PostCreate(BaseModel):
@@ -24,6 +24,41 @@ class PostResponse(BaseModel):
     status: str
 
 
+class PostSearchResult(PostResponse):
+    """Schema for a caption search hit."""
+    score: float
+
+
+class PostBulkDelete(BaseModel):
+    """Schema for deleting posts by id and/or filter."""
+    ids: Optional[List[str]] = Field(None, max_length=1000)
+    status: Optional[str] = None
+    platform: Optional[str] = None
+    createdFrom: Optional[datetime] = None
+    createdTo: Optional[datetime] = None
+    soft: bool = False  # Hide now, purge after the retention period
+
+
+class PostDeleteResult(BaseModel):
+    """Schema for the outcome of a post deletion."""
+    posts: int
+    publishResults: int
+
+
+class PostImportError(BaseModel):
+    """Schema for a rejected row in a post import."""
+    row: int
+    message: str
+
+
+class PostImportReport(BaseModel):
+    """Schema for the outcome of a post import."""
+    imported: int
+    failed: int
+    errors: List[PostImportError]
+    errorsTruncated: bool = False
+
+
 class PublishRequest(BaseModel):
     """Schema for publishing a post."""
     post_id: str
@@ -57,3 +92,19 @@ class Activity(BaseModel):
     platformId: Optional[str] = None
     message: str
     timestamp: str
+
+
+class TimeSeriesPoint(BaseModel):
+    """Schema for a single time-series bucket."""
+    timestamp: str
+    published: int
+    failed: int
+    total: int
+    failureRate: float
+
+
+class TimeSeries(BaseModel):
+    """Schema for publish analytics over time."""
+    granularity: str
+    platformId: Optional[str] = None
+    points: List[TimeSeriesPoint]
@@ -2,16 +2,34 @@ from app.services.auth_service import (
     create_access_token,
     verify_password,
     get_password_hash,
+    verify_password_async,
+    get_password_hash_async,
     get_current_user,
 )
 from app.services.oauth_service import OAuthService
 from app.services.platform_service import PlatformService
+from app.services.stats_service import StatsService
+from app.services.post_service import PostService
+from app.services.archive_service import ArchiveService
+from app.services.import_service import ImportService
+from app.services.engagement_service import EngagementService
+from app.services.best_time_service import BestTimeService
+from app.services.health_service import HealthService
 
 __all__ = [
     "create_access_token",
     "verify_password",
     "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
     "get_current_user",
     "OAuthService",
     "PlatformService",
+    "StatsService",
+    "PostService",
+    "ArchiveService",
+    "ImportService",
+    "EngagementService",
+    "BestTimeService",
+    "HealthService",
 ]
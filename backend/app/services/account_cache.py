@@ -0,0 +1,58 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from app.config import get_settings
+from app.models.account import ConnectedAccount
+from app.utils.queries import active_accounts_filter
+
+settings = get_settings()
+
+
+class AccountCache:
+    """Per-worker cache of each user's active connected accounts, keyed by platform.
+
+    A user's accounts are loaded with one query and reused by the publish
+    path until the entry expires. Changes made through this worker
+    invalidate the entry immediately; other workers pick them up once
+    their entry expires, after at most ttl_seconds. Cached documents are
+    shared between requests and must not be modified.
+    """
+
+    def __init__(self, ttl_seconds: float, max_users: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, ConnectedAccount]]]" = OrderedDict()
+        self._generation = 0  # Bumped by every invalidation
+
+    async def get_active(self, user_id: str) -> Dict[str, ConnectedAccount]:
+        """Get a user's active accounts by platform ID, loading them on a miss."""
+        now = time.monotonic()
+        entry = self._entries.get(user_id)
+        if entry and entry[0] > now:
+            self._entries.move_to_end(user_id)
+            return entry[1]
+
+        # An invalidation while the query runs means the result may be stale; don't store it
+        generation = self._generation
+        accounts = await ConnectedAccount.find(active_accounts_filter(user_id)).to_list()
+        by_platform = {account.platform_id: account for account in accounts}
+
+        if self._generation == generation:
+            self._entries[user_id] = (now + self.ttl_seconds, by_platform)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_users:
+                self._entries.popitem(last=False)
+        return by_platform
+
+    async def resolve(self, user_id: str, platform_id: str) -> Optional[ConnectedAccount]:
+        """Get the user's active account on a platform, if connected."""
+        return (await self.get_active(user_id)).get(platform_id)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's cached accounts after they are connected, changed or removed."""
+        self._entries.pop(user_id, None)
+        self._generation += 1
+
+
+account_cache = AccountCache(settings.account_cache_ttl_seconds, settings.account_cache_max_users)
@@ -0,0 +1,207 @@
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from app.config import get_settings
+from app.models.archive import PublishResultArchive
+from app.models.post import PublishResult
+from app.services.stats_service import TERMINAL_STATUSES, bucket_start
+from app.utils.queries import (
+    LEAST_RECENTLY_UPDATED,
+    archivable_results_filter,
+    archived_post_filter,
+    archived_results_filter,
+)
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Hot results moved per pass
+ARCHIVE_BATCH_SIZE = 1000
+
+# Rows per archive document; keeps buckets far below the 16 MB document limit
+ARCHIVE_BUCKET_SIZE = 500
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def archive_row(doc: dict) -> dict:
+    """Compact a raw publish result into an archive row, omitting None fields."""
+    row = {
+        "_id": doc["_id"],
+        "i": ObjectId(doc["post_id"]),
+        "s": doc["status"],
+        "t": doc.get("published_at") or doc["updated_at"],
+        "c": doc["created_at"],
+        "g": doc.get("progress", 0),
+        "l": doc.get("post_url"),
+        "x": doc.get("platform_post_id"),
+        "e": doc.get("error"),
+    }
+    return {key: value for key, value in row.items() if value is not None}
+
+
+def row_status_counts(rows: List[dict]) -> Dict[str, int]:
+    """Count archive rows by status."""
+    counts: Dict[str, int] = defaultdict(int)
+    for row in rows:
+        counts[row["s"]] += 1
+    return dict(counts)
+
+
+class ArchiveService:
+    """Service for moving old publish results into the compact archive collection."""
+
+    @classmethod
+    async def archive_results(cls) -> int:
+        """Move terminal results last updated before the retention cutoff into archive buckets.
+
+        Results stay counted in the dashboard counters and rollups, which
+        read the archive as well. A result is deleted from publish_results
+        only once its row is confirmed in the archive, and rows already
+        archived by an interrupted pass are not written again. Returns the
+        number of results archived.
+        """
+        # Results still inside the engagement window are never archived
+        days = max(settings.result_archive_after_days, settings.engagement_lookback_days)
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        query = archivable_results_filter(TERMINAL_STATUSES, cutoff)
+        hot = PublishResult.get_motor_collection()
+        archive = PublishResultArchive.get_motor_collection()
+        archived = 0
+
+        while True:
+            batch = await hot.find(query).sort(LEAST_RECENTLY_UPDATED).limit(ARCHIVE_BATCH_SIZE).to_list(
+                length=ARCHIVE_BATCH_SIZE
+            )
+            if not batch:
+                break
+
+            result_ids = [doc["_id"] for doc in batch]
+            user_ids = list({doc["user_id"] for doc in batch})
+            already_archived = await cls._archived_ids(user_ids, result_ids)
+
+            buckets: Dict[Tuple[str, str, datetime], List[dict]] = defaultdict(list)
+            for doc in batch:
+                if doc["_id"] in already_archived:
+                    continue
+                row = archive_row(doc)
+                buckets[(doc["user_id"], doc["platform_id"], bucket_start(row["t"], "day"))].append(row)
+
+            documents = []
+            for (user_id, platform_id, day), rows in buckets.items():
+                for start in range(0, len(rows), ARCHIVE_BUCKET_SIZE):
+                    chunk = rows[start:start + ARCHIVE_BUCKET_SIZE]
+                    documents.append({
+                        "_id": min(row["_id"] for row in chunk),
+                        "u": user_id,
+                        "p": platform_id,
+                        "d": day,
+                        "n": len(chunk),
+                        "c": row_status_counts(chunk),
+                        "r": chunk,
+                    })
+
+            if documents:
+                try:
+                    await archive.insert_many(documents, ordered=False)
+                except BulkWriteError as error:
+                    if any(e["code"] != DUPLICATE_KEY_ERROR for e in error.details["writeErrors"]):
+                        raise
+
+            # A bucket dropped as a duplicate may not hold every row it was built from
+            confirmed = list(await cls._archived_ids(user_ids, result_ids))
+
+            # Only delete results that were not republished since they were read
+            deleted = await hot.delete_many({"_id": {"$in": confirmed}, **query})
+            archived += deleted.deleted_count
+            if deleted.deleted_count < len(confirmed):
+                live = await hot.find({"_id": {"$in": confirmed}}, {"_id": 1}).to_list(length=None)
+                await cls._remove_rows("_id", [doc["_id"] for doc in live])
+
+            # Rows left unconfirmed are retried on the next scheduled pass
+            if len(batch) < ARCHIVE_BATCH_SIZE or not deleted.deleted_count:
+                break
+
+        if archived:
+            logger.info("Archived %d publish results", archived)
+        return archived
+
+    @staticmethod
+    async def _archived_ids(user_ids: List[str], result_ids: List[ObjectId]) -> Set[ObjectId]:
+        """Return which of the given results already have a row in the archive."""
+        found: Set[ObjectId] = set()
+        wanted = set(result_ids)
+        async for bucket in PublishResultArchive.get_motor_collection().find(
+            archived_results_filter(user_ids, result_ids), {"r._id": 1}
+        ):
+            found.update(row["_id"] for row in bucket["r"] if row["_id"] in wanted)
+        return found
+
+    @classmethod
+    async def _remove_rows(
+        cls, key: str, values: list, user_id: Optional[str] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """Remove archive rows whose key is in values, rewriting or dropping their buckets.
+
+        Returns the removed rows counted by user and status.
+        """
+        removed: Dict[str, Dict[str, int]] = {}
+        if not values:
+            return removed
+
+        archive = PublishResultArchive.get_motor_collection()
+        query: Dict = {f"r.{key}": {"$in": values}}
+        if user_id:
+            query["u"] = user_id
+        matched = set(values)
+
+        async for bucket in archive.find(query):
+            kept = [row for row in bucket["r"] if row[key] not in matched]
+            counts = removed.setdefault(bucket["u"], {})
+            for status, count in row_status_counts([row for row in bucket["r"] if row[key] in matched]).items():
+                counts[status] = counts.get(status, 0) + count
+
+            if kept:
+                await archive.update_one(
+                    {"_id": bucket["_id"]},
+                    {"$set": {"r": kept, "n": len(kept), "c": row_status_counts(kept)}},
+                )
+            else:
+                await archive.delete_one({"_id": bucket["_id"]})
+
+        return removed
+
+    @classmethod
+    async def remove_posts(cls, user_id: str, post_ids: List[ObjectId]) -> Dict[str, int]:
+        """Remove a user's archived results for the given posts; returns the removed counts by status."""
+        return (await cls._remove_rows("i", post_ids, user_id)).get(user_id, {})
+
+    @classmethod
+    async def post_results(cls, user_id: str, post_id: str) -> List[dict]:
+        """Get a post's archived results in API response format, newest first."""
+        if not ObjectId.is_valid(post_id):
+            return []
+
+        rows = []
+        async for bucket in PublishResultArchive.get_motor_collection().find(
+            archived_post_filter(user_id, post_id)
+        ):
+            for row in bucket["r"]:
+                if str(row["i"]) != post_id:
+                    continue
+                rows.append((row["t"], {
+                    "postId": post_id,
+                    "platformId": bucket["p"],
+                    "status": row["s"],
+                    "progress": row.get("g", 0),
+                    "publishedAt": row["t"].isoformat() if row["s"] == "published" else None,
+                    "postUrl": row.get("l"),
+                    "error": row.get("e"),
+                }))
+
+        rows.sort(key=lambda item: item[0], reverse=True)
+        return [response for _, response in rows]
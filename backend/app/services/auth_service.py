@@ -3,10 +3,13 @@ from typing import Optional
 import bcrypt
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.config import get_settings
 from app.models.user import User
+from app.services.rate_limit_service import hash_admission
+from app.utils.metrics import PASSWORD_HASH_SECONDS
 
 settings = get_settings()
 
@@ -19,7 +22,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     # Truncate to 72 bytes (bcrypt limit)
     password_bytes = plain_password.encode('utf-8')[:72]
     hashed_bytes = hashed_password.encode('utf-8')
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    with PASSWORD_HASH_SECONDS.labels("verify").time():
+        return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
 def get_password_hash(password: str) -> str:
@@ -27,10 +31,23 @@ def get_password_hash(password: str) -> str:
     # Truncate to 72 bytes (bcrypt limit)
     password_bytes = password.encode('utf-8')[:72]
     salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
+    with PASSWORD_HASH_SECONDS.labels("hash").time():
+        hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password in the threadpool, subject to hashing admission control."""
+    async with hash_admission.slot():
+        return await run_in_threadpool(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in the threadpool, subject to hashing admission control."""
+    async with hash_admission.slot():
+        return await run_in_threadpool(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -55,6 +72,20 @@ def decode_token(token: str) -> Optional[dict]:
         return None
 
 
+async def get_user_from_token(token: str) -> Optional[User]:
+    """Resolve the user for a JWT token, or None if the token is invalid."""
+    payload = decode_token(token)
+    
+    if payload is None:
+        return None
+    
+    user_id: str = payload.get("sub")
+    if user_id is None:
+        return None
+    
+    return await User.get(user_id)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> User:
@@ -65,17 +96,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    token = credentials.credentials
-    payload = decode_token(token)
-    
-    if payload is None:
-        raise credentials_exception
-    
-    user_id: str = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
-    
-    user = await User.get(user_id)
+    user = await get_user_from_token(credentials.credentials)
     if user is None:
         raise credentials_exception
     
@@ -89,3 +110,15 @@ async def get_current_active_user(
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+async def get_current_admin_user(
+    current_user: User = Depends(get_current_user)
+) -> User:
+    """Get the current user, requiring admin rights."""
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+    return current_user
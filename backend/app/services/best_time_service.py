@@ -0,0 +1,209 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from bson import ObjectId
+import numpy as np
+from pymongo import ReplaceOne
+
+from app.config import get_settings
+from app.models.archive import PublishResultArchive
+from app.models.post import PublishResult
+from app.models.stats import BestTimeProfile
+from app.services.engagement_service import EngagementService
+from app.utils.queries import archived_results_filter, best_time_profile_filter, published_slots_pipeline
+
+settings = get_settings()
+
+ALL_PLATFORMS = "*"
+SLOTS = 7 * 24
+
+# Weight of the user's overall mean when shrinking sparse slots towards it
+PRIOR_STRENGTH = 3.0
+
+# Circular smoothing kernel over neighbouring hours (previous, same, next)
+SMOOTHING_KERNEL = (0.25, 0.5, 0.25)
+
+
+def slot_index(timestamp: datetime) -> int:
+    """Map a UTC timestamp to its weekday * 24 + hour slot (Monday = 0)."""
+    return timestamp.weekday() * 24 + timestamp.hour
+
+
+def engagement_score(sample: dict) -> float:
+    """Collapse an engagement sample into a single interaction count."""
+    return float(sum(sample.get(metric) or 0 for metric in ("likes", "comments", "shares")))
+
+
+class BestTimeService:
+    """Service for recommending weekday/hour posting slots from publish history."""
+
+    @classmethod
+    async def record_published(cls, user_id: str, platform_id: str, published_at: datetime) -> None:
+        """Count a newly published result in the user's existing profiles.
+
+        Profiles that have not been built yet are left alone; they are
+        built in full from history on first read.
+        """
+        await cls._count(user_id, platform_id, published_at, 1)
+
+    @classmethod
+    async def record_unpublished(cls, user_id: str, platform_id: str, published_at: datetime) -> None:
+        """Uncount a published result that is being reset to publish again.
+
+        A rebuild counts each result once, at its latest publish time, so
+        a republished result must leave its previous slot.
+        """
+        await cls._count(user_id, platform_id, published_at, -1)
+
+    @staticmethod
+    async def _count(user_id: str, platform_id: str, published_at: datetime, delta: int) -> None:
+        slot = slot_index(published_at)
+        await BestTimeProfile.get_motor_collection().update_many(
+            {"user_id": user_id, "platform_id": {"$in": [platform_id, ALL_PLATFORMS]}},
+            {"$inc": {f"post_counts.{slot}": delta}},
+        )
+
+    @staticmethod
+    def _platform_masks(platforms: np.ndarray) -> Dict[str, np.ndarray]:
+        """Row masks for each platform plus the all-platforms profile."""
+        masks = {ALL_PLATFORMS: np.ones(len(platforms), dtype=bool)}
+        masks.update({str(p): platforms == p for p in np.unique(platforms)})
+        return masks
+
+    @classmethod
+    async def rebuild(cls, user_id: str) -> Dict[str, BestTimeProfile]:
+        """Rebuild all of a user's profiles from publish history and engagement."""
+        now = datetime.utcnow()
+        post_counts: Dict[str, np.ndarray] = defaultdict(lambda: np.zeros(SLOTS, dtype=np.int64))
+        engagement_sums: Dict[str, np.ndarray] = defaultdict(lambda: np.zeros(SLOTS))
+        engaged_posts: Dict[str, np.ndarray] = defaultdict(lambda: np.zeros(SLOTS, dtype=np.int64))
+
+        # Publish volume per (platform, weekday, hour), grouped server-side
+        rows = await PublishResult.get_motor_collection().aggregate(
+            published_slots_pipeline(user_id, PublishResultArchive.get_settings().name)
+        ).to_list(length=None)
+
+        if rows:
+            platforms = np.array([row["_id"]["platform_id"] for row in rows])
+            slots = ((np.array([row["_id"]["dow"] for row in rows]) + 5) % 7) * 24 \
+                + np.array([row["_id"]["hour"] for row in rows])
+            counts = np.array([row["count"] for row in rows])
+
+            for platform_id, mask in cls._platform_masks(platforms).items():
+                np.add.at(post_counts[platform_id], slots[mask], counts[mask])
+
+        # Engagement per slot from each result's latest sample
+        samples = await EngagementService.latest_samples(user_id)
+        if samples:
+            result_ids = [ObjectId(sample["_id"]) for sample in samples]
+            published = await PublishResult.get_motor_collection().find(
+                {"user_id": user_id, "_id": {"$in": result_ids}},
+                {"published_at": 1},
+            ).to_list(length=None)
+            published_at = {str(row["_id"]): row.get("published_at") for row in published}
+
+            # Results no longer in the hot collection have been archived
+            archived_ids = [result_id for result_id in result_ids if str(result_id) not in published_at]
+            if archived_ids:
+                archived = PublishResultArchive.get_motor_collection().aggregate([
+                    {"$match": archived_results_filter([user_id], archived_ids)},
+                    {"$unwind": "$r"},
+                    {"$match": {"r._id": {"$in": archived_ids}, "r.s": "published"}},
+                    {"$project": {"_id": "$r._id", "published_at": "$r.t"}},
+                ])
+                async for row in archived:
+                    published_at[str(row["_id"])] = row["published_at"]
+
+            engaged = [s for s in samples if published_at.get(s["_id"])]
+            if engaged:
+                platforms = np.array([s["platform_id"] for s in engaged])
+                slots = np.array([slot_index(published_at[s["_id"]]) for s in engaged])
+                scores = np.array([engagement_score(s) for s in engaged])
+
+                for platform_id, mask in cls._platform_masks(platforms).items():
+                    np.add.at(engagement_sums[platform_id], slots[mask], scores[mask])
+                    np.add.at(engaged_posts[platform_id], slots[mask], 1)
+
+        profiles = {
+            platform_id: BestTimeProfile(
+                user_id=user_id,
+                platform_id=platform_id,
+                post_counts=post_counts[platform_id].tolist(),
+                engagement_sums=engagement_sums[platform_id].tolist(),
+                engaged_posts=engaged_posts[platform_id].tolist(),
+                built_at=now,
+            )
+            for platform_id in set(post_counts) | {ALL_PLATFORMS}
+        }
+
+        collection = BestTimeProfile.get_motor_collection()
+        await collection.delete_many({"user_id": user_id, "platform_id": {"$nin": list(profiles)}})
+        await collection.bulk_write([
+            ReplaceOne(
+                {"user_id": user_id, "platform_id": platform_id},
+                profile.model_dump(exclude={"id", "revision_id"}),
+                upsert=True,
+            )
+            for platform_id, profile in profiles.items()
+        ], ordered=False)
+
+        return profiles
+
+    @classmethod
+    async def get_profile(cls, user_id: str, platform_id: Optional[str]) -> BestTimeProfile:
+        """Get a cached profile, rebuilding it when missing or when engagement is stale."""
+        platform_key = platform_id or ALL_PLATFORMS
+        profile = await BestTimeProfile.find_one(best_time_profile_filter(user_id, platform_key))
+
+        max_age = timedelta(hours=settings.best_times_rebuild_hours)
+        if profile and profile.built_at > datetime.utcnow() - max_age:
+            return profile
+
+        profiles = await cls.rebuild(user_id)
+        return profiles.get(platform_key) or BestTimeProfile(user_id=user_id, platform_id=platform_key)
+
+    @staticmethod
+    def rank_slots(profile: BestTimeProfile, utc_offset_minutes: int = 0, limit: int = 10) -> dict:
+        """Rank weekday/hour slots by smoothed engagement, or by publish history if none."""
+        posts = np.asarray(profile.post_counts, dtype=float)
+        engaged = np.asarray(profile.engaged_posts, dtype=float)
+        sums = np.asarray(profile.engagement_sums, dtype=float)
+
+        if engaged.sum() > 0:
+            basis = "engagement"
+            # Shrink sparse slots towards the overall mean engagement per post
+            prior = sums.sum() / engaged.sum()
+            raw = (sums + PRIOR_STRENGTH * prior) / (engaged + PRIOR_STRENGTH)
+            sample_size = int(engaged.sum())
+        else:
+            basis = "history"
+            raw = posts
+            sample_size = int(posts.sum())
+
+        # Circular smoothing across neighbouring hours, wrapping Sunday into Monday
+        before, same, after = SMOOTHING_KERNEL
+        scores = before * np.roll(raw, 1) + same * raw + after * np.roll(raw, -1)
+
+        # Express slots in the caller's local time
+        shift = round(utc_offset_minutes / 60)
+        scores = np.roll(scores, shift)
+        posts = np.roll(posts, shift)
+
+        if scores.max() > 0:
+            scores = scores / scores.max()
+
+        top = np.argsort(-scores, kind="stable")[:limit] if sample_size else np.array([], dtype=int)
+        return {
+            "platformId": None if profile.platform_id == ALL_PLATFORMS else profile.platform_id,
+            "basis": basis,
+            "sampleSize": sample_size,
+            "slots": [
+                {
+                    "weekday": int(slot // 24),
+                    "hour": int(slot % 24),
+                    "score": round(float(scores[slot]), 4),
+                    "posts": int(posts[slot]),
+                }
+                for slot in top
+            ],
+        }
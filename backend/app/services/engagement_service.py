@@ -0,0 +1,179 @@
+import logging
+import warnings
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+import httpx
+import numpy as np
+
+from app.config import get_settings
+from app.database import analytics_collection
+from app.models.engagement import EngagementMeta, EngagementSample
+from app.models.post import PublishResult
+from app.services.account_cache import account_cache
+from app.services.http_client import upstream_http
+from app.services.platform_service import PlatformService
+from app.utils.queries import engagement_ingest_filter
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+METRICS = ("likes", "shares", "comments", "impressions")
+PERCENTILES = (50, 90, 99)
+
+
+class EngagementService:
+    """Service for ingesting and analysing post engagement metrics."""
+
+    @classmethod
+    async def ingest_recent(cls) -> int:
+        """Sample engagement for recently published results.
+
+        Results are grouped by (user, platform) so each connected account
+        is loaded once and its posts are fetched through the platform's
+        batch endpoint. Returns the number of samples stored.
+        """
+        since = datetime.utcnow() - timedelta(days=settings.engagement_lookback_days)
+
+        groups: Dict[Tuple[str, str], List[dict]] = defaultdict(list)
+        cursor = PublishResult.get_motor_collection().find(
+            engagement_ingest_filter(since),
+            {"user_id": 1, "post_id": 1, "platform_id": 1, "platform_post_id": 1},
+        ).batch_size(1000)
+        async for row in cursor:
+            groups[(row["user_id"], row["platform_id"])].append(row)
+
+        stored = 0
+        client = upstream_http.client
+        for (user_id, platform_id), rows in groups.items():
+            account = await account_cache.resolve(user_id, platform_id)
+            if not account:
+                continue
+
+            try:
+                metrics = await PlatformService.fetch_engagement(
+                    client, account, [row["platform_post_id"] for row in rows]
+                )
+            except httpx.HTTPError:
+                logger.warning("Engagement fetch failed for %s/%s", user_id, platform_id)
+                continue
+
+            now = datetime.utcnow()
+            samples = [
+                EngagementSample(
+                    ts=now,
+                    meta=EngagementMeta(
+                        user_id=user_id,
+                        post_id=row["post_id"],
+                        result_id=str(row["_id"]),
+                        platform_id=platform_id,
+                    ),
+                    **metrics[row["platform_post_id"]],
+                )
+                for row in rows
+                if row["platform_post_id"] in metrics
+            ]
+            if samples:
+                await EngagementSample.insert_many(samples)
+                stored += len(samples)
+
+        logger.info("Stored %d engagement samples", stored)
+        return stored
+
+    @classmethod
+    async def latest_samples(
+        cls, user_id: str, since: Optional[datetime] = None
+    ) -> List[dict]:
+        """Get the most recent sample of each of a user's published results."""
+        match: Dict = {"meta.user_id": user_id}
+        if since:
+            match["ts"] = {"$gte": since}
+
+        pipeline = [
+            {"$match": match},
+            {"$sort": {"meta.result_id": 1, "ts": -1}},
+            {"$group": {
+                "_id": "$meta.result_id",
+                "post_id": {"$first": "$meta.post_id"},
+                "platform_id": {"$first": "$meta.platform_id"},
+                "ts": {"$first": "$ts"},
+                **{metric: {"$first": f"${metric}"} for metric in METRICS},
+            }},
+        ]
+
+        return await analytics_collection(EngagementSample).aggregate(
+            pipeline, allowDiskUse=True
+        ).to_list(length=None)
+
+    @staticmethod
+    def _matrix(rows: List[dict]) -> np.ndarray:
+        """Build an (n_posts, n_metrics) float matrix; missing metrics become NaN."""
+        return np.array(
+            [[np.nan if row.get(metric) is None else row[metric] for metric in METRICS] for row in rows],
+            dtype=float,
+        ).reshape(len(rows), len(METRICS))
+
+    @staticmethod
+    def _metrics_dict(values: np.ndarray) -> Dict[str, Optional[float]]:
+        return {
+            metric: None if np.isnan(value) else round(float(value), 2)
+            for metric, value in zip(METRICS, values)
+        }
+
+    @classmethod
+    async def platform_percentiles(
+        cls, user_id: str, since: Optional[datetime] = None
+    ) -> List[dict]:
+        """Compute engagement percentiles across a user's posts for each platform."""
+        by_platform: Dict[str, List[dict]] = defaultdict(list)
+        for row in await cls.latest_samples(user_id, since):
+            by_platform[row["platform_id"]].append(row)
+
+        summaries = []
+        for platform_id, rows in sorted(by_platform.items()):
+            matrix = cls._matrix(rows)
+            # All percentiles for all metrics in one vectorized call; a metric
+            # the platform never reports is an all-NaN column and yields NaN
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                quantiles = np.nanpercentile(matrix, PERCENTILES, axis=0)
+
+            summaries.append({
+                "platformId": platform_id,
+                "sampleCount": len(rows),
+                **{f"p{p}": cls._metrics_dict(quantiles[i]) for i, p in enumerate(PERCENTILES)},
+            })
+        return summaries
+
+    @classmethod
+    async def post_engagement(cls, user_id: str, post_id: str) -> List[dict]:
+        """Get a post's latest metrics and percentile rank among the user's posts, per platform."""
+        rows = await cls.latest_samples(user_id)
+
+        by_platform: Dict[str, List[dict]] = defaultdict(list)
+        for row in rows:
+            by_platform[row["platform_id"]].append(row)
+
+        platforms = []
+        for row in rows:
+            if row["post_id"] != post_id:
+                continue
+
+            peers = cls._matrix(by_platform[row["platform_id"]])
+            values = cls._matrix([row])[0]
+
+            # Share of the user's posts on this platform scoring below this one
+            valid = ~np.isnan(peers)
+            below = ((peers < values) & valid).sum(axis=0)
+            counts = valid.sum(axis=0)
+            with np.errstate(all="ignore"):
+                ranks = np.where(counts > 0, below / counts * 100, np.nan)
+            ranks[np.isnan(values)] = np.nan
+
+            platforms.append({
+                "platformId": row["platform_id"],
+                "sampledAt": row["ts"].isoformat(),
+                "metrics": cls._metrics_dict(values),
+                "percentileRank": cls._metrics_dict(ranks),
+            })
+        return platforms
@@ -0,0 +1,160 @@
+import asyncio
+import functools
+import logging
+import signal
+import time
+from types import FrameType
+from typing import Optional
+import uvicorn
+
+from app.config import get_settings
+from app.database import analytics_read_preference, get_client
+from app.services.http_client import upstream_http
+from app.services.publish_events import publish_events
+from app.services.scheduler import scheduler
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class HealthService:
+    """Service for readiness checks and startup warm-up."""
+
+    # Set once startup warm-up completes and cleared when SIGTERM arrives
+    _ready = False
+
+    @classmethod
+    def set_ready(cls, ready: bool) -> None:
+        cls._ready = ready
+
+    @classmethod
+    def install_drain_handler(cls) -> None:
+        """Fail readiness as soon as SIGTERM arrives, then let the server shut down.
+
+        Uvicorn answers SIGTERM by closing its listening socket, so readiness
+        cleared during lifespan shutdown is never seen by a probe. This
+        wraps uvicorn's exit handler: on SIGTERM readiness fails at once and
+        the server starts shutting down SHUTDOWN_DRAIN_SECONDS later, while
+        the worker still serves the requests the load balancer sends until
+        it notices. A second SIGTERM shuts down immediately.
+
+        Uvicorn binds the handler to its signals before startup, so this
+        must run when the app module is imported.
+        """
+        handle_exit = uvicorn.Server.handle_exit
+        if getattr(handle_exit, "drains", False):
+            return
+
+        @functools.wraps(handle_exit)
+        def draining_handle_exit(server: uvicorn.Server, sig: int, frame: Optional[FrameType]) -> None:
+            if sig != signal.SIGTERM or not cls._ready:
+                handle_exit(server, sig, frame)
+                return
+            cls.set_ready(False)
+            logger.info("SIGTERM received; draining for %.1f s before shutdown", settings.shutdown_drain_seconds)
+            asyncio.get_running_loop().call_later(
+                settings.shutdown_drain_seconds, handle_exit, server, sig, frame
+            )
+
+        draining_handle_exit.drains = True
+        uvicorn.Server.handle_exit = draining_handle_exit
+
+    @classmethod
+    async def warm_up(cls) -> None:
+        """Open pooled MongoDB connections before the worker reports ready.
+
+        Concurrent pings make the driver open up to
+        MONGODB_WARMUP_CONNECTIONS connections to the primary, and to a
+        secondary through the analytics read preference, so the first
+        requests after a deploy do not wait on connection handshakes.
+        Failures are logged; the readiness check reports them.
+        """
+        client = get_client()
+        if client is None:
+            return
+
+        database = client[settings.mongodb_db_name]
+        count = settings.mongodb_warmup_connections
+        start = time.perf_counter()
+        pings = [database.command("ping") for _ in range(count)]
+        pings += [database.command("ping", read_preference=analytics_read_preference()) for _ in range(count)]
+
+        results = await asyncio.gather(*pings, return_exceptions=True)
+        failures = [result for result in results if isinstance(result, Exception)]
+        if failures:
+            logger.warning("Connection warm-up: %d of %d pings failed: %r", len(failures), len(pings), failures[0])
+        else:
+            logger.info("Warmed up MongoDB connections in %.0f ms", (time.perf_counter() - start) * 1000)
+
+    @classmethod
+    async def check_database(cls) -> dict:
+        """Ping MongoDB and describe the topology and pool configuration."""
+        client = get_client()
+        if client is None:
+            return {"status": "down", "error": "Database not initialized"}
+
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                client[settings.mongodb_db_name].command("ping"),
+                settings.health_check_timeout_seconds,
+            )
+        except Exception as error:
+            return {"status": "down", "error": repr(error)}
+
+        topology = client.topology_description
+        return {
+            "status": "ok",
+            "latencyMs": round((time.perf_counter() - start) * 1000, 1),
+            "topology": topology.topology_type_name,
+            "servers": [
+                {
+                    "address": f"{host}:{port}",
+                    "type": server.server_type_name,
+                    "roundTripMs": round(server.round_trip_time * 1000, 1) if server.round_trip_time else None,
+                }
+                for (host, port), server in topology.server_descriptions().items()
+            ],
+            "minPoolSize": client.options.pool_options.min_pool_size,
+            "maxPoolSize": client.options.pool_options.max_pool_size,
+        }
+
+    @classmethod
+    def check_scheduler(cls) -> dict:
+        """Report whether every background job's task is alive."""
+        if not settings.scheduler_enabled:
+            return {"status": "disabled"}
+
+        jobs = scheduler.status()
+        healthy = scheduler.running and all(job["running"] for job in jobs)
+        return {"status": "ok" if healthy else "down", "jobs": jobs}
+
+    @classmethod
+    def check_publish_events(cls) -> dict:
+        """Report whether this worker is tailing the shared publish event collection."""
+        if settings.publish_events_backend != "mongo":
+            return {"status": "disabled"}
+        return {"status": "ok" if publish_events.running else "down"}
+
+    @classmethod
+    async def readiness(cls) -> dict:
+        """Check every dependency; the worker is ready once warmed up and none is down.
+
+        Upstream HTTP pool state is reported but does not gate readiness,
+        since provider outages should not take the API out of rotation.
+        """
+        checks = {
+            "database": await cls.check_database(),
+            "scheduler": cls.check_scheduler(),
+            "publishEvents": cls.check_publish_events(),
+            "upstreamHttp": upstream_http.status(),
+        }
+        gating = ("database", "scheduler", "publishEvents")
+        ready = cls._ready and all(checks[name]["status"] != "down" for name in gating)
+
+        return {
+            "status": "ready" if ready else "not_ready",
+            "warmedUp": cls._ready,
+            "checks": checks,
+            "version": "1.0.0",
+        }
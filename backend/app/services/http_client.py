@@ -0,0 +1,70 @@
+import logging
+from typing import Optional
+import httpx
+
+from app.config import get_settings
+from app.utils.metrics import InstrumentedTransport
+from app.utils.tracing import TracingTransport
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class UpstreamHttpClient:
+    """Shared HTTP client for calls to platform and OAuth provider APIs.
+
+    One connection pool per worker lets requests to the same provider
+    reuse keep-alive connections instead of paying a TCP and TLS
+    handshake on every call.
+    """
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._transport: Optional[httpx.AsyncHTTPTransport] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client, created on first use if start() has not run (e.g. in scripts)."""
+        if self._client is None or self._client.is_closed:
+            self._transport = httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=settings.upstream_max_connections,
+                    max_keepalive_connections=settings.upstream_max_keepalive_connections,
+                    keepalive_expiry=settings.upstream_keepalive_expiry_seconds,
+                ),
+            )
+            transport: httpx.AsyncBaseTransport = self._transport
+            if settings.tracing_enabled:
+                transport = TracingTransport(transport)
+            if settings.metrics_enabled:
+                transport = InstrumentedTransport(transport)
+            self._client = httpx.AsyncClient(timeout=settings.upstream_timeout_seconds, transport=transport)
+        return self._client
+
+    async def start(self) -> None:
+        """Create the shared client."""
+        self.client
+
+    async def stop(self) -> None:
+        """Close the shared client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def status(self) -> dict:
+        """Report whether the client is open and how many pooled connections it holds."""
+        if self._client is None or self._client.is_closed:
+            return {"status": "closed"}
+
+        # httpx does not expose its pool; read it from the transport when available
+        pool = getattr(self._transport, "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        return {
+            "status": "ok",
+            "connections": len(connections),
+            "idle": sum(1 for connection in connections if connection.is_idle()),
+            "maxConnections": settings.upstream_max_connections,
+        }
+
+
+upstream_http = UpstreamHttpClient()
@@ -0,0 +1,206 @@
+import codecs
+import csv
+import json
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+
+from app.config import get_settings
+from app.models.post import Post
+from app.schemas.post import PostCreate
+from app.services.stats_service import StatsService
+from app.utils.dates import to_utc_naive
+
+settings = get_settings()
+
+# CSV columns holding lists, encoded as in exports (values joined by ";")
+LIST_COLUMNS = ("mediaFiles", "mediaTypes", "platforms")
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream as UTF-8 and yield it line by line, without line endings."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+
+        if len(pending) > settings.import_max_row_bytes:
+            raise ValueError("Line exceeds the maximum row size")
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+def csv_row_to_post(row: Dict[str, str]) -> dict:
+    """Convert a CSV row in the export layout to PostCreate input."""
+    data: Dict = {"caption": row.get("caption") or ""}
+    for column in LIST_COLUMNS:
+        value = row.get(column) or ""
+        data[column] = [item for item in value.split(";") if item]
+    if row.get("scheduledFor"):
+        data["scheduledFor"] = row["scheduledFor"]
+    return data
+
+
+async def iter_csv_records(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """Yield (row number, PostCreate input, error) for each CSV record after the header.
+
+    A quoted field may span physical lines, so lines are joined until the
+    record's quotes balance before it is parsed.
+    """
+    header: Optional[List[str]] = None
+    record: List[str] = []
+    record_size = 0
+    row_number = 0
+
+    async for line in lines:
+        record.append(line)
+        record_size += len(line)
+        text = "\n".join(record)
+
+        if text.count('"') % 2:
+            if record_size > settings.import_max_row_bytes:
+                row_number += 1
+                yield row_number, None, "Row exceeds the maximum row size"
+                record, record_size = [], 0
+            continue
+
+        record, record_size = [], 0
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [value.strip() for value in values]
+            if "caption" not in header:
+                raise ValueError("CSV header must include a caption column")
+            continue
+
+        row_number += 1
+        if len(values) > len(header):
+            yield row_number, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield row_number, csv_row_to_post(dict(zip(header, values))), None
+
+    if record:
+        row_number += 1
+        yield row_number, None, "Unterminated quoted field"
+
+
+async def iter_ndjson_records(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """Yield (row number, PostCreate input, error) for each non-blank NDJSON line."""
+    row_number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+
+        row_number += 1
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as error:
+            yield row_number, None, f"Invalid JSON: {error.msg}"
+            continue
+
+        if not isinstance(data, dict):
+            yield row_number, None, "Expected a JSON object"
+            continue
+        yield row_number, data, None
+
+
+def validation_message(error: ValidationError) -> str:
+    """Flatten a pydantic validation error into a single line."""
+    return "; ".join(
+        f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()
+    )
+
+
+class ImportService:
+    """Service for importing posts in bulk from streamed CSV or NDJSON uploads."""
+
+    @classmethod
+    async def _insert(cls, user_id: str, docs: List[dict]) -> int:
+        """Insert a chunk of validated posts and update the user's counters."""
+        if not docs:
+            return 0
+
+        result = await Post.get_motor_collection().insert_many(docs, ordered=False)
+        await StatsService.record_post_created(user_id, len(result.inserted_ids))
+        return len(result.inserted_ids)
+
+    @staticmethod
+    def _post_document(user_id: str, post: PostCreate) -> dict:
+        """Build a raw post document from a validated row."""
+        now = datetime.utcnow()
+        return {
+            "user_id": user_id,
+            "caption": post.caption,
+            "media_files": post.mediaFiles,
+            "media_types": post.mediaTypes,
+            "platforms": post.platforms,
+            "scheduled_for": to_utc_naive(post.scheduledFor) if post.scheduledFor else None,
+            "status": "scheduled" if post.scheduledFor and post.platforms else "draft",
+            "created_at": now,
+            "updated_at": now,
+            "deleted_at": None,
+        }
+
+    @classmethod
+    async def import_posts(cls, user_id: str, chunks: AsyncIterator[bytes], import_format: str) -> dict:
+        """Validate and insert posts as the upload streams in.
+
+        At most one insert chunk and one pending record are held in memory,
+        along with the first IMPORT_MAX_ERRORS row errors. Imported posts
+        are drafts, or scheduled when scheduledFor is set; nothing is
+        published.
+        """
+        lines = iter_lines(chunks)
+        records = iter_csv_records(lines) if import_format == "csv" else iter_ndjson_records(lines)
+
+        imported = 0
+        failed = 0
+        errors: List[dict] = []
+        chunk: List[dict] = []
+
+        def record_error(row: int, message: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < settings.import_max_errors:
+                errors.append({"row": row, "message": message})
+
+        try:
+            async for row, data, error in records:
+                if error:
+                    record_error(row, error)
+                    continue
+
+                try:
+                    post = PostCreate.model_validate(data)
+                except ValidationError as validation_error:
+                    record_error(row, validation_message(validation_error))
+                    continue
+
+                chunk.append(cls._post_document(user_id, post))
+                if len(chunk) >= settings.import_batch_size:
+                    imported += await cls._insert(user_id, chunk)
+                    chunk = []
+        except ValueError as error:
+            # Unreadable input (bad encoding, missing header, oversized line) stops the import
+            imported += await cls._insert(user_id, chunk)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{error}; import stopped after {imported} posts"
+            )
+
+        imported += await cls._insert(user_id, chunk)
+
+        return {
+            "imported": imported,
+            "failed": failed,
+            "errors": errors,
+            "errorsTruncated": failed > len(errors),
+        }
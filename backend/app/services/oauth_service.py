@@ -1,8 +1,8 @@
 from typing import Optional, Dict, Any
 from urllib.parse import urlencode
-import httpx
 
 from app.config import get_settings
+from app.services.http_client import upstream_http
 
 settings = get_settings()
 
@@ -98,12 +98,12 @@ class OAuthService:
             "grant_type": "authorization_code",
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(config["token_url"], data=data)
-            
-            if response.status_code == 200:
-                return response.json()
-            
+        client = upstream_http.client
+        response = await client.post(config["token_url"], data=data)
+        
+        if response.status_code == 200:
+            return response.json()
+        
         return None
     
     @classmethod
@@ -118,11 +118,11 @@ class OAuthService:
         
         headers = {"Authorization": f"Bearer {access_token}"}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(config["userinfo_url"], headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
+        client = upstream_http.client
+        response = await client.get(config["userinfo_url"], headers=headers)
+        
+        if response.status_code == 200:
+            return response.json()
         
         return None
     
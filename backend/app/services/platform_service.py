@@ -1,9 +1,14 @@
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+import time
+from urllib.parse import quote
 import httpx
 
 from app.config import get_settings
 from app.models.account import ConnectedAccount
+from app.services.http_client import upstream_http
+from app.utils.metrics import PUBLISH_SECONDS
+from app.utils.tracing import tracer
 
 settings = get_settings()
 
@@ -106,11 +111,11 @@ class PlatformService:
             "grant_type": "authorization_code",
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(config["token_url"], data=data)
-            
-            if response.status_code == 200:
-                return response.json()
+        client = upstream_http.client
+        response = await client.post(config["token_url"], data=data)
+        
+        if response.status_code == 200:
+            return response.json()
         
         return None
     
@@ -132,11 +137,11 @@ class PlatformService:
         
         headers = {"Authorization": f"Bearer {access_token}"}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(endpoints[platform_id], headers=headers)
-            
-            if response.status_code == 200:
-                return response.json()
+        client = upstream_http.client
+        response = await client.get(endpoints[platform_id], headers=headers)
+        
+        if response.status_code == 200:
+            return response.json()
         
         return None
     
@@ -150,21 +155,21 @@ class PlatformService:
         
         payload = {"text": content}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, headers=headers)
-            
-            if response.status_code == 201:
-                data = response.json()
-                return {
-                    "success": True,
-                    "post_url": f"https://twitter.com/i/status/{data['data']['id']}",
-                    "post_id": data["data"]["id"],
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": response.text,
-                }
+        client = upstream_http.client
+        response = await client.post(url, json=payload, headers=headers)
+        
+        if response.status_code == 201:
+            data = response.json()
+            return {
+                "success": True,
+                "post_url": f"https://twitter.com/i/status/{data['data']['id']}",
+                "post_id": data["data"]["id"],
+            }
+        else:
+            return {
+                "success": False,
+                "error": response.text,
+            }
     
     @classmethod
     async def publish_to_facebook(
@@ -179,21 +184,21 @@ class PlatformService:
             "message": content,
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, data=params)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "success": True,
-                    "post_url": f"https://facebook.com/{data['id']}",
-                    "post_id": data["id"],
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": response.text,
-                }
+        client = upstream_http.client
+        response = await client.post(url, data=params)
+        
+        if response.status_code == 200:
+            data = response.json()
+            return {
+                "success": True,
+                "post_url": f"https://facebook.com/{data['id']}",
+                "post_id": data["id"],
+            }
+        else:
+            return {
+                "success": False,
+                "error": response.text,
+            }
     
     @classmethod
     async def publish_to_linkedin(
@@ -219,22 +224,22 @@ class PlatformService:
             "visibility": {"com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"},
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, json=payload, headers=headers)
-            
-            if response.status_code == 201:
-                data = response.json()
-                post_id = data.get("id", "").replace("urn:li:share:", "")
-                return {
-                    "success": True,
-                    "post_url": f"https://linkedin.com/feed/update/urn:li:share:{post_id}",
-                    "post_id": post_id,
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": response.text,
-                }
+        client = upstream_http.client
+        response = await client.post(url, json=payload, headers=headers)
+        
+        if response.status_code == 201:
+            data = response.json()
+            post_id = data.get("id", "").replace("urn:li:share:", "")
+            return {
+                "success": True,
+                "post_url": f"https://linkedin.com/feed/update/urn:li:share:{post_id}",
+                "post_id": post_id,
+            }
+        else:
+            return {
+                "success": False,
+                "error": response.text,
+            }
     
     @classmethod
     async def publish_to_instagram(
@@ -257,113 +262,253 @@ class PlatformService:
                 "error": "Instagram requires at least one image or video to publish",
             }
         
-        async with httpx.AsyncClient() as client:
-            # For single image post
-            if len(media_urls) == 1:
-                # Step 1: Create media container
+        client = upstream_http.client
+        # For single image post
+        if len(media_urls) == 1:
+            # Step 1: Create media container
+            container_url = f"https://graph.facebook.com/v18.0/{ig_user_id}/media"
+            container_params = {
+                "access_token": access_token,
+                "image_url": media_urls[0],
+                "caption": content,
+            }
+            
+            container_response = await client.post(container_url, data=container_params)
+            
+            if container_response.status_code != 200:
+                return {
+                    "success": False,
+                    "error": f"Failed to create media container: {container_response.text}",
+                }
+            
+            container_data = container_response.json()
+            creation_id = container_data.get("id")
+            
+            # Step 2: Publish the container
+            publish_url = f"https://graph.facebook.com/v18.0/{ig_user_id}/media_publish"
+            publish_params = {
+                "access_token": access_token,
+                "creation_id": creation_id,
+            }
+            
+            publish_response = await client.post(publish_url, data=publish_params)
+            
+            if publish_response.status_code == 200:
+                data = publish_response.json()
+                media_id = data.get("id")
+                return {
+                    "success": True,
+                    "post_url": f"https://www.instagram.com/p/{media_id}/",
+                    "post_id": media_id,
+                }
+            else:
+                return {
+                    "success": False,
+                    "error": f"Failed to publish: {publish_response.text}",
+                }
+        else:
+            # For carousel (multiple images)
+            # Step 1: Create containers for each image
+            children_ids = []
+            for image_url in media_urls[:10]:  # Instagram allows max 10 items
                 container_url = f"https://graph.facebook.com/v18.0/{ig_user_id}/media"
                 container_params = {
                     "access_token": access_token,
-                    "image_url": media_urls[0],
-                    "caption": content,
+                    "image_url": image_url,
+                    "is_carousel_item": "true",
                 }
                 
                 container_response = await client.post(container_url, data=container_params)
                 
-                if container_response.status_code != 200:
-                    return {
-                        "success": False,
-                        "error": f"Failed to create media container: {container_response.text}",
-                    }
-                
-                container_data = container_response.json()
-                creation_id = container_data.get("id")
-                
-                # Step 2: Publish the container
-                publish_url = f"https://graph.facebook.com/v18.0/{ig_user_id}/media_publish"
-                publish_params = {
-                    "access_token": access_token,
-                    "creation_id": creation_id,
-                }
-                
-                publish_response = await client.post(publish_url, data=publish_params)
-                
-                if publish_response.status_code == 200:
-                    data = publish_response.json()
-                    media_id = data.get("id")
-                    return {
-                        "success": True,
-                        "post_url": f"https://www.instagram.com/p/{media_id}/",
-                        "post_id": media_id,
-                    }
+                if container_response.status_code == 200:
+                    children_ids.append(container_response.json().get("id"))
                 else:
                     return {
                         "success": False,
-                        "error": f"Failed to publish: {publish_response.text}",
+                        "error": f"Failed to create carousel item: {container_response.text}",
                     }
-            else:
-                # For carousel (multiple images)
-                # Step 1: Create containers for each image
-                children_ids = []
-                for image_url in media_urls[:10]:  # Instagram allows max 10 items
-                    container_url = f"https://graph.facebook.com/v18.0/{ig_user_id}/media"
-                    container_params = {
-                        "access_token": access_token,
-                        "image_url": image_url,
-                        "is_carousel_item": "true",
-                    }
-                    
-                    container_response = await client.post(container_url, data=container_params)
-                    
-                    if container_response.status_code == 200:
-                        children_ids.append(container_response.json().get("id"))
-                    else:
-                        return {
-                            "success": False,
-                            "error": f"Failed to create carousel item: {container_response.text}",
-                        }
-                
-                # Step 2: Create carousel container
-                carousel_url = f"https://graph.facebook.com/v18.0/{ig_user_id}/media"
-                carousel_params = {
-                    "access_token": access_token,
-                    "media_type": "CAROUSEL",
-                    "caption": content,
-                    "children": ",".join(children_ids),
+            
+            # Step 2: Create carousel container
+            carousel_url = f"https://graph.facebook.com/v18.0/{ig_user_id}/media"
+            carousel_params = {
+                "access_token": access_token,
+                "media_type": "CAROUSEL",
+                "caption": content,
+                "children": ",".join(children_ids),
+            }
+            
+            carousel_response = await client.post(carousel_url, data=carousel_params)
+            
+            if carousel_response.status_code != 200:
+                return {
+                    "success": False,
+                    "error": f"Failed to create carousel: {carousel_response.text}",
                 }
-                
-                carousel_response = await client.post(carousel_url, data=carousel_params)
-                
-                if carousel_response.status_code != 200:
-                    return {
-                        "success": False,
-                        "error": f"Failed to create carousel: {carousel_response.text}",
-                    }
-                
-                creation_id = carousel_response.json().get("id")
-                
-                # Step 3: Publish the carousel
-                publish_url = f"https://graph.facebook.com/v18.0/{ig_user_id}/media_publish"
-                publish_params = {
-                    "access_token": access_token,
-                    "creation_id": creation_id,
+            
+            creation_id = carousel_response.json().get("id")
+            
+            # Step 3: Publish the carousel
+            publish_url = f"https://graph.facebook.com/v18.0/{ig_user_id}/media_publish"
+            publish_params = {
+                "access_token": access_token,
+                "creation_id": creation_id,
+            }
+            
+            publish_response = await client.post(publish_url, data=publish_params)
+            
+            if publish_response.status_code == 200:
+                data = publish_response.json()
+                media_id = data.get("id")
+                return {
+                    "success": True,
+                    "post_url": f"https://www.instagram.com/p/{media_id}/",
+                    "post_id": media_id,
                 }
-                
-                publish_response = await client.post(publish_url, data=publish_params)
-                
-                if publish_response.status_code == 200:
-                    data = publish_response.json()
-                    media_id = data.get("id")
-                    return {
-                        "success": True,
-                        "post_url": f"https://www.instagram.com/p/{media_id}/",
-                        "post_id": media_id,
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "error": f"Failed to publish carousel: {publish_response.text}",
-                    }
+            else:
+                return {
+                    "success": False,
+                    "error": f"Failed to publish carousel: {publish_response.text}",
+                }
+    
+    # Maximum post IDs per request to each platform's batch metrics endpoint
+    ENGAGEMENT_BATCH_SIZES = {
+        "twitter": 100,
+        "facebook": 50,
+        "instagram": 50,
+        "linkedin": 50,
+    }
+    
+    @classmethod
+    async def fetch_twitter_metrics(
+        cls, client: httpx.AsyncClient, account: ConnectedAccount, post_ids: List[str]
+    ) -> Dict[str, Dict[str, Optional[int]]]:
+        """Fetch public metrics for up to 100 tweets in one request."""
+        response = await client.get(
+            "https://api.twitter.com/2/tweets",
+            params={"ids": ",".join(post_ids), "tweet.fields": "public_metrics"},
+            headers={"Authorization": f"Bearer {account.access_token}"},
+        )
+        if response.status_code != 200:
+            return {}
+        
+        metrics = {}
+        for tweet in response.json().get("data", []):
+            public = tweet.get("public_metrics", {})
+            metrics[tweet["id"]] = {
+                "likes": public.get("like_count"),
+                "shares": (public.get("retweet_count") or 0) + (public.get("quote_count") or 0),
+                "comments": public.get("reply_count"),
+                "impressions": public.get("impression_count"),
+            }
+        return metrics
+    
+    @classmethod
+    async def fetch_facebook_metrics(
+        cls, client: httpx.AsyncClient, account: ConnectedAccount, post_ids: List[str]
+    ) -> Dict[str, Dict[str, Optional[int]]]:
+        """Fetch reactions, shares and comments for up to 50 Page posts in one request."""
+        response = await client.get(
+            "https://graph.facebook.com/v18.0/",
+            params={
+                "ids": ",".join(post_ids),
+                "fields": "shares,reactions.summary(total_count).limit(0),comments.summary(total_count).limit(0)",
+                "access_token": account.access_token,
+            },
+        )
+        if response.status_code != 200:
+            return {}
+        
+        metrics = {}
+        for post_id, data in response.json().items():
+            metrics[post_id] = {
+                "likes": data.get("reactions", {}).get("summary", {}).get("total_count"),
+                "shares": data.get("shares", {}).get("count", 0),
+                "comments": data.get("comments", {}).get("summary", {}).get("total_count"),
+                "impressions": None,
+            }
+        return metrics
+    
+    @classmethod
+    async def fetch_instagram_metrics(
+        cls, client: httpx.AsyncClient, account: ConnectedAccount, post_ids: List[str]
+    ) -> Dict[str, Dict[str, Optional[int]]]:
+        """Fetch likes and comments for up to 50 Instagram media in one request."""
+        response = await client.get(
+            "https://graph.facebook.com/v18.0/",
+            params={
+                "ids": ",".join(post_ids),
+                "fields": "like_count,comments_count",
+                "access_token": account.access_token,
+            },
+        )
+        if response.status_code != 200:
+            return {}
+        
+        metrics = {}
+        for media_id, data in response.json().items():
+            metrics[media_id] = {
+                "likes": data.get("like_count"),
+                "shares": None,
+                "comments": data.get("comments_count"),
+                "impressions": None,
+            }
+        return metrics
+    
+    @classmethod
+    async def fetch_linkedin_metrics(
+        cls, client: httpx.AsyncClient, account: ConnectedAccount, post_ids: List[str]
+    ) -> Dict[str, Dict[str, Optional[int]]]:
+        """Fetch likes and comments for up to 50 shares with one batch GET."""
+        urns = {f"urn:li:share:{post_id}": post_id for post_id in post_ids}
+        # Rest.li expects the encoded URNs verbatim, so the query is not re-encoded
+        ids = ",".join(quote(urn, safe="") for urn in urns)
+        response = await client.get(
+            f"https://api.linkedin.com/v2/socialActions?ids=List({ids})",
+            headers={
+                "Authorization": f"Bearer {account.access_token}",
+                "X-Restli-Protocol-Version": "2.0.0",
+            },
+        )
+        if response.status_code != 200:
+            return {}
+        
+        metrics = {}
+        for urn, data in response.json().get("results", {}).items():
+            if urn not in urns:
+                continue
+            metrics[urns[urn]] = {
+                "likes": data.get("likesSummary", {}).get("totalLikes"),
+                "shares": None,
+                "comments": data.get("commentsSummary", {}).get("aggregatedTotalComments"),
+                "impressions": None,
+            }
+        return metrics
+    
+    @classmethod
+    async def fetch_engagement(
+        cls, client: httpx.AsyncClient, account: ConnectedAccount, post_ids: List[str]
+    ) -> Dict[str, Dict[str, Optional[int]]]:
+        """Fetch engagement metrics for posts on one account, keyed by platform post ID.
+        
+        Issues one request per batch of post IDs, sized to the platform's
+        batch endpoint.
+        """
+        fetchers = {
+            "twitter": cls.fetch_twitter_metrics,
+            "facebook": cls.fetch_facebook_metrics,
+            "instagram": cls.fetch_instagram_metrics,
+            "linkedin": cls.fetch_linkedin_metrics,
+        }
+        
+        fetcher = fetchers.get(account.platform_id)
+        if not fetcher:
+            return {}
+        
+        batch_size = cls.ENGAGEMENT_BATCH_SIZES[account.platform_id]
+        metrics = {}
+        for start in range(0, len(post_ids), batch_size):
+            metrics.update(await fetcher(client, account, post_ids[start:start + batch_size]))
+        return metrics
     
     @classmethod
     async def publish(
@@ -379,7 +524,18 @@ class PlatformService:
         
         publisher = publishers.get(account.platform_id)
         if publisher:
-            return await publisher(account, content, media_urls)
+            start = time.perf_counter()
+            outcome = "error"
+            with tracer.start_as_current_span(
+                f"publish {account.platform_id}", attributes={"platform": account.platform_id}
+            ) as span:
+                try:
+                    result = await publisher(account, content, media_urls)
+                    outcome = "success" if result.get("success") else "failure"
+                    return result
+                finally:
+                    span.set_attribute("outcome", outcome)
+                    PUBLISH_SECONDS.labels(account.platform_id, outcome).observe(time.perf_counter() - start)
         
         return {
             "success": False,
@@ -0,0 +1,199 @@
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from bson import ObjectId
+
+from app.config import get_settings
+from app.models.post import Post, PublishResult, NOT_DELETED
+from app.services.archive_service import ArchiveService
+from app.services.stats_service import StatsService
+from app.utils.queries import posts_filter, posts_results_filter, purgeable_posts_filter
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Posts deleted per round trip; bounds the size of each $in list
+DELETE_BATCH_SIZE = 1000
+
+
+class PostService:
+    """Service for deleting posts together with their publish results."""
+
+    @classmethod
+    async def _result_status_counts(cls, query: dict) -> Dict[str, Dict[str, int]]:
+        """Count live publish results matching query, by user and status."""
+        rows = await PublishResult.get_motor_collection().aggregate([
+            {"$match": {**query, **NOT_DELETED}},
+            {"$group": {
+                "_id": {"user_id": "$user_id", "status": "$status"},
+                "count": {"$sum": 1},
+            }},
+        ]).to_list(length=None)
+
+        counts: Dict[str, Dict[str, int]] = {}
+        for row in rows:
+            counts.setdefault(row["_id"]["user_id"], {})[row["_id"]["status"]] = row["count"]
+        return counts
+
+    @classmethod
+    async def _delete_batch(cls, user_id: str, post_ids: List[ObjectId], soft: bool) -> Dict[str, int]:
+        """Delete (or soft-delete) one batch of a user's posts and cascade to their results."""
+        posts = Post.get_motor_collection()
+        results = PublishResult.get_motor_collection()
+        result_query = posts_results_filter(user_id, [str(post_id) for post_id in post_ids])
+        status_counts = (await cls._result_status_counts(result_query)).get(user_id, {})
+
+        if soft:
+            now = datetime.utcnow()
+            deleted_results = await results.update_many(
+                {**result_query, **NOT_DELETED}, {"$set": {"deleted_at": now}}
+            )
+            deleted_posts = await posts.update_many(
+                {"_id": {"$in": post_ids}, "user_id": user_id, **NOT_DELETED}, {"$set": {"deleted_at": now}}
+            )
+            result_count, post_count = deleted_results.modified_count, deleted_posts.modified_count
+        else:
+            deleted_results = await results.delete_many(result_query)
+            deleted_posts = await posts.delete_many({"_id": {"$in": post_ids}, "user_id": user_id})
+            result_count, post_count = deleted_results.deleted_count, deleted_posts.deleted_count
+
+        # Archived results have no soft-deleted state, so they are removed either way
+        archived_counts = await ArchiveService.remove_posts(user_id, post_ids)
+        for archived_status, count in archived_counts.items():
+            status_counts[archived_status] = status_counts.get(archived_status, 0) + count
+        result_count += sum(archived_counts.values())
+
+        # Soft-deleted rows leave the counters now; the purge does not touch them again
+        await StatsService.record_post_deleted(user_id, post_count)
+        await StatsService.record_results_deleted(user_id, status_counts)
+
+        return {"posts": post_count, "publishResults": result_count}
+
+    @classmethod
+    async def delete_posts(
+        cls,
+        user_id: str,
+        post_ids: Optional[List[str]] = None,
+        post_status: Optional[str] = None,
+        platform: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        soft: bool = False,
+    ) -> Dict[str, int]:
+        """Delete a user's posts by id and/or filter, cascading to their publish results.
+
+        Matching posts are processed in batches, so a broad filter does not
+        load every id at once. With soft=True posts and results are hidden
+        immediately and removed by purge_deleted after the retention period.
+        """
+        query = posts_filter(user_id, post_status, platform, start, end)
+        if post_ids is not None:
+            query["_id"] = {"$in": [ObjectId(post_id) for post_id in post_ids if ObjectId.is_valid(post_id)]}
+
+        totals = {"posts": 0, "publishResults": 0}
+        while True:
+            # Deleted and soft-deleted posts drop out of the query, so each pass sees the next batch
+            batch = await Post.get_motor_collection().find(
+                query, {"_id": 1}
+            ).limit(DELETE_BATCH_SIZE).to_list(length=DELETE_BATCH_SIZE)
+            if not batch:
+                break
+
+            deleted = await cls._delete_batch(user_id, [doc["_id"] for doc in batch], soft)
+            totals["posts"] += deleted["posts"]
+            totals["publishResults"] += deleted["publishResults"]
+
+            if len(batch) < DELETE_BATCH_SIZE:
+                break
+
+        return totals
+
+    @classmethod
+    async def purge_deleted(cls) -> int:
+        """Permanently remove posts soft-deleted before the retention cutoff, with their results.
+
+        Returns the number of posts removed.
+        """
+        cutoff = datetime.utcnow() - timedelta(hours=settings.deleted_post_retention_hours)
+        posts = Post.get_motor_collection()
+        purged = 0
+
+        while True:
+            batch = await posts.find(
+                purgeable_posts_filter(cutoff), {"_id": 1, "user_id": 1}
+            ).limit(DELETE_BATCH_SIZE).to_list(length=DELETE_BATCH_SIZE)
+            if not batch:
+                break
+
+            # Deletes are per user so each targets one shard
+            by_user: Dict[str, List[ObjectId]] = defaultdict(list)
+            for doc in batch:
+                by_user[doc["user_id"]].append(doc["_id"])
+            for user_id, post_ids in by_user.items():
+                await PublishResult.get_motor_collection().delete_many(
+                    posts_results_filter(user_id, [str(post_id) for post_id in post_ids])
+                )
+                deleted = await posts.delete_many({"_id": {"$in": post_ids}, "user_id": user_id})
+                purged += deleted.deleted_count
+
+            if len(batch) < DELETE_BATCH_SIZE:
+                break
+
+        if purged:
+            logger.info("Purged %d soft-deleted posts", purged)
+        return purged
+
+    @classmethod
+    async def cleanup_orphaned_results(cls) -> int:
+        """Delete publish results whose post no longer exists.
+
+        Walks the distinct (user, post id) pairs referenced by results in
+        batches and checks them against the user's posts by _id, so no full
+        join is materialized. Returns the number of results removed.
+        """
+        results = PublishResult.get_motor_collection()
+        removed = 0
+
+        async def remove(batch: List[Tuple[str, str]]) -> int:
+            by_user: Dict[str, List[str]] = defaultdict(list)
+            for user_id, post_id in batch:
+                by_user[user_id].append(post_id)
+
+            count = 0
+            # Queries are per user so each targets one shard
+            for user_id, post_ids in by_user.items():
+                valid = [ObjectId(post_id) for post_id in post_ids if ObjectId.is_valid(post_id)]
+                existing = {
+                    str(doc["_id"])
+                    for doc in await Post.get_motor_collection().find(
+                        {"_id": {"$in": valid}, "user_id": user_id}, {"_id": 1}
+                    ).to_list(length=None)
+                }
+                orphaned = [post_id for post_id in post_ids if post_id not in existing]
+                if not orphaned:
+                    continue
+
+                query = posts_results_filter(user_id, orphaned)
+                status_counts = (await cls._result_status_counts(query)).get(user_id, {})
+                await StatsService.record_results_deleted(user_id, status_counts)
+                count += (await results.delete_many(query)).deleted_count
+            return count
+
+        batch: List[Tuple[str, str]] = []
+        cursor = results.aggregate(
+            [{"$group": {"_id": {"user_id": "$user_id", "post_id": "$post_id"}}}],
+            allowDiskUse=True,
+            batchSize=DELETE_BATCH_SIZE,
+        )
+        async for row in cursor:
+            batch.append((row["_id"]["user_id"], row["_id"]["post_id"]))
+            if len(batch) >= DELETE_BATCH_SIZE:
+                removed += await remove(batch)
+                batch = []
+        if batch:
+            removed += await remove(batch)
+
+        if removed:
+            logger.info("Removed %d orphaned publish results", removed)
+        return removed
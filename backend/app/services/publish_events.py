@@ -0,0 +1,155 @@
+import asyncio
+import logging
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Deque, Dict, Optional, Set
+from pymongo import CursorType, ReturnDocument
+from pymongo.errors import CollectionInvalid
+
+from app.config import get_settings
+from app.database import get_database
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "publish_events"
+SEQUENCE_COLLECTION_NAME = "publish_event_sequence"
+
+# Sequence numbers re-read when the tail resumes, to catch events that
+# were numbered before the last one seen but inserted after it
+RESUME_OVERLAP = 64
+
+# Events buffered per WebSocket before the oldest are dropped
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+class PublishEventBus:
+    """Fans out publish result updates to WebSocket subscribers.
+
+    With the "mongo" backend every event is appended to a capped collection
+    that each API worker tails, so an update produced on any worker reaches
+    subscribers connected to any other. The "memory" backend dispatches
+    in-process only and suits single-worker deployments.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._collection = None
+        self._sequence = None
+        self._tail_task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._tail_task is not None and not self._tail_task.done()
+
+    async def start(self) -> None:
+        """Create the capped collection if needed and start tailing it."""
+        if settings.publish_events_backend != "mongo":
+            return
+
+        database = get_database()
+        if COLLECTION_NAME not in await database.list_collection_names():
+            try:
+                await database.create_collection(
+                    COLLECTION_NAME,
+                    capped=True,
+                    size=settings.publish_events_capped_size_bytes,
+                )
+            except CollectionInvalid:
+                pass  # Created concurrently by another worker
+
+        self._collection = database[COLLECTION_NAME]
+        self._sequence = database[SEQUENCE_COLLECTION_NAME]
+        self._tail_task = asyncio.create_task(self._tail(), name="publish-events-tail")
+
+    async def stop(self) -> None:
+        """Stop tailing the event collection."""
+        if self._tail_task:
+            self._tail_task.cancel()
+            await asyncio.gather(self._tail_task, return_exceptions=True)
+            self._tail_task = None
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        """Register a queue that receives every event for a user."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers[user_id].add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue) -> None:
+        """Remove a queue registered with subscribe."""
+        queues = self._subscribers.get(user_id)
+        if queues:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[user_id]
+
+    async def publish(self, user_id: str, event: dict) -> None:
+        """Publish an event to all of a user's subscribers on every worker."""
+        if self._collection is None:
+            self._dispatch(user_id, event)
+            return
+
+        # Numbered by the server so every worker's events share one order
+        counter = await self._sequence.find_one_and_update(
+            {"_id": COLLECTION_NAME},
+            {"$inc": {"seq": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        await self._collection.insert_one({
+            "seq": counter["seq"],
+            "user_id": user_id,
+            "event": event,
+            "created_at": datetime.utcnow(),
+        })
+
+    def _dispatch(self, user_id: str, event: dict) -> None:
+        """Deliver an event to this worker's subscribers for a user."""
+        for queue in self._subscribers.get(user_id, ()):
+            if queue.full():
+                # Slow consumer: keep the newest state, drop the oldest update
+                queue.get_nowait()
+            queue.put_nowait(event)
+
+    async def _tail(self) -> None:
+        """Follow the capped collection and dispatch new events locally.
+
+        One tailable cursor is kept open for as long as the server keeps it
+        alive. When it dies the tail reopens from the last sequence number
+        seen, overlapping by RESUME_OVERLAP and skipping events already
+        dispatched. Events already in the collection at startup are skipped.
+        """
+        newest = await self._collection.find_one({}, {"seq": 1}, sort=[("$natural", -1)])
+        floor = newest.get("seq", 0) if newest else 0
+        last_seq = floor
+        seen: Deque[int] = deque(maxlen=2 * RESUME_OVERLAP)
+
+        while True:
+            # Matching at least the last event seen keeps the new cursor alive
+            query = {"seq": {"$gte": max(last_seq - RESUME_OVERLAP, floor)}}
+            cursor = self._collection.find(query, cursor_type=CursorType.TAILABLE_AWAIT)
+            try:
+                while cursor.alive:
+                    try:
+                        doc = await cursor.next()
+                    except StopAsyncIteration:
+                        continue  # No new events within the await timeout
+                    seq = doc["seq"]
+                    if seq <= floor or seq in seen:
+                        continue
+                    seen.append(seq)
+                    last_seq = max(last_seq, seq)
+                    if doc["user_id"] in self._subscribers:
+                        self._dispatch(doc["user_id"], doc["event"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Publish event tail failed, restarting")
+            finally:
+                await cursor.close()
+
+            # Tailable cursors die on an empty collection or no match; back off and retry
+            await asyncio.sleep(1)
+
+
+publish_events = PublishEventBus()
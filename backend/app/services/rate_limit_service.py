@@ -0,0 +1,177 @@
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Deque, Dict, Optional, Union
+from fastapi import HTTPException, Request, status
+
+from app.config import get_settings
+from app.models.rate_limit import RateLimitHit
+from app.utils.queries import OLDEST_HIT_FIRST, rate_limit_window_filter
+
+settings = get_settings()
+
+
+class SlidingWindowRateLimiter:
+    """In-memory sliding-window log limiter, local to a single worker."""
+
+    def __init__(self, limit: int, window_seconds: int, max_keys: int = 100_000):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._hits: Dict[str, Deque[float]] = {}
+
+    async def hit(self, key: str) -> Optional[float]:
+        """Record a hit for key.
+
+        Returns None if the hit is allowed, otherwise the number of seconds
+        until the oldest hit leaves the window.
+        """
+        now = time.monotonic()
+        cutoff = now - self.window_seconds
+
+        hits = self._hits.get(key)
+        if hits is None:
+            if len(self._hits) >= self.max_keys:
+                self._evict(cutoff)
+            hits = self._hits[key] = deque()
+
+        while hits and hits[0] <= cutoff:
+            hits.popleft()
+
+        if len(hits) >= self.limit:
+            return hits[0] + self.window_seconds - now
+
+        hits.append(now)
+        return None
+
+    def _evict(self, cutoff: float) -> None:
+        """Drop idle keys so a flood of distinct keys cannot grow memory unbounded."""
+        for key in [k for k, hits in self._hits.items() if not hits or hits[-1] <= cutoff]:
+            del self._hits[key]
+
+        # Still full: drop the oldest-inserted keys
+        overflow = len(self._hits) - self.max_keys + 1
+        for key in list(self._hits)[:max(overflow, 0)]:
+            del self._hits[key]
+
+
+class MongoSlidingWindowRateLimiter:
+    """Sliding-window log limiter shared by all workers through MongoDB.
+
+    Count-then-insert is not atomic, so concurrent workers may overshoot the
+    limit by a few requests; that is acceptable for abuse throttling.
+    """
+
+    def __init__(self, limit: int, window_seconds: int):
+        self.limit = limit
+        self.window_seconds = window_seconds
+
+    async def hit(self, key: str) -> Optional[float]:
+        """Record a hit for key, returning seconds to wait if over the limit."""
+        now = datetime.utcnow()
+        window_start = now - timedelta(seconds=self.window_seconds)
+
+        in_window = RateLimitHit.find(rate_limit_window_filter(key, window_start))
+
+        if await in_window.count() >= self.limit:
+            oldest = await in_window.sort(OLDEST_HIT_FIRST).first_or_none()
+            if oldest:
+                return (oldest.created_at - window_start).total_seconds()
+            return float(self.window_seconds)
+
+        await RateLimitHit(
+            key=key,
+            created_at=now,
+            expires_at=now + timedelta(seconds=self.window_seconds),
+        ).insert()
+        return None
+
+
+RateLimiter = Union[SlidingWindowRateLimiter, MongoSlidingWindowRateLimiter]
+
+
+def create_rate_limiter(limit: int) -> RateLimiter:
+    """Create a limiter for the configured backend."""
+    if settings.auth_rate_limit_backend == "mongo":
+        return MongoSlidingWindowRateLimiter(limit, settings.auth_rate_limit_window_seconds)
+    return SlidingWindowRateLimiter(limit, settings.auth_rate_limit_window_seconds)
+
+
+class HashAdmissionController:
+    """Bounds concurrent password hashing so bcrypt cannot starve the workers.
+
+    Up to max_concurrent hashes run at once and up to max_queued more may
+    wait; anything beyond that is rejected immediately with 503.
+    """
+
+    def __init__(self, max_concurrent: int, max_queued: int):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._capacity = max_concurrent + max_queued
+        self._admitted = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        """Reserve a hashing slot or raise 503 if the queue is full."""
+        if self._admitted >= self._capacity:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy. Please try again shortly.",
+                headers={"Retry-After": "1"},
+            )
+
+        self._admitted += 1
+        try:
+            async with self._semaphore:
+                yield
+        finally:
+            self._admitted -= 1
+
+
+hash_admission = HashAdmissionController(
+    settings.auth_max_concurrent_hashes,
+    settings.auth_max_queued_hashes,
+)
+
+_limiters: Dict[str, RateLimiter] = {
+    "login:ip": create_rate_limiter(settings.login_rate_limit_per_ip),
+    "login:email": create_rate_limiter(settings.login_rate_limit_per_email),
+    "register:ip": create_rate_limiter(settings.register_rate_limit_per_ip),
+}
+
+
+def get_client_ip(request: Request) -> str:
+    """Get the client IP, honouring X-Forwarded-For only when configured."""
+    if settings.trust_forwarded_for:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def check_auth_rate_limit(
+    request: Request, action: str, email: Optional[str] = None
+) -> None:
+    """Reject an auth attempt with 429 if its IP or email is over the limit.
+
+    Must be called before any password hashing so throttled requests cost
+    no bcrypt work.
+    """
+    checks = [(f"{action}:ip", get_client_ip(request))]
+    if email:
+        checks.append((f"{action}:email", email.lower()))
+
+    for limiter_name, value in checks:
+        limiter = _limiters.get(limiter_name)
+        if not limiter:
+            continue
+
+        retry_after = await limiter.hit(f"{limiter_name}:{value}")
+        if retry_after is not None:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many attempts. Please try again later.",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, List, Optional
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from app.config import get_settings
+from app.models.job_lease import JobLease
+from app.utils.worker import WORKER_ID
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    """A periodic background job."""
+    name: str
+    func: Callable[[], Awaitable]
+    interval_seconds: float
+    initial_delay_seconds: float = 0
+
+    # Outcome of the most recent run
+    last_started_at: Optional[datetime] = None
+    last_finished_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+
+class JobScheduler:
+    """Runs periodic background jobs on the application's event loop.
+
+    With the "mongo" lease backend every worker polls for due jobs and a
+    run happens only on the worker that claims the job's lease, so jobs
+    run once per interval across the deployment however many workers
+    there are. The "local" backend runs every job in every worker and
+    suits single-worker deployments.
+    """
+
+    def __init__(self):
+        self._jobs: List[Job] = []
+        self._tasks: List[asyncio.Task] = []
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Awaitable],
+        interval_seconds: float,
+        initial_delay_seconds: float = 0,
+    ) -> None:
+        """Register a job to run every interval_seconds once started."""
+        self._jobs.append(Job(name, func, interval_seconds, initial_delay_seconds))
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    def status(self) -> List[dict]:
+        """Report each job's last run and whether its task is alive."""
+        alive = {task.get_name() for task in self._tasks if not task.done()}
+        return [
+            {
+                "name": job.name,
+                "running": f"job:{job.name}" in alive,
+                "lastStartedAt": job.last_started_at.isoformat() if job.last_started_at else None,
+                "lastFinishedAt": job.last_finished_at.isoformat() if job.last_finished_at else None,
+                "lastError": job.last_error,
+            }
+            for job in self._jobs
+        ]
+
+    async def start(self) -> None:
+        """Start all registered jobs."""
+        for job in self._jobs:
+            self._tasks.append(asyncio.create_task(self._run(job), name=f"job:{job.name}"))
+
+    async def stop(self) -> None:
+        """Cancel all running jobs and wait for them to finish."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _run(self, job: Job) -> None:
+        await asyncio.sleep(job.initial_delay_seconds)
+        if settings.scheduler_lease_backend != "mongo":
+            while True:
+                await self._execute(job)
+                await asyncio.sleep(job.interval_seconds)
+
+        poll_seconds = min(job.interval_seconds, settings.scheduler_poll_seconds)
+        while True:
+            try:
+                claimed = await self._claim(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Could not claim lease for background job %s", job.name)
+                claimed = False
+
+            if claimed:
+                renewal = asyncio.create_task(self._renew(job), name=f"lease:{job.name}")
+                try:
+                    await self._execute(job)
+                finally:
+                    renewal.cancel()
+                    await asyncio.gather(renewal, return_exceptions=True)
+                    await self._release(job)
+            await asyncio.sleep(poll_seconds)
+
+    async def _execute(self, job: Job) -> None:
+        job.last_started_at = datetime.utcnow()
+        try:
+            await job.func()
+            job.last_error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            job.last_error = repr(error)
+            logger.exception("Background job %s failed", job.name)
+        job.last_finished_at = datetime.utcnow()
+
+    async def _claim(self, job: Job) -> bool:
+        """Take the job's lease if the job is due and no live worker holds it.
+
+        The first claim creates the lease document. When the document exists
+        but the job is not due or is leased, the upsert's insert collides on
+        _id and the claim fails.
+        """
+        now = datetime.utcnow()
+        try:
+            lease = await JobLease.get_motor_collection().find_one_and_update(
+                {"_id": job.name, "next_run_at": {"$lte": now}, "locked_until": {"$lte": now}},
+                {"$set": {
+                    "owner": WORKER_ID,
+                    "locked_until": now + timedelta(seconds=settings.scheduler_lease_seconds),
+                    "next_run_at": now + timedelta(seconds=job.interval_seconds),
+                }},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
+        except DuplicateKeyError:
+            return False
+        return lease is not None and lease["owner"] == WORKER_ID
+
+    async def _renew(self, job: Job) -> None:
+        """Extend the lease while the job runs so other workers do not take it over."""
+        while True:
+            await asyncio.sleep(settings.scheduler_lease_seconds / 3)
+            try:
+                result = await JobLease.get_motor_collection().update_one(
+                    {"_id": job.name, "owner": WORKER_ID},
+                    {"$set": {
+                        "locked_until": datetime.utcnow() + timedelta(seconds=settings.scheduler_lease_seconds),
+                    }},
+                )
+                if not result.matched_count:
+                    logger.warning("Lost lease for background job %s", job.name)
+                    return
+            except Exception:
+                logger.exception("Could not renew lease for background job %s", job.name)
+
+    async def _release(self, job: Job) -> None:
+        """Free the lease so the next run can start on any worker once due."""
+        now = datetime.utcnow()
+        try:
+            await JobLease.get_motor_collection().update_one(
+                {"_id": job.name, "owner": WORKER_ID},
+                {"$set": {"locked_until": now, "last_finished_at": now}},
+            )
+        except Exception:
+            logger.exception("Could not release lease for background job %s", job.name)
+
+
+scheduler = JobScheduler()
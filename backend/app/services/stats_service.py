@@ -0,0 +1,378 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from pymongo import UpdateOne
+
+from app.database import analytics_collection
+from app.models.archive import PublishResultArchive
+from app.models.post import Post, PublishResult, NOT_DELETED
+from app.models.stats import UserStats, PublishRollup
+from app.services.best_time_service import BestTimeService
+from app.utils.queries import (
+    archived_status_counts_pipeline,
+    posts_filter,
+    result_status_counts_pipeline,
+    rollup_range_filter,
+    user_stats_filter,
+)
+
+logger = logging.getLogger(__name__)
+
+# PublishResult statuses tracked as UserStats counters
+COUNTED_STATUSES = ("pending", "in_progress", "published", "failed")
+
+# Statuses that end a publish attempt and are counted in rollups
+TERMINAL_STATUSES = ("published", "failed")
+
+ROLLUP_GRANULARITIES = ("hour", "day")
+ALL_PLATFORMS = "*"
+
+RECONCILE_BATCH_SIZE = 1000
+
+
+def bucket_start(timestamp: datetime, granularity: str) -> datetime:
+    """Truncate a timestamp to the start of its hour or day bucket."""
+    if granularity == "day":
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    return timestamp.replace(minute=0, second=0, microsecond=0)
+
+
+class StatsService:
+    """Service for computing and maintaining per-user publishing statistics."""
+
+    @classmethod
+    async def get_publish_status_counts(cls, user_id: str) -> Dict[str, int]:
+        """Count a user's publish results by status with a single $group.
+
+        Served from the (user_id, status) index, so no documents are
+        loaded into the application. Archived results are added from the
+        archive buckets' status totals.
+        """
+        rows = await PublishResult.get_motor_collection().aggregate(
+            result_status_counts_pipeline(user_id)
+        ).to_list(length=None)
+
+        counts = {row["_id"]: row["count"] for row in rows}
+        for status, count in (await cls.get_archived_status_counts(user_id)).get(user_id, {}).items():
+            counts[status] = counts.get(status, 0) + count
+        return counts
+
+    @classmethod
+    async def get_archived_status_counts(cls, user_id: Optional[str] = None) -> Dict[str, Dict[str, int]]:
+        """Count archived publish results by user and status from the bucket totals."""
+        rows = PublishResultArchive.get_motor_collection().aggregate(
+            archived_status_counts_pipeline(user_id), allowDiskUse=True
+        )
+        counts: Dict[str, Dict[str, int]] = {}
+        async for row in rows:
+            counts.setdefault(row["_id"]["user_id"], {})[row["_id"]["status"]] = row["count"]
+        return counts
+
+    @classmethod
+    async def get_dashboard_counts(cls, user_id: str) -> Dict[str, int]:
+        """Get the values shown on the dashboard for a user.
+
+        This is a single read of the user's counters document, which may
+        be served by a secondary; counters are built from the source
+        collections on first access.
+        """
+        doc = await analytics_collection(UserStats).find_one(user_stats_filter(user_id))
+        if doc:
+            stats = UserStats.model_validate(doc)
+        else:
+            stats = await cls.reconcile_user(user_id)
+
+        return stats.to_response()
+
+    @classmethod
+    async def _increment(cls, user_id: str, deltas: Dict[str, int]) -> None:
+        """Atomically apply counter deltas to an existing counters document.
+
+        Nothing is upserted: a missing document is built in full by
+        reconcile_user on the next dashboard read.
+        """
+        deltas = {field: delta for field, delta in deltas.items() if delta}
+        if not deltas:
+            return
+
+        await UserStats.get_motor_collection().update_one(
+            {"user_id": user_id},
+            {"$inc": deltas, "$set": {"updated_at": datetime.utcnow()}},
+        )
+
+    @classmethod
+    async def record_post_created(cls, user_id: str, count: int = 1) -> None:
+        """Update counters after posts are inserted."""
+        await cls._increment(user_id, {"total_posts": count})
+
+    @classmethod
+    async def record_post_deleted(cls, user_id: str, count: int = 1) -> None:
+        """Update counters after posts are deleted."""
+        await cls._increment(user_id, {"total_posts": -count})
+
+    @classmethod
+    async def record_results_deleted(cls, user_id: str, status_counts: Dict[str, int]) -> None:
+        """Update counters after publish results are deleted, given their counts by status."""
+        await cls._increment(user_id, {
+            status: -count for status, count in status_counts.items() if status in COUNTED_STATUSES
+        })
+
+    @classmethod
+    async def record_result_status_change(
+        cls, user_id: str, old_status: Optional[str], new_status: Optional[str]
+    ) -> None:
+        """Update counters after a publish result is inserted, changes status or is deleted.
+
+        Pass old_status=None for inserts and new_status=None for deletes.
+        """
+        if old_status == new_status:
+            return
+
+        deltas: Dict[str, int] = {}
+        if old_status in COUNTED_STATUSES:
+            deltas[old_status] = -1
+        if new_status in COUNTED_STATUSES:
+            deltas[new_status] = deltas.get(new_status, 0) + 1
+
+        await cls._increment(user_id, deltas)
+
+    @classmethod
+    async def record_result_transition(
+        cls,
+        result: PublishResult,
+        previous_status: Optional[str],
+        previous_published_at: Optional[datetime] = None,
+    ) -> None:
+        """Update counters, rollups and best-time profiles after a publish result changes status.
+
+        Pass previous_status=None when the result has just been inserted,
+        and previous_published_at when a published result has been reset.
+        """
+        if previous_status == result.status:
+            return
+
+        await cls.record_result_status_change(result.user_id, previous_status, result.status)
+
+        if result.status in TERMINAL_STATUSES:
+            await cls.record_rollup(
+                result.user_id,
+                result.platform_id,
+                result.status,
+                result.published_at or datetime.utcnow(),
+            )
+
+        if previous_status == "published" and previous_published_at:
+            await BestTimeService.record_unpublished(
+                result.user_id, result.platform_id, previous_published_at
+            )
+
+        if result.status == "published" and result.published_at:
+            await BestTimeService.record_published(
+                result.user_id, result.platform_id, result.published_at
+            )
+
+    @classmethod
+    async def record_rollup(
+        cls, user_id: str, platform_id: str, status: str, timestamp: datetime
+    ) -> None:
+        """Count one terminal publish attempt in every rollup bucket it falls in."""
+        operations = [
+            UpdateOne(
+                {
+                    "user_id": user_id,
+                    "granularity": granularity,
+                    "platform_id": platform_key,
+                    "bucket": bucket_start(timestamp, granularity),
+                },
+                {"$inc": {status: 1}},
+                upsert=True,
+            )
+            for granularity in ROLLUP_GRANULARITIES
+            for platform_key in (platform_id, ALL_PLATFORMS)
+        ]
+
+        await PublishRollup.get_motor_collection().bulk_write(operations, ordered=False)
+
+    @classmethod
+    async def get_timeseries(
+        cls,
+        user_id: str,
+        start: datetime,
+        end: datetime,
+        granularity: str,
+        platform_id: Optional[str] = None,
+    ) -> List[Dict]:
+        """Read publish volume per bucket from the rollups, zero-filling gaps.
+
+        A single range scan on the rollup index; raw results are not read.
+        """
+        first_bucket = bucket_start(start, granularity)
+
+        rows = await analytics_collection(PublishRollup).find(
+            rollup_range_filter(user_id, granularity, platform_id or ALL_PLATFORMS, first_bucket, end),
+            {"_id": 0, "bucket": 1, "published": 1, "failed": 1},
+        ).to_list(length=None)
+        by_bucket = {row["bucket"]: row for row in rows}
+
+        step = timedelta(days=1) if granularity == "day" else timedelta(hours=1)
+        points = []
+        current = first_bucket
+        while current <= end:
+            row = by_bucket.get(current, {})
+            points.append({
+                "timestamp": current,
+                "published": row.get("published", 0),
+                "failed": row.get("failed", 0),
+            })
+            current += step
+
+        return points
+
+    @classmethod
+    async def rebuild_rollups(cls, user_id: Optional[str] = None) -> None:
+        """Rebuild rollups from the terminal publish results, archived ones included.
+
+        Attempts that were later retried are no longer visible in the
+        results, so rebuilt rollups count only each result's final outcome.
+        """
+        match: Dict = {"status": {"$in": list(TERMINAL_STATUSES)}}
+        archive_pipeline: List[Dict] = []
+        if user_id:
+            match["user_id"] = user_id
+            archive_pipeline.append({"$match": {"u": user_id}})
+            await PublishRollup.find(PublishRollup.user_id == user_id).delete()
+        else:
+            await PublishRollup.get_motor_collection().delete_many({})
+
+        # Archive rows reshaped to the fields the rollup stages read
+        archive_pipeline += [
+            {"$unwind": "$r"},
+            {"$project": {
+                "user_id": "$u",
+                "platform_id": "$p",
+                "status": "$r.s",
+                "updated_at": "$r.t",
+            }},
+        ]
+
+        collection = PublishResult.get_motor_collection()
+        timestamp = {"$ifNull": ["$published_at", "$updated_at"]}
+
+        for granularity in ROLLUP_GRANULARITIES:
+            for platform_key in ("$platform_id", ALL_PLATFORMS):
+                pipeline = [
+                    {"$match": match},
+                    {"$unionWith": {
+                        "coll": PublishResultArchive.get_settings().name,
+                        "pipeline": archive_pipeline,
+                    }},
+                    {"$group": {
+                        "_id": {
+                            "user_id": "$user_id",
+                            "bucket": {"$dateTrunc": {"date": timestamp, "unit": granularity}},
+                            "platform_id": platform_key,
+                        },
+                        "published": {"$sum": {"$cond": [{"$eq": ["$status", "published"]}, 1, 0]}},
+                        "failed": {"$sum": {"$cond": [{"$eq": ["$status", "failed"]}, 1, 0]}},
+                    }},
+                    {"$project": {
+                        "_id": 0,
+                        "user_id": "$_id.user_id",
+                        "granularity": {"$literal": granularity},
+                        "bucket": "$_id.bucket",
+                        "platform_id": "$_id.platform_id",
+                        "published": 1,
+                        "failed": 1,
+                    }},
+                    {"$merge": {
+                        "into": PublishRollup.get_settings().name,
+                        "on": ["user_id", "granularity", "platform_id", "bucket"],
+                        "whenMatched": "replace",
+                        "whenNotMatched": "insert",
+                    }},
+                ]
+                await collection.aggregate(pipeline, allowDiskUse=True).to_list(length=None)
+
+    @classmethod
+    async def reconcile_user(cls, user_id: str) -> UserStats:
+        """Rebuild a user's counters from the source collections."""
+        total_posts = await Post.get_motor_collection().count_documents(posts_filter(user_id))
+        status_counts = await cls.get_publish_status_counts(user_id)
+
+        now = datetime.utcnow()
+        fields = {
+            "total_posts": total_posts,
+            **{status: status_counts.get(status, 0) for status in COUNTED_STATUSES},
+            "updated_at": now,
+            "reconciled_at": now,
+        }
+
+        await UserStats.get_motor_collection().update_one(
+            {"user_id": user_id},
+            {"$set": fields},
+            upsert=True,
+        )
+
+        return UserStats(user_id=user_id, **fields)
+
+    @classmethod
+    async def reconcile_all(cls) -> int:
+        """Rebuild every user's counters to correct any drift.
+
+        Uses one $group over each source collection rather than per-user
+        queries. Increments that land while this runs may be overwritten;
+        the next run corrects them. Returns the number of users written.
+        """
+        now = datetime.utcnow()
+        zero = {"total_posts": 0, **{status: 0 for status in COUNTED_STATUSES}}
+        counters: Dict[str, Dict[str, int]] = {}
+
+        # Users that have counters but may no longer have any source rows
+        async for doc in UserStats.get_motor_collection().find({}, {"user_id": 1}):
+            counters[doc["user_id"]] = dict(zero)
+
+        post_rows = Post.get_motor_collection().aggregate(
+            [
+                {"$match": NOT_DELETED},
+                {"$group": {"_id": "$user_id", "count": {"$sum": 1}}},
+            ],
+            allowDiskUse=True,
+        )
+        async for row in post_rows:
+            counters.setdefault(row["_id"], dict(zero))["total_posts"] = row["count"]
+
+        result_rows = PublishResult.get_motor_collection().aggregate(
+            [
+                {"$match": NOT_DELETED},
+                {"$group": {
+                    "_id": {"user_id": "$user_id", "status": "$status"},
+                    "count": {"$sum": 1},
+                }},
+            ],
+            allowDiskUse=True,
+        )
+        async for row in result_rows:
+            status = row["_id"]["status"]
+            if status in COUNTED_STATUSES:
+                counters.setdefault(row["_id"]["user_id"], dict(zero))[status] = row["count"]
+
+        for user_id, status_counts in (await cls.get_archived_status_counts()).items():
+            user_counters = counters.setdefault(user_id, dict(zero))
+            for status, count in status_counts.items():
+                if status in COUNTED_STATUSES:
+                    user_counters[status] += count
+
+        collection = UserStats.get_motor_collection()
+        operations = [
+            UpdateOne(
+                {"user_id": user_id},
+                {"$set": {**fields, "updated_at": now, "reconciled_at": now}},
+                upsert=True,
+            )
+            for user_id, fields in counters.items()
+        ]
+        for start in range(0, len(operations), RECONCILE_BATCH_SIZE):
+            await collection.bulk_write(operations[start:start + RECONCILE_BATCH_SIZE], ordered=False)
+
+        logger.info("Reconciled stats counters for %d users", len(operations))
+        return len(operations)
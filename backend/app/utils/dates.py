@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Normalize a query datetime to naive UTC, as stored in MongoDB."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def created_between(start: Optional[datetime], end: Optional[datetime]) -> Dict:
+    """Build a created_at range filter from optional bounds."""
+    bounds = {}
+    if start:
+        bounds["$gte"] = to_utc_naive(start)
+    if end:
+        bounds["$lt"] = to_utc_naive(end)
+    return {"created_at": bounds} if bounds else {}
@@ -0,0 +1,195 @@
+"""Prometheus metrics and the hooks that record them.
+
+Every metric is recorded in-process with a lock-protected increment, so
+collection stays cheap enough to leave on in production. Labels are
+bounded: routes are labelled by their template, never the raw path.
+With several worker processes, set PROMETHEUS_MULTIPROC_DIR so /metrics
+aggregates across them.
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Tuple
+import httpx
+from prometheus_client import Counter, Gauge, Histogram
+from pymongo import monitoring
+
+logger = logging.getLogger(__name__)
+
+# Bucket bounds in seconds
+FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PUBLISH_BUCKETS = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "API request latency by route template",
+    ["method", "route", "status"],
+    buckets=REQUEST_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "API requests currently being handled",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+PUBLISH_SECONDS = Histogram(
+    "publish_duration_seconds",
+    "Time to publish a post to a platform, by outcome (success, failure, error)",
+    ["platform", "outcome"],
+    buckets=PUBLISH_BUCKETS,
+)
+UPSTREAM_REQUEST_SECONDS = Histogram(
+    "upstream_request_duration_seconds",
+    "Platform and OAuth provider API latency to response headers",
+    ["host", "method", "status"],
+    buckets=REQUEST_BUCKETS,
+)
+MONGO_COMMAND_SECONDS = Histogram(
+    "mongodb_command_duration_seconds",
+    "MongoDB command latency by collection",
+    ["collection", "command"],
+    buckets=FAST_BUCKETS,
+)
+MONGO_COMMAND_FAILURES = Counter(
+    "mongodb_command_failures_total",
+    "MongoDB commands that returned an error",
+    ["collection", "command"],
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt time per password hash or verification",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0),
+)
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop wakes a sleeping task",
+    buckets=FAST_BUCKETS,
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency and in-flight counts of HTTP requests.
+
+    The route label is the matched route's template, which the router
+    stores in the shared scope during dispatch; unmatched paths are
+    grouped under "unmatched". A request is done once its response body
+    is sent, before any background tasks it started run. WebSocket
+    connections are not measured.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        done = False
+
+        def finish():
+            nonlocal done
+            if done:
+                return
+            done = True
+            in_flight.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.labels(
+                method, getattr(route, "path", "unmatched"), str(status_code)
+            ).observe(time.perf_counter() - start)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            finish()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that times each request per upstream host."""
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = await self.transport.handle_async_request(request)
+            status = str(response.status_code)
+            return response
+        finally:
+            UPSTREAM_REQUEST_SECONDS.labels(request.url.host, request.method, status).observe(
+                time.perf_counter() - start
+            )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """PyMongo command listener recording latency per collection and command.
+
+    The driver reports the duration on completion; the collection is only
+    in the started event, so it is kept until then.
+    """
+
+    def __init__(self):
+        self._collections: Dict[Tuple, str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        key = "collection" if event.command_name == "getMore" else event.command_name
+        collection = event.command.get(key)
+        self._collections[(event.connection_id, event.request_id)] = (
+            collection if isinstance(collection, str) else ""
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        MONGO_COMMAND_SECONDS.labels(collection, event.command_name).observe(event.duration_micros / 1e6)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        MONGO_COMMAND_SECONDS.labels(collection, event.command_name).observe(event.duration_micros / 1e6)
+        MONGO_COMMAND_FAILURES.labels(collection, event.command_name).inc()
+
+
+class EventLoopLagMonitor:
+    """Samples event-loop lag by measuring how late a periodic sleep wakes up."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, interval_seconds: float) -> None:
+        self._task = asyncio.create_task(self._run(interval_seconds), name="event-loop-lag")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self, interval_seconds: float) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(interval_seconds)
+            EVENT_LOOP_LAG_SECONDS.observe(max(0.0, loop.time() - start - interval_seconds))
+
+
+mongo_command_metrics = MongoCommandMetrics()
+event_loop_lag = EventLoopLagMonitor()
@@ -0,0 +1,81 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException, Response, status
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode(payload: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str) -> dict:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Invalid cursor"
+    )
+
+
+def encode_cursor(created_at: datetime, doc_id: ObjectId) -> str:
+    """Encode the sort key of the last item on a page as an opaque cursor."""
+    return _encode({"t": created_at.isoformat(), "id": str(doc_id)})
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+    """Decode a cursor produced by encode_cursor, raising 400 if it is malformed."""
+    try:
+        payload = _decode(cursor)
+        return datetime.fromisoformat(payload["t"]), ObjectId(payload["id"])
+    except (ValueError, KeyError, TypeError, InvalidId):
+        raise _invalid_cursor()
+
+
+def encode_score_cursor(score: float, doc_id: ObjectId) -> str:
+    """Encode the relevance score and id of the last search hit on a page."""
+    return _encode({"s": score, "id": str(doc_id)})
+
+
+def decode_score_cursor(cursor: str) -> Tuple[float, ObjectId]:
+    """Decode a cursor produced by encode_score_cursor, raising 400 if it is malformed."""
+    try:
+        payload = _decode(cursor)
+        return float(payload["s"]), ObjectId(payload["id"])
+    except (ValueError, KeyError, TypeError, InvalidId):
+        raise _invalid_cursor()
+
+
+def keyset_filter(cursor: Optional[str], field: str = "created_at") -> dict:
+    """Build the filter selecting items after the cursor in (field, _id) descending order."""
+    if not cursor:
+        return {}
+
+    created_at, doc_id = decode_cursor(cursor)
+    return {
+        "$or": [
+            {field: {"$lt": created_at}},
+            {field: created_at, "_id": {"$lt": doc_id}},
+        ]
+    }
+
+
+def set_next_cursor(response: Response, rows: list, limit: int, field: str = "created_at") -> list:
+    """Trim a limit+1 result set to limit rows and expose the next-page cursor.
+
+    Returns the rows for this page. The cursor header is only set when
+    another page exists.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last[field], last["_id"])
+    return rows
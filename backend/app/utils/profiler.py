@@ -0,0 +1,365 @@
+"""On-demand sampling profiler for a running worker.
+
+Stacks are snapshotted at a fixed interval and identical stacks are
+counted, so the cost is one stack walk per sample and nothing on the
+request path. When the event loop runs in the main thread it is sampled
+from a SIGPROF interval timer, which fires on CPU time and interrupts
+the loop mid-handler; a thread sampler would mostly catch it waiting in
+select, where it releases the GIL. Other threads (the threadpool running
+bcrypt and blocking calls) are sampled from a background thread.
+
+A session either samples every thread of the worker for its duration,
+or only the event loop while it runs matching requests and
+publish_to_platforms calls. Output is a speedscope profile or collapsed
+stacks, both readable by flamegraph tools.
+
+Sessions are per worker process; with several workers, each one profiles
+only the traffic it serves.
+"""
+import asyncio
+import functools
+import json
+import os
+import signal
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Literal, Optional, Tuple
+
+from app.config import get_settings
+
+settings = get_settings()
+
+ProfileFormat = Literal["speedscope", "collapsed"]
+
+# Stacks deeper than this are truncated at the root end
+MAX_STACK_DEPTH = 128
+
+# Innermost frames in these modules mean the thread is waiting, not working
+IDLE_MODULES = ("selectors.py", "threading.py", "queue.py")
+
+Frame = Tuple[str, str, int]  # Function, file, line
+
+
+@dataclass
+class ProfileSession:
+    """One profiling run and the stacks it has collected."""
+    id: str
+    seconds: float
+    interval_seconds: float
+    format: ProfileFormat
+    route: Optional[str] = None  # Route template or path prefix
+    header: Optional[Tuple[str, Optional[str]]] = None  # Lower-cased name, optional value
+    include_publish: bool = False
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+    samples: int = 0
+    stacks: Counter = field(default_factory=Counter)
+    path: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def filtered(self) -> bool:
+        """Whether only matching requests and publishes are sampled."""
+        return bool(self.route or self.header or self.include_publish)
+
+    def matches_request(self, scope: dict) -> bool:
+        """Whether a request's headers pass the header filter."""
+        if self.header is None:
+            return True
+        name, value = self.header
+        for key, raw in scope["headers"]:
+            if key.decode("latin-1").lower() == name:
+                return value is None or raw.decode("latin-1") == value
+        return False
+
+    def matches_route(self, scope: dict) -> bool:
+        """Whether a request passes the route filter; routing fills in the template."""
+        if self.route is None:
+            return True
+        route = scope.get("route")
+        return getattr(route, "path", None) == self.route or scope["path"].startswith(self.route)
+
+    def to_response(self) -> dict:
+        """Convert to API response format."""
+        return {
+            "id": self.id,
+            "status": "finished" if self.finished_at else "running",
+            "startedAt": self.started_at.isoformat(),
+            "finishedAt": self.finished_at.isoformat() if self.finished_at else None,
+            "seconds": self.seconds,
+            "intervalMs": self.interval_seconds * 1000,
+            "format": self.format,
+            "route": self.route,
+            "header": ": ".join(part for part in self.header if part) if self.header else None,
+            "includePublish": self.include_publish,
+            "samples": self.samples,
+            "error": self.error,
+        }
+
+
+class SamplingProfiler:
+    """Runs at most one profiling session at a time in this worker."""
+
+    def __init__(self):
+        self._session: Optional[ProfileSession] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        # Tasks eligible for sampling in a filtered session, read by the sampler thread
+        self._requests: Dict[asyncio.Task, dict] = {}
+        self._publishes: Dict[asyncio.Task, int] = {}
+        self._labels: Dict[object, Frame] = {}
+        self._timer = False  # Whether the loop is sampled by SIGPROF
+        self._previous_handler = None
+
+    @property
+    def session(self) -> Optional[ProfileSession]:
+        """The running or most recent session."""
+        return self._session
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(
+        self,
+        seconds: float,
+        interval_seconds: float,
+        format: ProfileFormat,
+        route: Optional[str] = None,
+        header: Optional[str] = None,
+        include_publish: bool = False,
+    ) -> ProfileSession:
+        """Start a session on the running event loop; raises RuntimeError if one is running."""
+        if self.running:
+            raise RuntimeError("A profiling session is already running")
+
+        header_filter = None
+        if header:
+            name, _, value = header.partition(":")
+            header_filter = (name.strip().lower(), value.strip() or None)
+
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._requests.clear()
+        self._publishes.clear()
+        self._stop.clear()
+        self._session = ProfileSession(
+            id=uuid.uuid4().hex,
+            seconds=seconds,
+            interval_seconds=interval_seconds,
+            format=format,
+            route=route,
+            header=header_filter,
+            include_publish=include_publish,
+        )
+        # Signal handlers can only be installed from the main thread
+        self._timer = hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+        if self._timer:
+            self._previous_handler = signal.signal(signal.SIGPROF, self._on_timer)
+            signal.setitimer(signal.ITIMER_PROF, interval_seconds, interval_seconds)
+
+        self._thread = threading.Thread(
+            target=self._sample_loop, args=(self._session,), name="profiler", daemon=True
+        )
+        self._thread.start()
+        return self._session
+
+    def stop(self) -> Optional[ProfileSession]:
+        """Stop the running session early and wait for its output to be written."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self._session
+
+    def output_path(self, session_id: str, format: ProfileFormat) -> str:
+        extension = "speedscope.json" if format == "speedscope" else "collapsed.txt"
+        return os.path.join(settings.profiler_output_dir, f"profile-{session_id}.{extension}")
+
+    def watch_request(self, scope: dict) -> Optional[asyncio.Task]:
+        """Make the current request's task eligible for sampling if it passes the filters."""
+        session = self._session
+        if session is None or session.finished_at or not (session.route or session.header):
+            return None
+        if not session.matches_request(scope):
+            return None
+        task = asyncio.current_task()
+        self._requests[task] = scope
+        return task
+
+    def unwatch_request(self, task: asyncio.Task) -> None:
+        self._requests.pop(task, None)
+
+    @contextmanager
+    def watch_publish(self):
+        """Make the current task eligible for sampling while it publishes."""
+        session = self._session
+        if session is None or session.finished_at or not session.include_publish:
+            yield
+            return
+
+        task = asyncio.current_task()
+        self._publishes[task] = self._publishes.get(task, 0) + 1
+        try:
+            yield
+        finally:
+            # The session may have ended and cleared its tasks meanwhile
+            remaining = self._publishes.get(task, 0) - 1
+            if remaining > 0:
+                self._publishes[task] = remaining
+            else:
+                self._publishes.pop(task, None)
+
+    def publish_task(self, func):
+        """Decorate the background publish function so includePublish sessions sample it."""
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with self.watch_publish():
+                return await func(*args, **kwargs)
+        return wrapper
+
+    def _sample_loop(self, session: ProfileSession) -> None:
+        deadline = time.monotonic() + session.seconds
+        sampler_id = threading.get_ident()
+        try:
+            while not self._stop.wait(session.interval_seconds) and time.monotonic() < deadline:
+                if not self._timer:
+                    self._sample_loop_thread(session, sys._current_frames().get(self._loop_thread_id))
+                if not session.filtered:
+                    self._sample_other_threads(session, sampler_id)
+            self._stop.set()  # Makes the timer handler ignore signals still in flight
+            if self._timer:
+                signal.setitimer(signal.ITIMER_PROF, 0)
+                self._loop.call_soon_threadsafe(signal.signal, signal.SIGPROF, self._previous_handler)
+            session.path = self._write(session)
+        except Exception as error:
+            session.error = repr(error)
+        finally:
+            self._requests.clear()
+            self._publishes.clear()
+            session.finished_at = datetime.utcnow()
+
+    def _on_timer(self, signum, frame) -> None:
+        session = self._session
+        if session is not None and not self._stop.is_set():
+            self._sample_loop_thread(session, frame)
+
+    def _sample_loop_thread(self, session: ProfileSession, frame) -> None:
+        if frame is None or frame.f_code.co_filename.endswith(IDLE_MODULES):
+            return
+        if session.filtered:
+            task = asyncio.current_task(self._loop)
+            if task is None:
+                return
+            scope = self._requests.get(task)
+            if task not in self._publishes and (scope is None or not session.matches_route(scope)):
+                return
+        self._record(session, "event-loop", frame)
+
+    def _sample_other_threads(self, session: ProfileSession, sampler_id: int) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id in (sampler_id, self._loop_thread_id) or frame.f_code.co_filename.endswith(IDLE_MODULES):
+                continue
+            self._record(session, names.get(thread_id, str(thread_id)), frame)
+
+    def _record(self, session: ProfileSession, thread_name: str, frame) -> None:
+        stack: List[Frame] = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = (code.co_qualname, code.co_filename, code.co_firstlineno)
+                self._labels[code] = label
+            stack.append(label)
+            frame = frame.f_back
+        stack.append((thread_name, "", 0))
+        stack.reverse()
+        session.stacks[tuple(stack)] += 1
+        session.samples += 1
+
+    def _write(self, session: ProfileSession) -> str:
+        os.makedirs(settings.profiler_output_dir, exist_ok=True)
+        path = self.output_path(session.id, session.format)
+        with open(path, "w") as output:
+            if session.format == "collapsed":
+                for stack, count in sorted(list(session.stacks.items()), key=lambda item: -item[1]):
+                    names = ";".join(
+                        f"{name} ({short_path(file)}:{line})" if file else name for name, file, line in stack
+                    )
+                    output.write(f"{names} {count}\n")
+            else:
+                json.dump(speedscope_profile(session), output)
+        return path
+
+
+def short_path(filename: str) -> str:
+    """Shorten a source path to its package-relative form."""
+    marker = "site-packages" + os.sep
+    if marker in filename:
+        return filename.split(marker, 1)[1]
+    cwd = os.getcwd() + os.sep
+    return filename[len(cwd):] if filename.startswith(cwd) else filename
+
+
+def speedscope_profile(session: ProfileSession) -> dict:
+    """Build a speedscope sampled profile from a session's stack counts."""
+    frames: Dict[Frame, int] = {}
+    samples, weights = [], []
+    for stack, count in list(session.stacks.items()):
+        samples.append([frames.setdefault(frame, len(frames)) for frame in stack])
+        weights.append(count * session.interval_seconds)
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": f"{settings.app_name} {session.started_at.isoformat()}",
+        "exporter": settings.app_name,
+        "shared": {
+            "frames": [
+                {"name": name, "file": short_path(file), "line": line} if file else {"name": name}
+                for name, file, line in frames
+            ],
+        },
+        "profiles": [{
+            "type": "sampled",
+            "name": "samples",
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        }],
+    }
+
+
+class ProfilerMiddleware:
+    """ASGI middleware marking requests a filtered profiling session should sample.
+
+    The request task stays marked until the response and any background
+    tasks it runs have finished.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not profiler.running:
+            await self.app(scope, receive, send)
+            return
+
+        task = profiler.watch_request(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if task is not None:
+                profiler.unwatch_request(task)
+
+
+profiler = SamplingProfiler()
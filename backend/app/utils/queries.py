@@ -0,0 +1,296 @@
+"""Filters, sort orders and pipelines for the application's MongoDB queries.
+
+Routers and services build their queries here, and scripts/audit_indexes
+explains the same builders, so the index audit always checks the queries
+the application actually runs.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+from bson import ObjectId
+
+from app.models.post import NOT_DELETED, POST_RESPONSE_PROJECTION
+from app.utils.dates import created_between
+from app.utils.pagination import decode_score_cursor, keyset_filter
+
+# Keyset page order for feeds, and creation order for exports
+NEWEST_FIRST = [("created_at", -1), ("_id", -1)]
+OLDEST_FIRST = [("created_at", 1), ("_id", 1)]
+
+# Archive scan order, oldest update first
+LEAST_RECENTLY_UPDATED = [("updated_at", 1)]
+
+# Oldest hit first, to compute when a rate limit window frees up
+OLDEST_HIT_FIRST = [("created_at", 1)]
+
+
+# Posts
+
+def posts_filter(
+    user_id: str,
+    status: Optional[str] = None,
+    platform: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+) -> Dict:
+    """A user's live posts, optionally filtered and after a keyset cursor."""
+    query = {"user_id": user_id, **NOT_DELETED, **created_between(start, end), **keyset_filter(cursor)}
+    if status:
+        query["status"] = status
+    if platform:
+        query["platforms"] = platform
+    return query
+
+
+def post_search_pipeline(
+    user_id: str,
+    q: str,
+    limit: int,
+    status: Optional[str] = None,
+    platform: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> List[Dict]:
+    """Text search over a user's captions, best match first, one page past a score cursor."""
+    match = {"user_id": user_id, "$text": {"$search": q}, **NOT_DELETED}
+    if status:
+        match["status"] = status
+    if platform:
+        match["platforms"] = platform
+
+    pipeline = [
+        {"$match": match},
+        {"$addFields": {"score": {"$meta": "textScore"}}},
+    ]
+    if cursor:
+        score, doc_id = decode_score_cursor(cursor)
+        pipeline.append({"$match": {"$or": [
+            {"score": {"$lt": score}},
+            {"score": score, "_id": {"$lt": doc_id}},
+        ]}})
+    pipeline += [
+        {"$sort": {"score": -1, "_id": -1}},
+        {"$limit": limit + 1},
+        {"$project": {**POST_RESPONSE_PROJECTION, "score": 1}},
+    ]
+    return pipeline
+
+
+def purgeable_posts_filter(cutoff: datetime) -> Dict:
+    """Posts soft-deleted before the retention cutoff."""
+    return {"deleted_at": {"$lt": cutoff}}
+
+
+# Publish results
+
+def results_filter(
+    user_id: str,
+    status: Optional[str] = None,
+    platform: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+) -> Dict:
+    """A user's live publish results, optionally filtered and after a keyset cursor."""
+    query = {"user_id": user_id, **NOT_DELETED, **created_between(start, end), **keyset_filter(cursor)}
+    if status:
+        query["status"] = status
+    if platform:
+        query["platform_id"] = platform
+    return query
+
+
+def post_results_filter(user_id: str, post_id: str, platform_id: Optional[str] = None) -> Dict:
+    """A post's publish results, or its result for one platform."""
+    query = {"user_id": user_id, "post_id": post_id}
+    if platform_id:
+        query["platform_id"] = platform_id
+    return query
+
+
+def posts_results_filter(user_id: str, post_ids: Sequence[str]) -> Dict:
+    """The publish results of several of a user's posts."""
+    return {"user_id": user_id, "post_id": {"$in": list(post_ids)}}
+
+
+def in_flight_results_filter(user_id: str) -> Dict:
+    """A user's results still waiting for or being published."""
+    return {"user_id": user_id, "status": {"$in": ["pending", "in_progress"]}, **NOT_DELETED}
+
+
+def claimable_result_filter(user_id: str, post_id: str, platform_id: str, now: datetime) -> Dict:
+    """A pending result, or an in-progress one whose executor's lease has expired."""
+    return {
+        **post_results_filter(user_id, post_id, platform_id),
+        **NOT_DELETED,
+        "$or": [
+            {"status": "pending"},
+            {"status": "in_progress", "lease_expires_at": {"$lt": now}},
+        ],
+    }
+
+
+def stalled_results_filter(now: datetime, stalled_before: datetime) -> Dict:
+    """Results left pending since stalled_before, or in progress under an expired lease."""
+    return {
+        "$or": [
+            {"status": "pending", "updated_at": {"$lt": stalled_before}},
+            {"status": "in_progress", "lease_expires_at": {"$lt": now}},
+        ],
+        **NOT_DELETED,
+    }
+
+
+def archivable_results_filter(statuses: Sequence[str], cutoff: datetime) -> Dict:
+    """Live results in one of statuses last updated before the cutoff."""
+    return {"status": {"$in": list(statuses)}, "updated_at": {"$lt": cutoff}, **NOT_DELETED}
+
+
+def engagement_ingest_filter(since: datetime) -> Dict:
+    """Results published on a platform since the engagement lookback start."""
+    return {
+        "status": "published",
+        "published_at": {"$gte": since},
+        "platform_post_id": {"$ne": None},
+        **NOT_DELETED,
+    }
+
+
+def result_status_counts_pipeline(user_id: str) -> List[Dict]:
+    """Count a user's live publish results by status."""
+    return [
+        {"$match": {"user_id": user_id, **NOT_DELETED}},
+        {"$group": {"_id": "$status", "count": {"$sum": 1}}},
+    ]
+
+
+def published_slots_pipeline(user_id: str, archive_collection: str) -> List[Dict]:
+    """Count a user's published results, live and archived, per platform, weekday and hour."""
+    return [
+        {"$match": {
+            "user_id": user_id, "status": "published", "published_at": {"$ne": None}, **NOT_DELETED,
+        }},
+        {"$unionWith": {
+            "coll": archive_collection,
+            "pipeline": [
+                {"$match": {"u": user_id}},
+                {"$unwind": "$r"},
+                {"$match": {"r.s": "published"}},
+                {"$project": {"platform_id": "$p", "published_at": "$r.t"}},
+            ],
+        }},
+        {"$group": {
+            "_id": {
+                "platform_id": "$platform_id",
+                "dow": {"$dayOfWeek": "$published_at"},  # 1 = Sunday
+                "hour": {"$hour": "$published_at"},
+            },
+            "count": {"$sum": 1},
+        }},
+    ]
+
+
+# Publish result archive
+
+def archived_post_filter(user_id: str, post_id: str) -> Dict:
+    """Archive buckets holding results of a post."""
+    return {"u": user_id, "r.i": ObjectId(post_id)}
+
+
+def archived_results_filter(user_ids: Sequence[str], result_ids: Sequence[ObjectId]) -> Dict:
+    """Archive buckets holding any of the given results."""
+    return {"u": {"$in": list(user_ids)}, "r._id": {"$in": list(result_ids)}}
+
+
+def archived_status_counts_pipeline(user_id: Optional[str] = None) -> List[Dict]:
+    """Count archived results by user and status from the bucket totals."""
+    pipeline: List[Dict] = []
+    if user_id:
+        pipeline.append({"$match": {"u": user_id}})
+    pipeline += [
+        {"$project": {"u": 1, "c": {"$objectToArray": "$c"}}},
+        {"$unwind": "$c"},
+        {"$group": {"_id": {"user_id": "$u", "status": "$c.k"}, "count": {"$sum": "$c.v"}}},
+    ]
+    return pipeline
+
+
+def archived_results_export_pipeline(
+    user_id: str,
+    status: Optional[str] = None,
+    platform: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> List[Dict]:
+    """Unwind a user's archived results into raw publish result shape.
+
+    Rows come out by the day their results finished, so exports read
+    buckets in index order instead of sorting every row.
+    """
+    bucket_match: Dict = {"u": user_id}
+    if platform:
+        bucket_match["p"] = platform
+    row_match: Dict = {}
+    created = created_between(start, end)
+    if created:
+        row_match["r.c"] = created["created_at"]
+    if status:
+        row_match["r.s"] = status
+
+    pipeline: List[Dict] = [
+        {"$match": bucket_match},
+        {"$sort": {"d": 1, "_id": 1}},
+        {"$unwind": "$r"},
+    ]
+    if row_match:
+        pipeline.append({"$match": row_match})
+    pipeline.append({"$project": {
+        "_id": "$r._id",
+        "post_id": {"$toString": "$r.i"},
+        "platform_id": "$p",
+        "status": "$r.s",
+        "published_at": {"$cond": [{"$eq": ["$r.s", "published"]}, "$r.t", None]},
+        "post_url": "$r.l",
+        "error": "$r.e",
+        "created_at": "$r.c",
+    }})
+    return pipeline
+
+
+# Accounts, counters and rate limits
+
+def accounts_filter(user_id: str) -> Dict:
+    """A user's connected accounts."""
+    return {"user_id": user_id}
+
+
+def active_accounts_filter(user_id: str) -> Dict:
+    """A user's active connected accounts."""
+    return {"user_id": user_id, "is_active": True}
+
+
+def user_stats_filter(user_id: str) -> Dict:
+    """A user's dashboard counters document."""
+    return {"user_id": user_id}
+
+
+def rollup_range_filter(
+    user_id: str, granularity: str, platform_key: str, first_bucket: datetime, end: datetime
+) -> Dict:
+    """A user's rollup buckets of one granularity and platform between two times."""
+    return {
+        "user_id": user_id,
+        "granularity": granularity,
+        "platform_id": platform_key,
+        "bucket": {"$gte": first_bucket, "$lte": end},
+    }
+
+
+def best_time_profile_filter(user_id: str, platform_key: str) -> Dict:
+    """A user's best-time profile for one platform, or "*" for all."""
+    return {"user_id": user_id, "platform_id": platform_key}
+
+
+def rate_limit_window_filter(key: str, window_start: datetime) -> Dict:
+    """Hits recorded for a rate limit key inside the current window."""
+    return {"key": key, "created_at": {"$gt": window_start}}
@@ -0,0 +1,196 @@
+"""OpenTelemetry tracing for API routes, MongoDB commands and upstream calls.
+
+Spans are only recorded once configure_tracing() has installed a tracer
+provider; until then every tracer is a no-op. Traces are sampled by
+TRACING_SAMPLE_RATIO at the root and follow the parent's decision below
+it, including a sampled traceparent header sent by the client.
+"""
+import functools
+import logging
+from typing import Dict, Optional, Tuple
+import httpx
+from opentelemetry import propagate, trace
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from pymongo import monitoring
+
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer("app")
+
+_provider: Optional[TracerProvider] = None
+
+
+def span_line(span: ReadableSpan) -> str:
+    """Format a finished span as one JSON line."""
+    return span.to_json(indent=None) + "\n"
+
+
+def configure_tracing() -> None:
+    """Install the sampling tracer provider and the configured exporter."""
+    global _provider
+    if _provider is not None:
+        return
+
+    if settings.tracing_exporter == "file":
+        exporter = ConsoleSpanExporter(out=open(settings.tracing_file_path, "a"), formatter=span_line)
+    else:
+        exporter = ConsoleSpanExporter(formatter=span_line)
+
+    _provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: settings.app_name}),
+        sampler=ParentBased(TraceIdRatioBased(settings.tracing_sample_ratio)),
+    )
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(_provider)
+    logger.info("Tracing %.0f%% of requests to %s", settings.tracing_sample_ratio * 100, settings.tracing_exporter)
+
+
+def shutdown_tracing() -> None:
+    """Flush buffered spans to the exporter."""
+    if _provider is not None:
+        _provider.shutdown()
+
+
+def traced(name: str):
+    """Run an async function inside a span, as a child of the caller's span if any."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span per HTTP request.
+
+    The span is named after the matched route template once routing has
+    run and ends when the response is complete, so background tasks
+    started by the request appear as children that outlive it.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        span = tracer.start_span(
+            f"{method} {scope['path']}",
+            context=propagate.extract(headers),
+            kind=SpanKind.SERVER,
+            attributes={"http.method": method, "http.target": scope["path"]},
+        )
+
+        ended = False
+
+        def end_span():
+            nonlocal ended
+            if ended:
+                return
+            ended = True
+            route = scope.get("route")
+            if route is not None:
+                span.update_name(f"{method} {route.path}")
+                span.set_attribute("http.route", route.path)
+            span.end()
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.status_code", message["status"])
+                if message["status"] >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                end_span()
+
+        try:
+            with trace.use_span(span, end_on_exit=False):
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            end_span()
+
+
+class TracingTransport(httpx.AsyncBaseTransport):
+    """httpx transport opening a client span per upstream request.
+
+    Trace headers are not sent, since the upstreams are third-party APIs.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with tracer.start_as_current_span(
+            f"{request.method} {request.url.host}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                "http.method": request.method,
+                "net.peer.name": request.url.host,
+                "http.target": request.url.path,
+            },
+        ) as span:
+            response = await self.transport.handle_async_request(request)
+            span.set_attribute("http.status_code", response.status_code)
+            if response.status_code >= 400:
+                span.set_status(Status(StatusCode.ERROR))
+            return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class MongoCommandTracer(monitoring.CommandListener):
+    """PyMongo command listener recording a client span per command.
+
+    Commands are only traced inside a sampled trace, so driver traffic
+    outside requests and traced jobs (cursor tailing, health pings)
+    creates no spans. Motor runs commands with the caller's context, so
+    spans nest under the active request or job span.
+    """
+
+    def __init__(self):
+        self._spans: Dict[Tuple, trace.Span] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if not trace.get_current_span().is_recording():
+            return
+
+        key = "collection" if event.command_name == "getMore" else event.command_name
+        collection = event.command.get(key)
+        collection = collection if isinstance(collection, str) else ""
+        self._spans[(event.connection_id, event.request_id)] = tracer.start_span(
+            f"{event.command_name} {collection}".strip(),
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": "mongodb",
+                "db.name": event.database_name,
+                "db.operation": event.command_name,
+                "db.mongodb.collection": collection,
+            },
+        )
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        span = self._spans.pop((event.connection_id, event.request_id), None)
+        if span is not None:
+            span.end()
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        span = self._spans.pop((event.connection_id, event.request_id), None)
+        if span is not None:
+            span.set_status(Status(StatusCode.ERROR, str(event.failure.get("errmsg", ""))))
+            span.end()
+
+
+mongo_command_tracer = MongoCommandTracer()
@@ -0,0 +1,6 @@
+import os
+import socket
+import uuid
+
+# Identifies this process in leases and claims; unique across hosts and restarts
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
@@ -4,25 +4,97 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
 from app.database import init_db, close_db
+from app.services.archive_service import ArchiveService
+from app.services.engagement_service import EngagementService
+from app.services.health_service import HealthService
+from app.services.http_client import upstream_http
+from app.services.post_service import PostService
+from app.services.publish_events import publish_events
+from app.services.scheduler import scheduler
+from app.services.stats_service import StatsService
+from app.utils.metrics import MetricsMiddleware, event_loop_lag
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.profiler import ProfilerMiddleware
+from app.utils.tracing import TracingMiddleware, configure_tracing, shutdown_tracing
 from app.routers import (
     auth_router,
     accounts_router,
     posts_router,
     publish_router,
     stats_router,
+    exports_router,
+    health_router,
+    metrics_router,
+    admin_router,
 )
+from app.routers.publish import resume_stalled_publishes
 
 settings = get_settings()
 
+# Before uvicorn installs its signal handlers, which happens after it imports the app
+HealthService.install_drain_handler()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown."""
     # Startup
+    if settings.tracing_enabled:
+        configure_tracing()
     await init_db()
+    await publish_events.start()
+    await upstream_http.start()
+    if settings.metrics_enabled:
+        await event_loop_lag.start(settings.event_loop_lag_interval_seconds)
+    if settings.scheduler_enabled:
+        scheduler.add_job(
+            "reconcile_user_stats",
+            StatsService.reconcile_all,
+            settings.stats_reconcile_interval_seconds,
+            initial_delay_seconds=60,
+        )
+        scheduler.add_job(
+            "ingest_engagement",
+            EngagementService.ingest_recent,
+            settings.engagement_ingest_interval_seconds,
+            initial_delay_seconds=120,
+        )
+        scheduler.add_job(
+            "purge_deleted_posts",
+            PostService.purge_deleted,
+            settings.post_purge_interval_seconds,
+            initial_delay_seconds=180,
+        )
+        scheduler.add_job(
+            "cleanup_orphaned_results",
+            PostService.cleanup_orphaned_results,
+            settings.orphan_cleanup_interval_seconds,
+            initial_delay_seconds=300,
+        )
+        scheduler.add_job(
+            "resume_stalled_publishes",
+            resume_stalled_publishes,
+            settings.publish_resume_interval_seconds,
+            initial_delay_seconds=30,
+        )
+        scheduler.add_job(
+            "archive_publish_results",
+            ArchiveService.archive_results,
+            settings.result_archive_interval_seconds,
+            initial_delay_seconds=420,
+        )
+        await scheduler.start()
+    await HealthService.warm_up()
+    HealthService.set_ready(True)
     yield
-    # Shutdown
+    # Shutdown; readiness already failed when SIGTERM arrived
+    HealthService.set_ready(False)
+    await scheduler.stop()
+    await publish_events.stop()
+    await upstream_http.stop()
+    await event_loop_lag.stop()
     await close_db()
+    shutdown_tracing()
 
 
 # Create FastAPI application
@@ -52,14 +124,29 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# Marks requests for filtered profiling sessions; a no-op when none is running
+app.add_middleware(ProfilerMiddleware)
+
+# Request tracing and metrics; added last so they are outermost and time the whole stack
+if settings.tracing_enabled:
+    app.add_middleware(TracingMiddleware)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(accounts_router)
 app.include_router(posts_router)
 app.include_router(publish_router)
 app.include_router(stats_router)
+app.include_router(exports_router)
+app.include_router(health_router)
+app.include_router(admin_router)
+if settings.metrics_enabled:
+    app.include_router(metrics_router)
 
 
 @app.get("/")
@@ -72,16 +159,6 @@ async def root():
     }
 
 
-@app.get("/health")
-async def health_check():
-    """Detailed health check endpoint."""
-    return {
-        "status": "healthy",
-        "database": "connected",
-        "version": "1.0.0",
-    }
-
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
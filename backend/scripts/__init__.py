@@ -0,0 +1 @@
+"""Command-line tools and benchmarks (run with python -m scripts.<name>)."""
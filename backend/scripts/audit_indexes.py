@@ -0,0 +1,297 @@
+"""Explain the application's queries and flag collection scans and in-memory sorts.
+
+Seeds a throwaway database on a local MongoDB (MONGODB_URL, default
+mongodb://localhost:27017) with the declared indexes, runs explain() on
+each query the routers and services issue, and prints the winning plan.
+Exits non-zero if any query needs a COLLSCAN or a blocking SORT, so it can
+gate index changes in CI.
+
+Usage (from the backend directory):
+
+    python -m scripts.audit_indexes
+    python -m scripts.audit_indexes --users 50 --posts 500 --verbose
+"""
+import argparse
+import asyncio
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from bson import ObjectId
+
+from app.models.account import ACCOUNT_RESPONSE_PROJECTION
+from app.models.post import POST_RESPONSE_PROJECTION, RESULT_RESPONSE_PROJECTION
+from app.routers.publish import PUBLISH_RESUME_BATCH_SIZE
+from app.services.archive_service import ARCHIVE_BATCH_SIZE
+from app.services.post_service import DELETE_BATCH_SIZE
+from app.services.stats_service import ALL_PLATFORMS, TERMINAL_STATUSES, bucket_start
+from app.utils.pagination import encode_cursor
+from app.utils.queries import (
+    LEAST_RECENTLY_UPDATED,
+    NEWEST_FIRST,
+    OLDEST_FIRST,
+    OLDEST_HIT_FIRST,
+    accounts_filter,
+    active_accounts_filter,
+    archivable_results_filter,
+    archived_post_filter,
+    archived_results_export_pipeline,
+    archived_results_filter,
+    archived_status_counts_pipeline,
+    best_time_profile_filter,
+    claimable_result_filter,
+    engagement_ingest_filter,
+    in_flight_results_filter,
+    post_results_filter,
+    post_search_pipeline,
+    posts_filter,
+    posts_results_filter,
+    published_slots_pipeline,
+    purgeable_posts_filter,
+    rate_limit_window_filter,
+    result_status_counts_pipeline,
+    results_filter,
+    rollup_range_filter,
+    stalled_results_filter,
+    user_stats_filter,
+)
+from scripts.bench_utils import bench_database
+
+PLATFORMS = ["twitter", "facebook", "instagram", "linkedin"]
+STATUSES = ["published"] * 8 + ["failed", "pending"]
+
+# Plan stages that mean the query is not served by an index
+FLAGGED_STAGES = {
+    "COLLSCAN": "collection scan",
+    "SORT": "in-memory sort",
+}
+
+
+@dataclass
+class AuditQuery:
+    """A query as issued by the application, in a form explain() accepts."""
+    name: str
+    collection: str
+    filter: Optional[dict] = None
+    sort: Optional[List[Tuple[str, int]]] = None
+    projection: Optional[dict] = None
+    limit: Optional[int] = None
+    pipeline: Optional[list] = None
+    count: bool = False
+    sort_expected: bool = False  # Ranked by a computed score, so a blocking sort is inherent
+
+    def explain_command(self) -> dict:
+        """Wrap the query in a queryPlanner-verbosity explain command."""
+        if self.pipeline is not None:
+            command = {"aggregate": self.collection, "pipeline": self.pipeline, "cursor": {}}
+        elif self.count:
+            command = {"count": self.collection, "query": self.filter or {}}
+        else:
+            command = {"find": self.collection, "filter": self.filter or {}}
+            if self.sort:
+                command["sort"] = dict(self.sort)
+            if self.projection:
+                command["projection"] = self.projection
+            if self.limit:
+                command["limit"] = self.limit
+        return {"explain": command, "verbosity": "queryPlanner"}
+
+
+def app_queries(user_id: str, post_id: str, now: datetime) -> List[AuditQuery]:
+    """The queries issued by routers and services, for one seeded user and post.
+
+    Filters, sorts and pipelines come from the builders the application
+    uses, so the audit follows the routers and services as they change.
+    """
+    page_two = encode_cursor(now - timedelta(days=1), ObjectId())
+    last_month = now - timedelta(days=30)
+
+    return [
+        # Posts
+        AuditQuery("GET /posts", "posts", posts_filter(user_id), NEWEST_FIRST, POST_RESPONSE_PROJECTION, 21),
+        AuditQuery("GET /posts?cursor", "posts", posts_filter(user_id, cursor=page_two), NEWEST_FIRST, POST_RESPONSE_PROJECTION, 21),
+        AuditQuery("GET /posts?status", "posts", posts_filter(user_id, status="completed"), NEWEST_FIRST, POST_RESPONSE_PROJECTION, 21),
+        AuditQuery("GET /posts?platform", "posts", posts_filter(user_id, platform="twitter"), NEWEST_FIRST, POST_RESPONSE_PROJECTION, 21),
+        AuditQuery("GET /exports/posts", "posts", posts_filter(user_id, start=last_month, end=now), OLDEST_FIRST, POST_RESPONSE_PROJECTION),
+        AuditQuery("GET /posts/search", "posts", pipeline=post_search_pipeline(user_id, "post", 20), sort_expected=True),
+        AuditQuery("reconcile_user post count", "posts", posts_filter(user_id), count=True),
+        AuditQuery("purge soft-deleted posts", "posts", purgeable_posts_filter(now), projection={"_id": 1, "user_id": 1}, limit=DELETE_BATCH_SIZE),
+
+        # Publish results
+        AuditQuery("publish result lookup", "publish_results", post_results_filter(user_id, post_id, "twitter")),
+        AuditQuery("GET /publish/{post_id}", "publish_results", post_results_filter(user_id, post_id), projection=RESULT_RESPONSE_PROJECTION),
+        AuditQuery("cascade delete", "publish_results", posts_results_filter(user_id, [post_id])),
+        AuditQuery("GET /stats/activity", "publish_results", results_filter(user_id), NEWEST_FIRST, limit=11),
+        AuditQuery("GET /stats/activity?cursor", "publish_results", results_filter(user_id, cursor=page_two), NEWEST_FIRST, limit=11),
+        AuditQuery("GET /exports/publish-results", "publish_results", results_filter(user_id, start=last_month, end=now), OLDEST_FIRST),
+        AuditQuery("WS snapshot (in flight)", "publish_results", in_flight_results_filter(user_id)),
+        AuditQuery("WS snapshot (post)", "publish_results", post_results_filter(user_id, post_id)),
+        AuditQuery("status counts", "publish_results", pipeline=result_status_counts_pipeline(user_id)),
+        AuditQuery("engagement ingest", "publish_results", engagement_ingest_filter(last_month)),
+        AuditQuery("publish claim", "publish_results", claimable_result_filter(user_id, post_id, "twitter", now)),
+        AuditQuery("stalled publishes", "publish_results", stalled_results_filter(now, now - timedelta(minutes=2)), limit=PUBLISH_RESUME_BATCH_SIZE),
+        AuditQuery(
+            "archive scan", "publish_results", archivable_results_filter(TERMINAL_STATUSES, now - timedelta(days=90)),
+            LEAST_RECENTLY_UPDATED, limit=ARCHIVE_BATCH_SIZE,
+        ),
+        AuditQuery("best times rebuild", "publish_results", pipeline=published_slots_pipeline(user_id, "publish_results_archive")),
+
+        # Publish result archive
+        AuditQuery("archived results of a post", "publish_results_archive", archived_post_filter(user_id, post_id)),
+        AuditQuery("archived status counts", "publish_results_archive", pipeline=archived_status_counts_pipeline(user_id)),
+        AuditQuery("archived result lookup", "publish_results_archive", archived_results_filter([user_id], [ObjectId()])),
+        AuditQuery("archived results export", "publish_results_archive", pipeline=archived_results_export_pipeline(user_id)),
+
+        # Connected accounts
+        AuditQuery("GET /accounts", "connected_accounts", accounts_filter(user_id), projection=ACCOUNT_RESPONSE_PROJECTION),
+        AuditQuery("active accounts", "connected_accounts", active_accounts_filter(user_id)),
+
+        # Derived collections
+        AuditQuery("dashboard counters", "user_stats", user_stats_filter(user_id)),
+        AuditQuery("GET /stats/timeseries", "publish_rollups", rollup_range_filter(
+            user_id, "day", ALL_PLATFORMS, bucket_start(last_month, "day"), now,
+        )),
+        AuditQuery("best times profile", "best_time_profiles", best_time_profile_filter(user_id, ALL_PLATFORMS)),
+        AuditQuery(
+            "login rate limit window", "rate_limit_hits",
+            rate_limit_window_filter("login:ip:127.0.0.1", now - timedelta(minutes=5)), OLDEST_HIT_FIRST, limit=1,
+        ),
+    ]
+
+
+async def seed(database, users: int, posts_per_user: int, now: datetime) -> None:
+    """Insert a realistic spread of users, posts, results, accounts and rollups."""
+    for u in range(users):
+        user_id = f"user-{u}"
+        posts, results = [], []
+        for i in range(posts_per_user):
+            created_at = now - timedelta(hours=i * 3)
+            post_id = ObjectId()
+            posts.append({
+                "_id": post_id,
+                "user_id": user_id,
+                "caption": f"Post {i}",
+                "media_files": [],
+                "media_types": [],
+                "platforms": PLATFORMS[: 1 + i % len(PLATFORMS)],
+                "scheduled_for": None,
+                "status": "completed" if i % 5 else "failed",
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+            for platform_id in PLATFORMS[: 1 + i % len(PLATFORMS)]:
+                status = STATUSES[(i + u) % len(STATUSES)]
+                results.append({
+                    "post_id": str(post_id),
+                    "user_id": user_id,
+                    "platform_id": platform_id,
+                    "status": status,
+                    "progress": 100,
+                    "published_at": created_at if status == "published" else None,
+                    "post_url": None,
+                    "platform_post_id": str(i) if status == "published" else None,
+                    "error": None,
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                })
+        await database.posts.insert_many(posts, ordered=False)
+        await database.publish_results.insert_many(results, ordered=False)
+
+        await database.connected_accounts.insert_many([
+            {
+                "user_id": user_id,
+                "platform_id": platform_id,
+                "platform_name": platform_id.title(),
+                "username": f"{user_id}-{platform_id}",
+                "display_name": user_id,
+                "access_token": "token",
+                "platform_user_id": platform_id,
+                "is_active": True,
+                "connected_at": now,
+            }
+            for platform_id in PLATFORMS
+        ], ordered=False)
+        await database.user_stats.insert_one({"user_id": user_id, "total_posts": posts_per_user})
+        await database.publish_rollups.insert_many([
+            {
+                "user_id": user_id,
+                "granularity": "day",
+                "platform_id": "*",
+                "bucket": bucket_start(now - timedelta(days=d), "day"),
+                "published": 1,
+                "failed": 0,
+            }
+            for d in range(60)
+        ], ordered=False)
+        await database.best_time_profiles.insert_one({"user_id": user_id, "platform_id": "*"})
+
+
+def walk_plan(node: Any, stages: List[str], indexes: Set[str], sorts: List[str]) -> None:
+    """Collect stage names and index names from a (possibly nested) explain document."""
+    if isinstance(node, dict):
+        if isinstance(node.get("stage"), str):
+            stages.append(node["stage"])
+        if isinstance(node.get("indexName"), str):
+            indexes.add(node["indexName"])
+        if "$sort" in node:
+            sorts.append("$sort")
+        for key, value in node.items():
+            if key not in ("rejectedPlans", "command"):
+                walk_plan(value, stages, indexes, sorts)
+    elif isinstance(node, list):
+        for item in node:
+            walk_plan(item, stages, indexes, sorts)
+
+
+def audit(explain: Dict) -> Dict:
+    """Summarize a winning plan and the reasons it should be flagged."""
+    stages: List[str] = []
+    indexes: Set[str] = set()
+    sorts: List[str] = []
+    walk_plan(explain, stages, indexes, sorts)
+
+    flags = sorted({FLAGGED_STAGES[stage] for stage in stages if stage in FLAGGED_STAGES})
+    if sorts and "in-memory sort" not in flags:
+        flags.append("in-memory sort")  # Blocking $sort stage outside the cursor
+    return {"stages": stages, "indexes": sorted(indexes), "flags": flags}
+
+
+async def main(users: int, posts_per_user: int, verbose: bool) -> int:
+    now = datetime.utcnow()
+    flagged = 0
+
+    async with bench_database("audit_indexes") as database:
+        await seed(database, users, posts_per_user, now)
+
+        # Audit against a user and post in the middle of the data set
+        user_id = f"user-{users // 2}"
+        post = await database.posts.find_one({"user_id": user_id}, skip=posts_per_user // 2)
+
+        queries = app_queries(user_id, str(post["_id"]), now)
+        for query in queries:
+            explain = await database.command(query.explain_command())
+            summary = audit(explain)
+            if query.sort_expected:
+                summary["flags"] = [flag for flag in summary["flags"] if flag != "in-memory sort"]
+            flagged += bool(summary["flags"])
+
+            status = "FLAG" if summary["flags"] else "ok"
+            print(f"{status:<5} {query.name:<32} {query.collection:<20} {', '.join(summary['indexes']) or '-'}")
+            for flag in summary["flags"]:
+                print(f"{'':<6}-> {flag}")
+            if verbose:
+                print(f"{'':<6}   plan: {' <- '.join(summary['stages'])}")
+
+    print(f"\n{flagged} of {len(queries)} queries flagged")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--posts", type=int, default=200, help="Posts per user")
+    parser.add_argument("--verbose", action="store_true", help="Print the winning plan stages")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.users, args.posts, args.verbose)))
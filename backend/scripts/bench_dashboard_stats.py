@@ -0,0 +1,114 @@
+"""Benchmark dashboard stats: full scan vs $group aggregation vs counters.
+
+Usage (from the backend directory, with MongoDB running):
+
+    python -m scripts.bench_dashboard_stats --results 10000 100000 500000
+"""
+import argparse
+import asyncio
+import random
+from datetime import datetime, timedelta
+
+from app.models.post import Post, PublishResult
+from app.services.stats_service import StatsService
+from scripts.bench_utils import bench_database, measure, print_row
+
+STATUSES = ["published"] * 8 + ["failed"] + ["pending"]
+PLATFORMS = ["twitter", "facebook", "instagram", "linkedin"]
+BATCH_SIZE = 10_000
+
+
+async def seed_history(user_id: str, result_count: int) -> None:
+    """Insert a synthetic publish history for a user."""
+    collection = PublishResult.get_motor_collection()
+    now = datetime.utcnow()
+
+    for offset in range(0, result_count, BATCH_SIZE):
+        batch = []
+        for i in range(offset, min(offset + BATCH_SIZE, result_count)):
+            created_at = now - timedelta(minutes=i)
+            batch.append({
+                "post_id": f"post-{i // len(PLATFORMS)}",
+                "user_id": user_id,
+                "platform_id": PLATFORMS[i % len(PLATFORMS)],
+                "status": random.choice(STATUSES),
+                "progress": 100,
+                "published_at": created_at,
+                "post_url": f"https://example.com/{i}",
+                "error": None,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+        await collection.insert_many(batch, ordered=False)
+
+
+async def legacy_dashboard_counts(user_id: str) -> dict:
+    """Previous implementation: load every result and count in Python."""
+    total_posts = await Post.find(Post.user_id == user_id).count()
+    all_results = await PublishResult.find(PublishResult.user_id == user_id).to_list()
+
+    published_count = sum(1 for r in all_results if r.status == "published")
+    total_results = len(all_results)
+
+    return {
+        "totalPosts": total_posts,
+        "publishedCount": published_count,
+        "failedCount": sum(1 for r in all_results if r.status == "failed"),
+        "pendingCount": sum(1 for r in all_results if r.status in ["pending", "in_progress"]),
+        "successRate": round((published_count / total_results) * 100) if total_results > 0 else 0,
+    }
+
+
+async def aggregated_dashboard_counts(user_id: str) -> dict:
+    """Count statuses with a $group over the (user_id, status) index."""
+    total_posts = await Post.find(Post.user_id == user_id).count()
+    status_counts = await StatsService.get_publish_status_counts(user_id)
+
+    published_count = status_counts.get("published", 0)
+    total_results = sum(status_counts.values())
+
+    return {
+        "totalPosts": total_posts,
+        "publishedCount": published_count,
+        "failedCount": status_counts.get("failed", 0),
+        "pendingCount": status_counts.get("pending", 0) + status_counts.get("in_progress", 0),
+        "successRate": round((published_count / total_results) * 100) if total_results > 0 else 0,
+    }
+
+
+async def main(result_counts: list, repeat: int) -> None:
+    async with bench_database("bench_dashboard_stats"):
+        # A background user so the index has to discriminate
+        await seed_history("other-user", 50_000)
+
+        print(f"{'case':<40} {'median':>13} {'peak memory':>14}")
+        for count in result_counts:
+            user_id = f"user-{count}"
+            await seed_history(user_id, count)
+
+            legacy = await legacy_dashboard_counts(user_id)
+            aggregated = await aggregated_dashboard_counts(user_id)
+            counters = await StatsService.get_dashboard_counts(user_id)
+            assert legacy == aggregated == counters, (legacy, aggregated, counters)
+
+            print_row(
+                f"{count} results / find().to_list()",
+                await measure(lambda: legacy_dashboard_counts(user_id), repeat),
+            )
+            print_row(
+                f"{count} results / $group aggregation",
+                await measure(lambda: aggregated_dashboard_counts(user_id), repeat),
+            )
+            print_row(
+                f"{count} results / UserStats counters",
+                await measure(lambda: StatsService.get_dashboard_counts(user_id), repeat),
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.results, args.repeat))
@@ -0,0 +1,167 @@
+"""Benchmark list read paths: Beanie documents vs projected raw rows.
+
+Each case includes the response_model step FastAPI runs on the returned
+value, so the numbers reflect end-to-end serialization cost per request.
+
+Usage (from the backend directory, with MongoDB running):
+
+    python -m scripts.bench_list_endpoints --items 1000 10000
+"""
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.models.account import ConnectedAccount, ACCOUNT_RESPONSE_PROJECTION
+from app.models.post import Post, PublishResult, POST_RESPONSE_PROJECTION, RESULT_RESPONSE_PROJECTION
+from app.schemas.account import ConnectedAccountResponse
+from app.schemas.post import PostResponse, PublishResultResponse
+from scripts.bench_utils import bench_database, measure, print_row
+
+PLATFORMS = ["twitter", "facebook", "instagram", "linkedin"]
+BATCH_SIZE = 10_000
+
+POSTS_ADAPTER = TypeAdapter(List[PostResponse])
+RESULTS_ADAPTER = TypeAdapter(List[PublishResultResponse])
+ACCOUNTS_ADAPTER = TypeAdapter(List[ConnectedAccountResponse])
+
+
+async def seed(user_id: str, post_id: str, count: int) -> None:
+    """Insert count posts, publish results and accounts for a user."""
+    now = datetime.utcnow()
+
+    for offset in range(0, count, BATCH_SIZE):
+        indexes = range(offset, min(offset + BATCH_SIZE, count))
+        await Post.get_motor_collection().insert_many([
+            {
+                "user_id": user_id,
+                "caption": f"Post {i} " + "lorem ipsum " * 20,
+                "media_files": [f"https://cdn.example.com/{i}.jpg"],
+                "media_types": ["image/jpeg"],
+                "platforms": PLATFORMS,
+                "scheduled_for": None,
+                "status": "completed",
+                "created_at": now - timedelta(minutes=i),
+                "updated_at": now - timedelta(minutes=i),
+            }
+            for i in indexes
+        ], ordered=False)
+        await PublishResult.get_motor_collection().insert_many([
+            {
+                "post_id": post_id,
+                "user_id": user_id,
+                "platform_id": f"{PLATFORMS[i % len(PLATFORMS)]}-{i}",  # Unique per post
+                "status": "published",
+                "progress": 100,
+                "published_at": now - timedelta(minutes=i),
+                "post_url": f"https://example.com/{i}",
+                "platform_post_id": str(i),
+                "error": None,
+                "created_at": now - timedelta(minutes=i),
+                "updated_at": now - timedelta(minutes=i),
+            }
+            for i in indexes
+        ], ordered=False)
+        await ConnectedAccount.get_motor_collection().insert_many([
+            {
+                "user_id": user_id,
+                "platform_id": f"{PLATFORMS[i % len(PLATFORMS)]}-{i}",  # Unique per user
+                "platform_name": PLATFORMS[i % len(PLATFORMS)].title(),
+                "username": f"user{i}",
+                "display_name": f"User {i}",
+                "avatar": None,
+                "access_token": "x" * 200,
+                "refresh_token": "y" * 200,
+                "token_expires_at": now,
+                "platform_user_id": str(i),
+                "page_id": None,
+                "is_active": True,
+                "connected_at": now,
+                "last_used_at": None,
+            }
+            for i in indexes
+        ], ordered=False)
+
+
+def respond(adapter: TypeAdapter, content: list) -> list:
+    """Validate and serialize like FastAPI's response_model handling."""
+    return adapter.dump_python(adapter.validate_python(content), mode="json")
+
+
+async def legacy_posts(user_id: str, limit: int) -> list:
+    """Previous get_posts path: Documents, to_response() and a response model."""
+    posts = await Post.find(Post.user_id == user_id).sort(-Post.created_at).limit(limit).to_list()
+    models = [PostResponse(**post.to_response()) for post in posts]
+    return respond(POSTS_ADAPTER, [m.model_dump() for m in models])
+
+
+async def projected_posts(user_id: str, limit: int) -> list:
+    """Projected raw rows converted straight to response dicts."""
+    rows = await Post.get_motor_collection().find(
+        {"user_id": user_id}, POST_RESPONSE_PROJECTION
+    ).sort([("created_at", -1), ("_id", -1)]).limit(limit).to_list(length=limit)
+    return respond(POSTS_ADAPTER, [Post.response_from_raw(row) for row in rows])
+
+
+async def legacy_results(post_id: str) -> list:
+    """Previous get_publish_results path."""
+    results = await PublishResult.find(PublishResult.post_id == post_id).to_list()
+    models = [PublishResultResponse(**r.to_response()) for r in results]
+    return respond(RESULTS_ADAPTER, [m.model_dump() for m in models])
+
+
+async def projected_results(post_id: str) -> list:
+    """Projected get_publish_results path."""
+    rows = await PublishResult.get_motor_collection().find(
+        {"post_id": post_id}, RESULT_RESPONSE_PROJECTION
+    ).to_list(length=None)
+    return respond(RESULTS_ADAPTER, [PublishResult.response_from_raw(row) for row in rows])
+
+
+async def legacy_accounts(user_id: str) -> list:
+    """Previous get_connected_accounts path."""
+    accounts = await ConnectedAccount.find(ConnectedAccount.user_id == user_id).to_list()
+    models = [ConnectedAccountResponse(**acc.to_response()) for acc in accounts]
+    return respond(ACCOUNTS_ADAPTER, [m.model_dump() for m in models])
+
+
+async def projected_accounts(user_id: str) -> list:
+    """Projected get_connected_accounts path."""
+    rows = await ConnectedAccount.get_motor_collection().find(
+        {"user_id": user_id}, ACCOUNT_RESPONSE_PROJECTION
+    ).to_list(length=None)
+    return respond(ACCOUNTS_ADAPTER, [ConnectedAccount.response_from_raw(row) for row in rows])
+
+
+async def main(item_counts: List[int], repeat: int) -> None:
+    async with bench_database("bench_list_endpoints"):
+        print(f"{'case':<40} {'median':>13} {'peak memory':>14} {'items/s':>12}")
+        for count in item_counts:
+            user_id, post_id = f"user-{count}", f"post-{count}"
+            await seed(user_id, post_id, count)
+
+            assert await legacy_posts(user_id, count) == await projected_posts(user_id, count)
+            assert await legacy_results(post_id) == await projected_results(post_id)
+            assert await legacy_accounts(user_id) == await projected_accounts(user_id)
+
+            cases = [
+                ("posts / Document", lambda: legacy_posts(user_id, count)),
+                ("posts / projected", lambda: projected_posts(user_id, count)),
+                ("publish results / Document", lambda: legacy_results(post_id)),
+                ("publish results / projected", lambda: projected_results(post_id)),
+                ("accounts / Document", lambda: legacy_accounts(user_id)),
+                ("accounts / projected", lambda: projected_accounts(user_id)),
+            ]
+            for label, fn in cases:
+                print_row(f"{count} {label}", await measure(fn, repeat), items=count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.items, args.repeat))
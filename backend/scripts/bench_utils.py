@@ -0,0 +1,57 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against a throwaway database on a local MongoDB
+(MONGODB_URL, default mongodb://localhost:27017) that is dropped on exit.
+"""
+import statistics
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, Dict, Optional
+
+from beanie import init_beanie
+
+from app.database import DOCUMENT_MODELS, create_client
+
+
+@asynccontextmanager
+async def bench_database(db_name: str):
+    """Initialize Beanie on a scratch database and drop it afterwards."""
+    client = create_client()
+    await client.drop_database(db_name)
+    database = client[db_name]
+    await init_beanie(database=database, document_models=DOCUMENT_MODELS)
+    try:
+        yield database
+    finally:
+        await client.drop_database(db_name)
+        client.close()
+
+
+async def measure(fn: Callable[[], Awaitable], repeat: int = 5) -> Dict[str, float]:
+    """Run fn repeatedly and report median latency and peak traced memory."""
+    await fn()  # Warm up connections and caches
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    await fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "median_ms": statistics.median(timings) * 1000,
+        "peak_mib": peak / (1024 * 1024),
+    }
+
+
+def print_row(label: str, result: Dict[str, float], items: Optional[int] = None) -> None:
+    """Print a single benchmark result row, with throughput if an item count is given."""
+    row = f"{label:<40} {result['median_ms']:>10.1f} ms {result['peak_mib']:>10.2f} MiB"
+    if items:
+        row += f" {items / (result['median_ms'] / 1000):>12.0f}"
+    print(row)
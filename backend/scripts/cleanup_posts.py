@@ -0,0 +1,34 @@
+"""Purge soft-deleted posts and remove publish results whose post no longer exists.
+
+Both also run as scheduled background jobs; use this for a one-off cleanup
+(from the backend directory):
+
+    python -m scripts.cleanup_posts            # purge and orphan cleanup
+    python -m scripts.cleanup_posts --orphans  # orphan cleanup only
+"""
+import argparse
+import asyncio
+
+from app.database import init_db, close_db
+from app.services.post_service import PostService
+
+
+async def main(orphans_only: bool = False) -> None:
+    await init_db()
+    try:
+        if not orphans_only:
+            purged = await PostService.purge_deleted()
+            print(f"Purged {purged} soft-deleted posts")
+
+        removed = await PostService.cleanup_orphaned_results()
+        print(f"Removed {removed} orphaned publish results")
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orphans", action="store_true", help="Only remove orphaned publish results")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.orphans))
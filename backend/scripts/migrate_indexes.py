@@ -0,0 +1,88 @@
+"""Bring an existing database in line with the declared indexes.
+
+Removes duplicate rows that would block the unique publish result (one per
+post and platform) and (user_id, platform_id) indexes, then initializes Beanie with index
+dropping enabled so indexes no longer declared on the models are removed
+and the new ones are built. Stats counters are reconciled afterwards since
+duplicate results were counted.
+
+Run once before deploying the new index set (from the backend directory):
+
+    python -m scripts.migrate_indexes --dry-run
+    python -m scripts.migrate_indexes
+"""
+import argparse
+import asyncio
+from typing import List
+
+from beanie import init_beanie
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+from app.config import get_settings
+from app.database import DOCUMENT_MODELS, create_client
+from app.services.stats_service import StatsService
+
+settings = get_settings()
+
+DELETE_BATCH_SIZE = 1000
+
+
+async def find_duplicates(
+    collection: AsyncIOMotorCollection, keys: List[str], keep_order: dict
+) -> list:
+    """Return the _ids of all but the preferred document for each duplicated key."""
+    pipeline = [
+        {"$sort": keep_order},
+        {"$group": {
+            "_id": {key: f"${key}" for key in keys},
+            "ids": {"$push": "$_id"},
+            "count": {"$sum": 1},
+        }},
+        {"$match": {"count": {"$gt": 1}}},
+    ]
+
+    duplicates = []
+    async for group in collection.aggregate(pipeline, allowDiskUse=True):
+        duplicates.extend(group["ids"][1:])
+    return duplicates
+
+
+async def main(dry_run: bool) -> None:
+    client = create_client()
+    database = client[settings.mongodb_db_name]
+    try:
+        # Keep the most recently updated result and the active, newest account
+        plans = [
+            ("publish_results", ["post_id", "platform_id"], {"updated_at": -1, "_id": -1}),
+            ("connected_accounts", ["user_id", "platform_id"], {"is_active": -1, "connected_at": -1, "_id": -1}),
+        ]
+        for name, keys, keep_order in plans:
+            duplicates = await find_duplicates(database[name], keys, keep_order)
+            print(f"{name}: {len(duplicates)} duplicate documents")
+            if not dry_run:
+                for offset in range(0, len(duplicates), DELETE_BATCH_SIZE):
+                    batch = duplicates[offset:offset + DELETE_BATCH_SIZE]
+                    await database[name].delete_many({"_id": {"$in": batch}})
+
+        if dry_run:
+            return
+
+        await init_beanie(
+            database=database,
+            document_models=DOCUMENT_MODELS,
+            allow_index_dropping=True,
+        )
+        print("Synchronized indexes with the model declarations")
+
+        count = await StatsService.reconcile_all()
+        print(f"Reconciled counters for {count} users")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="Only report duplicates")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.dry_run))
@@ -0,0 +1,39 @@
+"""Rebuild per-user stats counters from the posts and publish_results collections.
+
+Usage (from the backend directory):
+
+    python -m scripts.reconcile_stats              # all users
+    python -m scripts.reconcile_stats --user-id ID # a single user
+    python -m scripts.reconcile_stats --rollups    # also rebuild time-series rollups
+"""
+import argparse
+import asyncio
+
+from app.database import init_db, close_db
+from app.services.stats_service import StatsService
+
+
+async def main(user_id: str = None, rollups: bool = False) -> None:
+    await init_db()
+    try:
+        if user_id:
+            stats = await StatsService.reconcile_user(user_id)
+            print(stats.to_response())
+        else:
+            count = await StatsService.reconcile_all()
+            print(f"Reconciled counters for {count} users")
+
+        if rollups:
+            await StatsService.rebuild_rollups(user_id)
+            print("Rebuilt time-series rollups")
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user-id", help="Only reconcile this user")
+    parser.add_argument("--rollups", action="store_true", help="Rebuild time-series rollups")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.user_id, args.rollups))
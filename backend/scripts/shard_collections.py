@@ -0,0 +1,72 @@
+"""Shard the user-scoped collections by user_id on a sharded cluster.
+
+Every request touches a single user's data, so keying the collections on
+user_id lets mongos route each query to one shard. posts adds _id to the
+key so one prolific user's posts can still be split across chunks.
+Collections without a user_id (users, rate_limit_hits, job_leases,
+publish_events) stay unsharded on the primary shard.
+
+Run once against mongos after migrate_indexes (from the backend directory):
+
+    python -m scripts.shard_collections --dry-run
+    python -m scripts.shard_collections
+"""
+import argparse
+import asyncio
+
+from pymongo.errors import OperationFailure
+
+from app.config import get_settings
+from app.database import create_client
+
+settings = get_settings()
+
+# Collection name -> shard key; unique indexes on these must start with the key
+SHARD_KEYS = {
+    "posts": {"user_id": 1, "_id": 1},
+    "publish_results": {"user_id": 1, "post_id": 1},
+    "connected_accounts": {"user_id": 1},
+    "user_stats": {"user_id": 1},
+    "publish_rollups": {"user_id": 1},
+    "best_time_profiles": {"user_id": 1},
+    "publish_results_archive": {"u": 1},
+    "engagement_samples": {"meta.user_id": 1},
+}
+
+# Time series collections build their own index on the shard key
+TIMESERIES_COLLECTIONS = {"engagement_samples"}
+
+ALREADY_SHARDED = 20
+
+
+async def main(dry_run: bool) -> None:
+    client = create_client()
+    admin = client.admin
+    database = client[settings.mongodb_db_name]
+    try:
+        if dry_run:
+            for name, key in SHARD_KEYS.items():
+                print(f"{settings.mongodb_db_name}.{name}: shard key {key}")
+            return
+
+        try:
+            await admin.command("enableSharding", settings.mongodb_db_name)
+        except OperationFailure as error:
+            if error.code != ALREADY_SHARDED:
+                raise
+
+        for name, key in SHARD_KEYS.items():
+            if name not in TIMESERIES_COLLECTIONS:
+                await database[name].create_index(list(key.items()))
+            await admin.command("shardCollection", f"{settings.mongodb_db_name}.{name}", key=key)
+            print(f"{name}: sharded on {key}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="Only list the shard keys")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.dry_run))
@@ -16,19 +16,25 @@ import { Colors, Spacing, BorderRadius, FontSize, FontWeight } from '../../const
 import { postsApi, Post } from '../../services/api';
 import { getPlatformById } from '../../constants/platforms';
 
+const PAGE_SIZE = 20;
+
 export default function HistoryScreen() {
   const colorScheme = useColorScheme();
   const colors = colorScheme === 'dark' ? Colors.dark : Colors.light;
   const router = useRouter();
 
   const [posts, setPosts] = useState<Post[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [isLoading, setIsLoading] = useState(true);
   const [isRefreshing, setIsRefreshing] = useState(false);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
 
   const fetchPosts = useCallback(async () => {
     try {
-      const data = await postsApi.getPosts();
-      setPosts(data.sort((a, b) => new Date(b.createdAt).getTime() - new Date(a.createdAt).getTime()));
+      // Posts arrive newest first, one page at a time
+      const page = await postsApi.getPostsPage({ limit: PAGE_SIZE });
+      setPosts(page.posts);
+      setNextCursor(page.nextCursor);
     } catch (error) {
       console.error('Failed to fetch posts:', error);
     } finally {
@@ -37,6 +43,20 @@ export default function HistoryScreen() {
     }
   }, []);
 
+  const fetchMore = async () => {
+    if (!nextCursor || isLoadingMore) return;
+    setIsLoadingMore(true);
+    try {
+      const page = await postsApi.getPostsPage({ limit: PAGE_SIZE, cursor: nextCursor });
+      setPosts(prev => [...prev, ...page.posts]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Failed to fetch posts:', error);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     fetchPosts();
   }, [fetchPosts]);
@@ -168,6 +188,11 @@ export default function HistoryScreen() {
           <RefreshControl refreshing={isRefreshing} onRefresh={onRefresh} tintColor={Colors.primary} />
         }
         showsVerticalScrollIndicator={false}
+        onEndReached={fetchMore}
+        onEndReachedThreshold={0.5}
+        ListFooterComponent={
+          isLoadingMore ? <ActivityIndicator style={styles.listFooter} color={Colors.primary} /> : null
+        }
         ListEmptyComponent={
           <View style={styles.emptyState}>
             <Ionicons name="document-text-outline" size={48} color={colors.textMuted} />
@@ -201,6 +226,9 @@ const styles = StyleSheet.create({
     padding: Spacing.md,
     paddingBottom: Spacing.xxl,
   },
+  listFooter: {
+    paddingVertical: Spacing.md,
+  },
   postCard: {
     borderRadius: BorderRadius.lg,
     borderWidth: 1,
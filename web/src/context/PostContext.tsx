@@ -1,10 +1,9 @@
-import { createContext, useContext, useReducer, useCallback } from 'react';
+import { createContext, useContext, useReducer } from 'react';
 import type { ReactNode } from 'react';
 import { postsApi, publishApi } from '../services/api';
-import type { Post, PublishResult } from '../services/api';
+import type { PublishResult } from '../services/api';
 
 interface PostState {
-  posts: Post[];
   currentPost: {
     caption: string;
     mediaFiles: File[];
@@ -12,27 +11,20 @@ interface PostState {
     scheduledFor?: Date;
   };
   publishResults: Map<string, PublishResult[]>;
-  isLoading: boolean;
   isPublishing: boolean;
-  error: string | null;
 }
 
 type PostAction =
-  | { type: 'FETCH_POSTS_START' }
-  | { type: 'FETCH_POSTS_SUCCESS'; payload: Post[] }
-  | { type: 'FETCH_POSTS_ERROR'; payload: string }
   | { type: 'SET_CAPTION'; payload: string }
   | { type: 'SET_MEDIA_FILES'; payload: File[] }
   | { type: 'SET_SELECTED_PLATFORMS'; payload: string[] }
   | { type: 'SET_SCHEDULED_FOR'; payload: Date | undefined }
   | { type: 'RESET_CURRENT_POST' }
-  | { type: 'ADD_POST'; payload: Post }
   | { type: 'PUBLISH_START' }
   | { type: 'PUBLISH_UPDATE'; payload: { postId: string; results: PublishResult[] } }
   | { type: 'PUBLISH_END' };
 
 const initialState: PostState = {
-  posts: [],
   currentPost: {
     caption: '',
     mediaFiles: [],
@@ -40,19 +32,11 @@ const initialState: PostState = {
     scheduledFor: undefined,
   },
   publishResults: new Map(),
-  isLoading: false,
   isPublishing: false,
-  error: null,
 };
 
 function postReducer(state: PostState, action: PostAction): PostState {
   switch (action.type) {
-    case 'FETCH_POSTS_START':
-      return { ...state, isLoading: true, error: null };
-    case 'FETCH_POSTS_SUCCESS':
-      return { ...state, posts: action.payload, isLoading: false };
-    case 'FETCH_POSTS_ERROR':
-      return { ...state, error: action.payload, isLoading: false };
     case 'SET_CAPTION':
       return { ...state, currentPost: { ...state.currentPost, caption: action.payload } };
     case 'SET_MEDIA_FILES':
@@ -63,8 +47,6 @@ function postReducer(state: PostState, action: PostAction): PostState {
       return { ...state, currentPost: { ...state.currentPost, scheduledFor: action.payload } };
     case 'RESET_CURRENT_POST':
       return { ...state, currentPost: initialState.currentPost };
-    case 'ADD_POST':
-      return { ...state, posts: [action.payload, ...state.posts] };
     case 'PUBLISH_START':
       return { ...state, isPublishing: true };
     case 'PUBLISH_UPDATE': {
@@ -80,7 +62,6 @@ function postReducer(state: PostState, action: PostAction): PostState {
 }
 
 interface PostContextType extends PostState {
-  fetchPosts: () => Promise<void>;
   setCaption: (caption: string) => void;
   setMediaFiles: (files: File[]) => void;
   setSelectedPlatforms: (platforms: string[]) => void;
@@ -97,16 +78,6 @@ const PostContext = createContext<PostContextType | null>(null);
 export function PostProvider({ children }: { children: ReactNode }) {
   const [state, dispatch] = useReducer(postReducer, initialState);
 
-  const fetchPosts = useCallback(async () => {
-    dispatch({ type: 'FETCH_POSTS_START' });
-    try {
-      const posts = await postsApi.getPosts();
-      dispatch({ type: 'FETCH_POSTS_SUCCESS', payload: posts });
-    } catch (error) {
-      dispatch({ type: 'FETCH_POSTS_ERROR', payload: 'Failed to fetch posts' });
-    }
-  }, []);
-
   const setCaption = (caption: string) => dispatch({ type: 'SET_CAPTION', payload: caption });
   const setMediaFiles = (files: File[]) => dispatch({ type: 'SET_MEDIA_FILES', payload: files });
   const setSelectedPlatforms = (platforms: string[]) => 
@@ -128,8 +99,6 @@ export function PostProvider({ children }: { children: ReactNode }) {
         scheduledFor: state.currentPost.scheduledFor,
       });
 
-      dispatch({ type: 'ADD_POST', payload: post });
-
       // If not scheduled, publish immediately
       if (!state.currentPost.scheduledFor) {
         publishApi.publishPost(post.id, state.currentPost.selectedPlatforms);
@@ -165,7 +134,6 @@ export function PostProvider({ children }: { children: ReactNode }) {
     <PostContext.Provider
       value={{
         ...state,
-        fetchPosts,
         setCaption,
         setMediaFiles,
         setSelectedPlatforms,
@@ -22,55 +22,78 @@ import type { Post, PublishResult } from '../services/api';
 import { getPlatformById } from '../data/platforms';
 import './PostHistory.css';
 
+const PAGE_SIZE = 20;
+const SEARCH_DEBOUNCE_MS = 300;
+
 export function PostHistory() {
   const navigate = useNavigate();
   const [posts, setPosts] = useState<Post[]>([]);
-  const [filteredPosts, setFilteredPosts] = useState<Post[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [searchQuery, setSearchQuery] = useState('');
+  const [debouncedQuery, setDebouncedQuery] = useState('');
   const [statusFilter, setStatusFilter] = useState<string>('all');
   const [platformFilter, setPlatformFilter] = useState<string>('all');
   const [selectedPost, setSelectedPost] = useState<Post | null>(null);
   const [postResults, setPostResults] = useState<PublishResult[]>([]);
 
+  // Wait for typing to pause before searching
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedQuery(searchQuery.trim()), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [searchQuery]);
+
+  // Search and filters run server-side; changing any of them restarts paging
+  const fetchPage = async (cursor?: string) => {
+    const query = {
+      limit: PAGE_SIZE,
+      cursor,
+      status: statusFilter !== 'all' ? (statusFilter as Post['status']) : undefined,
+      platform: platformFilter !== 'all' ? platformFilter : undefined,
+    };
+    return debouncedQuery
+      ? postsApi.searchPosts(debouncedQuery, query)
+      : postsApi.getPostsPage(query);
+  };
+
   useEffect(() => {
+    let cancelled = false;
+
     const fetchPosts = async () => {
+      setIsLoading(true);
       try {
-        const data = await postsApi.getPosts();
-        setPosts(data);
-        setFilteredPosts(data);
+        const page = await fetchPage();
+        if (!cancelled) {
+          setPosts(page.posts);
+          setNextCursor(page.nextCursor);
+        }
       } catch (error) {
         console.error('Failed to fetch posts:', error);
       } finally {
-        setIsLoading(false);
+        if (!cancelled) setIsLoading(false);
       }
     };
 
     fetchPosts();
-  }, []);
-
-  useEffect(() => {
-    let result = [...posts];
-
-    // Search filter
-    if (searchQuery) {
-      result = result.filter((post) =>
-        post.caption.toLowerCase().includes(searchQuery.toLowerCase())
-      );
-    }
-
-    // Status filter
-    if (statusFilter !== 'all') {
-      result = result.filter((post) => post.status === statusFilter);
-    }
+    return () => {
+      cancelled = true;
+    };
+  }, [debouncedQuery, statusFilter, platformFilter]);
 
-    // Platform filter
-    if (platformFilter !== 'all') {
-      result = result.filter((post) => post.platforms.includes(platformFilter));
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    setIsLoadingMore(true);
+    try {
+      const page = await fetchPage(nextCursor);
+      setPosts((prev) => [...prev, ...page.posts]);
+      setNextCursor(page.nextCursor);
+    } catch (error) {
+      console.error('Failed to fetch posts:', error);
+    } finally {
+      setIsLoadingMore(false);
     }
-
-    setFilteredPosts(result);
-  }, [posts, searchQuery, statusFilter, platformFilter]);
+  };
 
   const handleViewPost = async (post: Post) => {
     setSelectedPost(post);
@@ -163,9 +186,9 @@ export function PostHistory() {
             <div key={i} className="skeleton" style={{ height: 120 }} />
           ))}
         </div>
-      ) : filteredPosts.length > 0 ? (
+      ) : posts.length > 0 ? (
         <div className="post-history-list">
-          {filteredPosts.map((post) => (
+          {posts.map((post) => (
             <Card key={post.id} className="post-history-item" variant="interactive">
               <CardContent>
                 <div className="post-item-main">
@@ -224,6 +247,17 @@ export function PostHistory() {
               </CardContent>
             </Card>
           ))}
+          {nextCursor && (
+            <div className="post-history-load-more">
+              <Button
+                variant="secondary"
+                onClick={handleLoadMore}
+                isLoading={isLoadingMore}
+              >
+                Load more
+              </Button>
+            </div>
+          )}
         </div>
       ) : (
         <div className="post-history-empty">
@@ -16,11 +16,11 @@ export const removeToken = (): void => {
   localStorage.removeItem(TOKEN_KEY);
 };
 
-// API request helper
-async function apiRequest<T>(
+// API fetch helper; throws on non-2xx responses
+async function apiFetch(
   endpoint: string,
   options: RequestInit = {}
-): Promise<T> {
+): Promise<Response> {
   const token = getToken();
   
   const headers: HeadersInit = {
@@ -42,6 +42,16 @@ async function apiRequest<T>(
     throw new Error(error.detail || 'Request failed');
   }
   
+  return response;
+}
+
+// API request helper
+async function apiRequest<T>(
+  endpoint: string,
+  options: RequestInit = {}
+): Promise<T> {
+  const response = await apiFetch(endpoint, options);
+  
   // Handle empty responses
   const text = await response.text();
   return (text ? JSON.parse(text) : null) as T;
@@ -77,6 +87,20 @@ export interface Post {
   status: 'draft' | 'scheduled' | 'publishing' | 'completed' | 'failed';
 }
 
+export interface PostQuery {
+  limit?: number;
+  cursor?: string;
+  status?: Post['status'];
+  platform?: string;
+  from?: Date;
+  to?: Date;
+}
+
+export interface PostPage {
+  posts: Post[];
+  nextCursor: string | null;
+}
+
 export interface PublishResult {
   postId: string;
   platformId: string;
@@ -219,13 +243,49 @@ export const accountsApi = {
 
 // Posts API
 export const postsApi = {
-  async getPosts(): Promise<Post[]> {
-    const posts = await apiRequest<Post[]>('/posts');
-    return posts.map(post => ({
-      ...post,
-      createdAt: new Date(post.createdAt),
-      scheduledFor: post.scheduledFor ? new Date(post.scheduledFor) : undefined,
-    }));
+  // Fetch one page of posts, newest first; pass nextCursor back to continue
+  async getPostsPage(query: PostQuery = {}): Promise<PostPage> {
+    const params = new URLSearchParams();
+    if (query.limit) params.set('limit', String(query.limit));
+    if (query.cursor) params.set('cursor', query.cursor);
+    if (query.status) params.set('status', query.status);
+    if (query.platform) params.set('platform', query.platform);
+    if (query.from) params.set('from', query.from.toISOString());
+    if (query.to) params.set('to', query.to.toISOString());
+    
+    const search = params.toString();
+    const response = await apiFetch(`/posts${search ? `?${search}` : ''}`);
+    const posts: Post[] = await response.json();
+    
+    return {
+      posts: posts.map(post => ({
+        ...post,
+        createdAt: new Date(post.createdAt),
+        scheduledFor: post.scheduledFor ? new Date(post.scheduledFor) : undefined,
+      })),
+      nextCursor: response.headers.get('X-Next-Cursor'),
+    };
+  },
+
+  // Search captions, best match first; pass nextCursor back to continue
+  async searchPosts(q: string, query: PostQuery = {}): Promise<PostPage> {
+    const params = new URLSearchParams({ q });
+    if (query.limit) params.set('limit', String(query.limit));
+    if (query.cursor) params.set('cursor', query.cursor);
+    if (query.status) params.set('status', query.status);
+    if (query.platform) params.set('platform', query.platform);
+    
+    const response = await apiFetch(`/posts/search?${params.toString()}`);
+    const posts: Post[] = await response.json();
+    
+    return {
+      posts: posts.map(post => ({
+        ...post,
+        createdAt: new Date(post.createdAt),
+        scheduledFor: post.scheduledFor ? new Date(post.scheduledFor) : undefined,
+      })),
+      nextCursor: response.headers.get('X-Next-Cursor'),
+    };
   },
 
   async createPost(data: Omit<Post, 'id' | 'createdAt' | 'status'>): Promise<Post> {
@@ -299,7 +359,62 @@ export const publishApi = {
   },
 
   subscribeToPublishUpdates(postId: string, callback: (results: PublishResult[]) => void): () => void {
-    // Poll for updates every 2 seconds
+    // Receive pushed updates over a WebSocket
+    const token = getToken();
+    if (!token || typeof WebSocket === 'undefined') {
+      return this.pollPublishUpdates(postId, callback);
+    }
+    
+    const wsUrl = `${API_BASE_URL.replace(/^http/, 'ws')}/publish/ws?${new URLSearchParams({ token, post_id: postId })}`;
+    const socket = new WebSocket(wsUrl);
+    const byPlatform = new Map<string, PublishResult>();
+    let stopPolling: (() => void) | null = null;
+    let closed = false;
+    
+    const emit = () => {
+      const results = Array.from(byPlatform.values());
+      callback(results);
+      
+      // Close the socket once every result is final
+      if (results.length > 0 && results.every(r => r.status === 'published' || r.status === 'failed')) {
+        close();
+      }
+    };
+    
+    const toResult = (r: PublishResult): PublishResult => ({
+      ...r,
+      publishedAt: r.publishedAt ? new Date(r.publishedAt) : undefined,
+    });
+    
+    socket.onmessage = (message) => {
+      const data = JSON.parse(message.data);
+      if (data.type === 'snapshot') {
+        data.results.forEach((r: PublishResult) => byPlatform.set(r.platformId, toResult(r)));
+        emit();
+      } else if (data.type === 'publish_result') {
+        byPlatform.set(data.result.platformId, toResult(data.result));
+        emit();
+      }
+    };
+    
+    // Fall back to polling if the push channel is unavailable
+    socket.onclose = (event) => {
+      if (!closed && event.code !== 1000) {
+        stopPolling = this.pollPublishUpdates(postId, callback);
+      }
+    };
+    
+    const close = () => {
+      closed = true;
+      socket.close(1000);
+      stopPolling?.();
+    };
+    
+    return close;
+  },
+
+  pollPublishUpdates(postId: string, callback: (results: PublishResult[]) => void): () => void {
+    // Poll for updates every 2 seconds (fallback when WebSockets are unavailable)
     const interval = setInterval(async () => {
       try {
         const results = await this.getPublishResults(postId);